@@ -1,13 +1,14 @@
 import streamlit as st
 from components.database.migration import Migration
-from injector import get_config
-from pages.utils.utils import setup_page
+from injector import get_config, preload_default_tokenizer
+from pages.utils.utils import database_session, setup_page
 
 config = get_config()
 
 
 def main():
     check_db()
+    preload_default_tokenizer()
     home_page()
 
 
@@ -66,4 +67,5 @@ def check_db():
 
 
 if __name__ == "__main__":
-    main()
+    with database_session():
+        main()
@@ -0,0 +1,69 @@
+"""Float32 embeddings
+
+Revision ID: 4e2b7c1d9a36
+Revises: cdf9b87e5fb0
+Create Date: 2024-04-02 21:14:52.318440
+
+"""
+
+import pickle
+import struct
+from typing import Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "4e2b7c1d9a36"
+down_revision: Union[str, None] = "cdf9b87e5fb0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of EmbeddingSerializer format version 1 (float32 only), so this
+# migration keeps working when the serializer evolves.
+MAGIC = b"DCEV"
+HEADER = struct.Struct("<4sBBHI")
+BATCH_SIZE = 1000
+
+
+def _to_float32_format(data: bytes) -> bytes:
+    vector = np.ascontiguousarray(pickle.loads(data), dtype="<f4").reshape(-1)
+    return HEADER.pack(MAGIC, 1, 1, 0, vector.size) + vector.tobytes()
+
+
+def _to_pickle_format(data: bytes) -> bytes:
+    _, _, _, _, dimension = HEADER.unpack_from(data)
+    vector = np.frombuffer(data, dtype="<f4", count=dimension, offset=HEADER.size)
+    return pickle.dumps(vector.astype(np.float32))
+
+
+def _convert_embeddings(convert, is_converted) -> None:
+    connection = op.get_bind()
+    select = sa.text(
+        "SELECT id, embedding FROM embeddings WHERE id > :last_id ORDER BY id LIMIT :limit"
+    )
+    update = sa.text("UPDATE embeddings SET embedding = :embedding WHERE id = :id")
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            select, {"last_id": last_id, "limit": BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            break
+        updates = [
+            {"id": row.id, "embedding": convert(row.embedding)}
+            for row in rows
+            if not is_converted(row.embedding)
+        ]
+        if updates:
+            connection.execute(update, updates)
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    _convert_embeddings(_to_float32_format, lambda data: bytes(data[:4]) == MAGIC)
+
+
+def downgrade() -> None:
+    _convert_embeddings(_to_pickle_format, lambda data: bytes(data[:4]) != MAGIC)
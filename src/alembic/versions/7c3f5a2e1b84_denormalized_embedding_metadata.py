@@ -0,0 +1,91 @@
+"""Denormalized embedding metadata
+
+Revision ID: 7c3f5a2e1b84
+Revises: 4e2b7c1d9a36
+Create Date: 2024-04-06 16:42:08.519203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3f5a2e1b84"
+down_revision: Union[str, None] = "4e2b7c1d9a36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 10000
+
+
+def _backfill_embeddings() -> None:
+    connection = op.get_bind()
+    max_id = connection.execute(sa.text("SELECT MAX(id) FROM embeddings")).scalar()
+    update = sa.text(
+        "UPDATE embeddings e "
+        "JOIN embedding_processes ep ON ep.id = e.embedding_process_id "
+        "JOIN chunk_processes cp ON cp.id = ep.chunk_process_id "
+        "JOIN extracted_texts et ON et.id = cp.extracted_text_id "
+        "SET e.domain_id = et.domain_id, "
+        "e.extracted_text_id = et.id, "
+        "e.embedder_model = JSON_UNQUOTE(JSON_EXTRACT(ep.parameters, '$.model')) "
+        "WHERE e.id > :first_id AND e.id <= :last_id"
+    )
+    for first_id in range(0, max_id or 0, BATCH_SIZE):
+        connection.execute(
+            update, {"first_id": first_id, "last_id": first_id + BATCH_SIZE}
+        )
+
+
+def upgrade() -> None:
+    op.add_column("embeddings", sa.Column("domain_id", sa.Integer(), nullable=True))
+    op.add_column(
+        "embeddings", sa.Column("extracted_text_id", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "embeddings", sa.Column("embedder_model", sa.String(length=255), nullable=True)
+    )
+
+    _backfill_embeddings()
+
+    op.alter_column(
+        "embeddings", "domain_id", existing_type=sa.Integer(), nullable=False
+    )
+    op.alter_column(
+        "embeddings", "extracted_text_id", existing_type=sa.Integer(), nullable=False
+    )
+    op.create_index(
+        "ix_embeddings_domain_model_text_process",
+        "embeddings",
+        ["domain_id", "embedder_model", "extracted_text_id", "embedding_process_id"],
+        unique=False,
+    )
+    op.create_foreign_key(
+        "fk_embeddings_domain_id",
+        "embeddings",
+        "domains",
+        ["domain_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_foreign_key(
+        "fk_embeddings_extracted_text_id",
+        "embeddings",
+        "extracted_texts",
+        ["extracted_text_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("fk_embeddings_domain_id", "embeddings", type_="foreignkey")
+    op.drop_constraint(
+        "fk_embeddings_extracted_text_id", "embeddings", type_="foreignkey"
+    )
+    op.drop_index("ix_embeddings_domain_model_text_process", table_name="embeddings")
+    op.drop_column("embeddings", "embedder_model")
+    op.drop_column("embeddings", "extracted_text_id")
+    op.drop_column("embeddings", "domain_id")
@@ -0,0 +1,86 @@
+"""Generated process columns
+
+Revision ID: 9a1d4e6b2c57
+Revises: 7c3f5a2e1b84
+Create Date: 2024-04-07 11:03:27.664915
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9a1d4e6b2c57"
+down_revision: Union[str, None] = "7c3f5a2e1b84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _json_string(path: str) -> sa.Computed:
+    return sa.Computed(
+        f"CASE WHEN JSON_TYPE(JSON_EXTRACT(parameters, '{path}')) = 'STRING' "
+        f"THEN JSON_UNQUOTE(JSON_EXTRACT(parameters, '{path}')) END",
+        persisted=True,
+    )
+
+
+def _json_integer(path: str) -> sa.Computed:
+    return sa.Computed(
+        f"CASE WHEN JSON_TYPE(JSON_EXTRACT(parameters, '{path}')) "
+        f"IN ('INTEGER', 'UNSIGNED INTEGER') "
+        f"THEN CAST(JSON_EXTRACT(parameters, '{path}') AS UNSIGNED) END",
+        persisted=True,
+    )
+
+
+def upgrade() -> None:
+    op.add_column(
+        "chunk_processes",
+        sa.Column("model", sa.String(length=255), _json_string("$.model")),
+    )
+    op.add_column(
+        "chunk_processes",
+        sa.Column("name", sa.String(length=255), _json_string("$.name")),
+    )
+    op.create_index("ix_chunk_processes_model", "chunk_processes", ["model"])
+    op.create_index("ix_chunk_processes_name", "chunk_processes", ["name"])
+
+    op.add_column(
+        "embedding_processes",
+        sa.Column("model", sa.String(length=255), _json_string("$.model")),
+    )
+    op.add_column(
+        "embedding_processes",
+        sa.Column(
+            "embedding_dimensions",
+            sa.Integer(),
+            _json_integer("$.embedding_dimensions"),
+        ),
+    )
+    op.add_column(
+        "embedding_processes",
+        sa.Column("name", sa.String(length=255), _json_string("$.name")),
+    )
+    op.create_index(
+        "ix_embedding_processes_model_dimensions",
+        "embedding_processes",
+        ["model", "embedding_dimensions"],
+    )
+    op.create_index("ix_embedding_processes_name", "embedding_processes", ["name"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_embedding_processes_name", table_name="embedding_processes")
+    op.drop_index(
+        "ix_embedding_processes_model_dimensions", table_name="embedding_processes"
+    )
+    op.drop_column("embedding_processes", "name")
+    op.drop_column("embedding_processes", "embedding_dimensions")
+    op.drop_column("embedding_processes", "model")
+
+    op.drop_index("ix_chunk_processes_name", table_name="chunk_processes")
+    op.drop_index("ix_chunk_processes_model", table_name="chunk_processes")
+    op.drop_column("chunk_processes", "name")
+    op.drop_column("chunk_processes", "model")
@@ -1,13 +1,12 @@
 from datetime import datetime, timedelta
 import json
 import os
+import threading
 from typing import Any, Dict, List
 import pytz
-import requests
 from components.chatter.interfaces.chatter_repository import ChatterRepository
 from utils.env_utils import getenv
-from components.chatter.openai_chatter import OpenAIChatter
-from components.chatter.groq_chatter import GroqChatter
+from utils.import_utils import import_class
 from logging import Logger as StandardLogger
 from components.database.models import ModelSource
 
@@ -27,12 +26,18 @@ class ChatterConfig:
     GROQ_API_MODEL_DEFAULT = getenv("GROQ_API_MODEL_DEFAULT", "llama2-70b-4096")
     GROQ_MODELS_API_URL = "https://api.groq.com/openai/v1/models"
     OPENAI_MODELS_API_URL = "https://api.openai.com/v1/models"
+    _MODEL_CACHE_TTL = timedelta(days=1)
+    _MODEL_REFRESH_RETRY_INTERVAL = timedelta(minutes=5)
+    _MODELS_API_TIMEOUT = 10
+    _refresh_lock = threading.Lock()
+    _refresh_threads: Dict[ModelSource, threading.Thread] = {}
+    _refresh_attempts: Dict[ModelSource, datetime] = {}
     chatter_classes = {
         ModelSource.OpenAI.value: {
-            "class": OpenAIChatter,
+            "class_path": "components.chatter.openai_chatter:OpenAIChatter",
         },
         ModelSource.Groq.value: {
-            "class": GroqChatter,
+            "class_path": "components.chatter.groq_chatter:GroqChatter",
         },
     }
 
@@ -94,9 +99,14 @@ class ChatterConfig:
             },
         }
 
-    def _get_fields(self, chatter_class):
+    @classmethod
+    def get_chatter_class(cls, method: str):
+        chatter_config = cls.chatter_classes.get(method)
+        return import_class(chatter_config["class_path"]) if chatter_config else None
+
+    def _get_fields(self, method):
         field_keys = {
-            OpenAIChatter: [
+            ModelSource.OpenAI.value: [
                 "open_ai_model",
                 "temperature",
                 "max_tokens",
@@ -104,7 +114,7 @@ class ChatterConfig:
                 "stream",
                 "stop",
             ],
-            GroqChatter: [
+            ModelSource.Groq.value: [
                 "groq_model",
                 "temperature",
                 "max_tokens",
@@ -112,12 +122,12 @@ class ChatterConfig:
                 "stream",
                 "stop",
             ],
-        }.get(chatter_class, [])
+        }.get(method, [])
         return {key: self.base_field_definitions[key] for key in field_keys}
 
-    def _validations(self, chatter_class):
+    def _validations(self, method):
         validations = []
-        fields = self._get_fields(chatter_class)
+        fields = self._get_fields(method)
         if "temperature" in fields:
             validations.extend(
                 [
@@ -160,7 +170,7 @@ class ChatterConfig:
         return validations
 
     @classmethod
-    def _constants(cls, chatter_class):
+    def _constants(cls, method):
         return {
             attr: getattr(cls, attr)
             for attr in dir(cls)
@@ -173,10 +183,10 @@ class ChatterConfig:
     def chatter_options(self) -> Dict[str, Dict[str, Any]]:
         return {
             name: {
-                "class": class_info["class"],
-                "fields": self._get_fields(class_info["class"]),
-                "validations": self._validations(class_info["class"]),
-                "constants": self._constants(class_info["class"]),
+                "class_path": class_info["class_path"],
+                "fields": self._get_fields(name),
+                "validations": self._validations(name),
+                "constants": self._constants(name),
             }
             for name, class_info in self.chatter_classes.items()
         }
@@ -184,11 +194,15 @@ class ChatterConfig:
     def _fetch_model_options_from_api(
         self, api_url: str, api_key: str, source: ModelSource, enrichment_filename: str
     ) -> List[str]:
+        """
+        Model options come straight from the cache; a stale or empty cache is
+        refreshed in the background and picked up on a later page run.
+        """
         cached_models = self.model_cache_repository.list_model_caches_by_source(source)
 
         if cached_models and all(
             datetime.now(pytz.utc) - model.updated_at.replace(tzinfo=pytz.utc)
-            < timedelta(days=1)
+            < self._MODEL_CACHE_TTL
             for model in cached_models
         ):
             return [model.model_id for model in cached_models]
@@ -196,36 +210,65 @@ class ChatterConfig:
         if not api_key:
             return []
 
+        self._schedule_model_cache_refresh(
+            api_url, api_key, source, enrichment_filename
+        )
+        return [model.model_id for model in cached_models]
+
+    def _schedule_model_cache_refresh(
+        self, api_url: str, api_key: str, source: ModelSource, enrichment_filename: str
+    ) -> None:
+        cls = type(self)
+        with cls._refresh_lock:
+            running = cls._refresh_threads.get(source)
+            if running is not None and running.is_alive():
+                return
+            last_attempt = cls._refresh_attempts.get(source)
+            now = datetime.now(pytz.utc)
+            if (
+                last_attempt is not None
+                and now - last_attempt < self._MODEL_REFRESH_RETRY_INTERVAL
+            ):
+                return
+            cls._refresh_attempts[source] = now
+            thread = threading.Thread(
+                target=self._refresh_model_cache,
+                args=(api_url, api_key, source, enrichment_filename),
+                name=f"model-cache-refresh-{source.value}",
+                daemon=True,
+            )
+            cls._refresh_threads[source] = thread
+            thread.start()
+
+    def _refresh_model_cache(
+        self, api_url: str, api_key: str, source: ModelSource, enrichment_filename: str
+    ) -> None:
+        import requests
+
         enrichment_data = self._load_enrichment_data(enrichment_filename)
         enrichment_map = {item["id"]: item for item in enrichment_data}
 
         try:
             response = requests.get(
-                api_url, headers={"Authorization": f"Bearer {api_key}"}
+                api_url,
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=self._MODELS_API_TIMEOUT,
             )
             response.raise_for_status()
-            data = response.json().get("data", [])
-            fetched_model_ids = {model["id"] for model in data}
-
-            for model in data:
-                model_id = model["id"]
-                if model_id in enrichment_map:
-                    model.update(enrichment_map[model_id])
-                self.model_cache_repository.save_model_cache(source, model_id, model)
-
-            dropped_models = {
-                model.model_id for model in cached_models
-            } - fetched_model_ids
-            for model_id in dropped_models:
-                self.model_cache_repository.delete_model_cache(source, model_id)
-
-            return list(fetched_model_ids)
+            models = {}
+            for model in response.json().get("data", []):
+                if model["id"] in enrichment_map:
+                    model.update(enrichment_map[model["id"]])
+                models[model["id"]] = model
+            self.model_cache_repository.replace_model_caches(source, models)
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Request to {api_url} API failed: {e}")
         except ValueError as e:
             self.logger.error(f"Error processing {api_url} API response: {e}")
-
-        return [model.model_id for model in cached_models]
+        except Exception as e:
+            self.logger.error(f"Failed to refresh {source.value} model cache: {e}")
+        finally:
+            self.model_cache_repository.remove_session()
 
     def _fetch_groq_model_options(self) -> List[str]:
         api_key = getenv("GROQ_API_KEY")
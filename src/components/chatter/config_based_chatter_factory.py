@@ -1,28 +1,46 @@
 from os import getenv
 from components.chatter.groq_chat_text_processor import GroqChatTextProcessor
+from components.chatter.groq_client_pool import GroqClientPool
 from components.chatter.interfaces.chatter import Chatter
 from components.chatter.chatter_config import ChatterConfig
 
 from components.chatter.interfaces.chatter_repository import ChatterRepository
+from components.chatter.token_count_cache import TokenCountCache
+from components.chatter.tokenizer_cache import TokenizerCache
 from components.database.models import ModelSource
 from .interfaces.chatter_factory import ChatterFactory
 from components.logger.native_logger import NativeLogger as Logger
-from transformers import AutoTokenizer
+from config import Config
 
 
 class ConfigBasedChatterFactory(ChatterFactory):
     def __init__(
-        self, logger: Logger = None, chatter_repository: ChatterRepository = None
+        self,
+        logger: Logger = None,
+        chatter_repository: ChatterRepository = None,
+        tokenizer_cache: TokenizerCache = None,
+        token_count_cache: TokenCountCache = None,
+        groq_client_pool: GroqClientPool = None,
     ):
+        config = Config()
         self.logger = logger
         self.chatter_repository = chatter_repository
+        self.context_packing = config.chat_context_packing
+        self.truncate_context = config.chat_context_truncation
+        self.tokenizer_cache = tokenizer_cache or TokenizerCache(
+            cache_dir=config.model_cache_dir,
+            token=getenv("HUGGINGFACEHUB_API_TOKEN"),
+            logger=logger,
+        )
+        self.token_count_cache = token_count_cache or TokenCountCache()
+        self.groq_client_pool = groq_client_pool or GroqClientPool(logger=logger)
 
     def create_chatter(self, method: str, **kwargs) -> Chatter:
         self._validate_method(method)
-        chatter_config = self._get_chatter_config(method)
-        chatter_class = chatter_config["class"]
+        chatter_class = self._get_chatter_class(method)
+        token_ledger = kwargs.pop("token_ledger", None)
         model = self._extract_model_from_kwargs(kwargs)
-        additional_params = self._get_additional_params(method, model)
+        additional_params = self._get_additional_params(method, model, token_ledger)
 
         return chatter_class(
             logger=self.logger,
@@ -34,38 +52,39 @@ class ConfigBasedChatterFactory(ChatterFactory):
         if not method:
             raise ValueError("Chatter method must be specified.")
 
-    def _get_chatter_config(self, method: str):
-        chatter_config = ChatterConfig.chatter_classes.get(method)
-        if not chatter_config:
+    def _get_chatter_class(self, method: str):
+        chatter_class = ChatterConfig.get_chatter_class(method)
+        if not chatter_class:
             self._log_error(f"Chatter method '{method}' is not supported.")
             raise ValueError(f"Chatter method '{method}' is not supported.")
-        return chatter_config
+        return chatter_class
 
     def _extract_model_from_kwargs(self, kwargs):
         return next((v for k, v in kwargs.items() if k.endswith("_model")), None)
 
-    def _get_additional_params(self, method, model) -> dict:
+    def _get_additional_params(self, method, model, token_ledger=None) -> dict:
         if method == ModelSource.Groq.value:
-            return self._groq_additional_parameters(model)
+            return self._groq_additional_parameters(model, token_ledger)
         return {}
 
-    def _groq_additional_parameters(self, model) -> dict:
-        additional_params = {}
+    def _groq_additional_parameters(self, model, token_ledger=None) -> dict:
+        additional_params = {"client_pool": self.groq_client_pool}
+        if token_ledger:
+            additional_params["token_ledger"] = token_ledger
         try:
-
             model_cache = self.chatter_repository.read_model_cache(
                 ModelSource.Groq, model
             )
 
             additional_params["chat_text_processor"] = GroqChatTextProcessor(
-                tokenizer=AutoTokenizer.from_pretrained(
-                    pretrained_model_name_or_path=model_cache.attributes.get(
-                        "huggingface_identifier"
-                    ),
-                    token=getenv("HUGGINGFACEHUB_API_TOKEN"),
+                tokenizer=self.tokenizer_cache.get(
+                    model_cache.attributes.get("huggingface_identifier")
                 ),
                 context_window=model_cache.attributes.get("context_window"),
                 logger=self.logger,
+                token_count_cache=self.token_count_cache,
+                context_packing=self.context_packing,
+                truncate_context=self.truncate_context,
             )
 
         except Exception as e:
@@ -1,46 +1,82 @@
-from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Hashable, List, Dict, Optional, Tuple, Union
 from logging import Logger as StandardLogger
 from components.chatter.interfaces.chat_text_processor import ChatTextProcessor
-from transformers import AutoTokenizer
+from components.chatter.token_count_cache import TokenCountCache
+
+if TYPE_CHECKING:
+    from transformers import AutoTokenizer
 
 
 class GroqChatTextProcessor(ChatTextProcessor):
+    CONTEXT_PACKING_STRATEGIES = ("relevance_per_token", "recency")
+    MAX_CACHED_TRUNCATIONS = 16
+    MIN_TRUNCATED_CONTEXT_TOKENS = 32
+
     def __init__(
         self,
-        tokenizer: AutoTokenizer,
+        tokenizer: "AutoTokenizer",
         context_window: int = 4096,
         logger: Optional[StandardLogger] = None,
+        token_count_cache: Optional[TokenCountCache] = None,
+        context_packing: str = "relevance_per_token",
+        truncate_context: bool = True,
     ):
+        if context_packing not in self.CONTEXT_PACKING_STRATEGIES:
+            raise ValueError(
+                f"Context packing strategy '{context_packing}' is not supported."
+            )
         self.tokenizer = tokenizer
         self.context_window = context_window
         self.logger = logger
+        self.token_count_cache = token_count_cache or TokenCountCache()
+        self.context_packing = context_packing
+        self.truncate_context = truncate_context
+        self._truncations: "OrderedDict[Tuple[str, int], Optional[str]]" = OrderedDict()
 
     def reduce_texts(
         self,
         messages: List[Dict[str, str]] = None,
-        context_texts: List[str] = None,
+        context_texts: List[Union[str, Tuple[str, float]]] = None,
         response_buffer: int = 512,
+        message_tokens: Optional[List[int]] = None,
     ) -> Tuple[List[Dict[str, str]], List[str], int]:
 
         messages = messages or []
-        context_texts = context_texts or []
-        latest_message_tokens = (
-            self.get_num_tokens(str(messages[-1])) if messages else 0
-        )
+        context_texts, context_scores = self._split_scores(context_texts or [])
+        if message_tokens is None:
+            token_counts = self._count_tokens(
+                context_texts + [str(message) for message in messages]
+            )
+            text_tokens_list = token_counts[: len(context_texts)]
+            message_tokens_list = token_counts[len(context_texts) :]
+        else:
+            text_tokens_list = self._count_tokens(context_texts)
+            message_tokens_list = message_tokens
+
+        latest_message_tokens = message_tokens_list[-1] if messages else 0
         effective_context_window = (
             self.context_window - response_buffer - latest_message_tokens
         )
-        total_tokens = 0
-        reduced_messages, reduced_texts = [], []
-
-        for text in reversed(context_texts):
-            text_tokens = self.get_num_tokens(text)
-            if total_tokens + text_tokens > effective_context_window:
-                break
-            reduced_texts.insert(0, text)
-            total_tokens += text_tokens
-        for message in reversed(messages[:-1]):
-            message_tokens = self.get_num_tokens(str(message))
+        reduced_messages = []
+        if context_scores is None:
+            reduced_texts, total_tokens = self._pack_most_recent(
+                context_texts, text_tokens_list, effective_context_window
+            )
+        elif self.context_packing == "recency":
+            reduced_texts, total_tokens = self._pack_in_order(
+                context_texts, text_tokens_list, effective_context_window
+            )
+        else:
+            reduced_texts, total_tokens = self._pack_by_relevance_per_token(
+                context_texts,
+                context_scores,
+                text_tokens_list,
+                effective_context_window,
+            )
+        for message, message_tokens in reversed(
+            list(zip(messages[:-1], message_tokens_list[:-1]))
+        ):
             if total_tokens + message_tokens > effective_context_window:
                 break
             reduced_messages.insert(0, message)
@@ -52,25 +88,157 @@ class GroqChatTextProcessor(ChatTextProcessor):
 
         return reduced_messages, reduced_texts, total_tokens
 
+    @staticmethod
+    def _split_scores(
+        context_texts: List[Union[str, Tuple[str, float]]],
+    ) -> Tuple[List[str], Optional[List[float]]]:
+        if not context_texts or isinstance(context_texts[0], str):
+            return list(context_texts), None
+        texts, scores = zip(*context_texts)
+        return list(texts), [float(score) for score in scores]
+
+    @staticmethod
+    def _pack_most_recent(
+        texts: List[str], text_tokens: List[int], budget: int
+    ) -> Tuple[List[str], int]:
+        packed_texts, total_tokens = [], 0
+        for text, tokens in reversed(list(zip(texts, text_tokens))):
+            if total_tokens + tokens > budget:
+                break
+            packed_texts.insert(0, text)
+            total_tokens += tokens
+        return packed_texts, total_tokens
+
+    @staticmethod
+    def _pack_in_order(
+        texts: List[str], text_tokens: List[int], budget: int
+    ) -> Tuple[List[str], int]:
+        """
+        Scored passages arrive best first, so they are packed from the front
+        until the next one no longer fits.
+        """
+        packed_texts, total_tokens = [], 0
+        for text, tokens in zip(texts, text_tokens):
+            if total_tokens + tokens > budget:
+                break
+            packed_texts.append(text)
+            total_tokens += tokens
+        return packed_texts, total_tokens
+
+    def _pack_by_relevance_per_token(
+        self,
+        texts: List[str],
+        scores: List[float],
+        text_tokens: List[int],
+        budget: int,
+    ) -> Tuple[List[str], int]:
+        """
+        Greedy knapsack: chunks are taken by score per token while they fit, and
+        the single most relevant chunk replaces that selection when it scores
+        higher on its own. The best remaining chunk is then truncated into the
+        leftover budget. Packed chunks keep their retrieval order. Scores below
+        zero, which cosine similarity can produce, count as zero relevance.
+        """
+        relevance = [max(score, 0.0) for score in scores]
+        by_density = sorted(
+            range(len(texts)),
+            key=lambda i: (relevance[i] / max(text_tokens[i], 1), scores[i]),
+            reverse=True,
+        )
+        selected, total_tokens = [], 0
+        for i in by_density:
+            if total_tokens + text_tokens[i] <= budget:
+                selected.append(i)
+                total_tokens += text_tokens[i]
+
+        if len(selected) < len(texts):
+            fitting = [i for i in range(len(texts)) if text_tokens[i] <= budget]
+            best = max(fitting, key=lambda i: scores[i], default=None)
+            if best is not None and relevance[best] > sum(
+                relevance[i] for i in selected
+            ):
+                selected, total_tokens = [best], text_tokens[best]
+
+        packed = {i: texts[i] for i in selected}
+        remaining = [i for i in range(len(texts)) if i not in packed]
+        leftover = budget - total_tokens
+        if (
+            self.truncate_context
+            and remaining
+            and leftover >= self.MIN_TRUNCATED_CONTEXT_TOKENS
+        ):
+            i = max(remaining, key=lambda i: scores[i])
+            truncated = self._truncate_to_tokens(texts[i], text_tokens[i], leftover)
+            truncated_tokens = self.get_num_tokens(truncated)
+            if truncated and truncated_tokens <= leftover:
+                packed[i] = truncated
+                total_tokens += truncated_tokens
+
+        return [packed[i] for i in sorted(packed)], total_tokens
+
+    def _truncate_to_tokens(
+        self, text: str, text_tokens: int, max_tokens: int
+    ) -> Optional[str]:
+        """
+        `text` cut to `max_tokens`. A turn reduces the same context more than
+        once, so recent truncations are remembered instead of encoding and
+        decoding the chunk again.
+        """
+        key = (text, max_tokens)
+        if key in self._truncations:
+            self._truncations.move_to_end(key)
+            return self._truncations[key]
+
+        input_ids = self.tokenizer.encode(text, add_special_tokens=False)
+        keep = max_tokens - (text_tokens - len(input_ids))
+        truncated = (
+            self.tokenizer.decode(input_ids[:keep], skip_special_tokens=True)
+            if keep > 0
+            else None
+        )
+        self._truncations[key] = truncated
+        while len(self._truncations) > self.MAX_CACHED_TRUNCATIONS:
+            self._truncations.popitem(last=False)
+        return truncated
+
     def get_num_tokens(
         self,
         text: Optional[str],
     ) -> int:
         if not text:
             return 0
-        return len(self.tokenizer.encode(text))
+        return self._count_tokens([text])[0]
 
     def get_num_tokens_left(
         self,
         messages: List[Dict[str, str]] = None,
-        context_texts: List[str] = None,
+        context_texts: List[Union[str, Tuple[str, float]]] = None,
+        message_tokens: Optional[List[int]] = None,
     ) -> int:
         _, _, total_used_tokens = self.reduce_texts(
             messages=messages,
             context_texts=context_texts,
+            message_tokens=message_tokens,
         )
         return self.context_window - total_used_tokens
 
+    @property
+    def tokenizer_key(self) -> Hashable:
+        return getattr(self.tokenizer, "name_or_path", None) or id(self.tokenizer)
+
+    def _count_tokens(self, texts: List[str]) -> List[int]:
+        return self.token_count_cache.get_many(
+            self.tokenizer_key, texts, self._encode_lengths
+        )
+
+    def _encode_lengths(self, texts: List[str]) -> List[int]:
+        if len(texts) == 1:
+            return [len(self.tokenizer.encode(texts[0])) if texts[0] else 0]
+        return [
+            len(input_ids) if text else 0
+            for text, input_ids in zip(texts, self.tokenizer(texts)["input_ids"])
+        ]
+
     @property
     def context_window(self) -> int:
         return self._context_window
@@ -1,10 +1,12 @@
+import os
 from typing import _TypedDict, Dict, Generator, List, Literal, Optional, Tuple, Union
 from components.chatter.interfaces.chat_text_processor import ChatTextProcessor
 from components.chatter.interfaces.chatter import Chatter
 from logging import Logger as StandardLogger
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from components.chatter.interfaces.chatter_repository import ChatterRepository
-from groq import Groq
+from components.chatter.groq_client_pool import GroqClientPool
+from components.chatter.token_ledger import TokenLedger
 
 from utils.logger_utils import log_to_json
 
@@ -35,6 +37,8 @@ Instructions:
         top_p: float = 1,
         stream: bool = True,
         stop: Optional[str] = None,
+        token_ledger: TokenLedger = None,
+        client_pool: GroqClientPool = None,
     ):
         self.model = groq_model
         self.temperature = temperature
@@ -44,20 +48,25 @@ Instructions:
         self.stop = stop
         self.logger = logger
         self.chat_text_processor = chat_text_processor
+        self.token_ledger = token_ledger or TokenLedger()
+        self.client_pool = client_pool or GroqClientPool(logger=logger)
         self.history_truncated: int = 0
         self.context_truncated: int = 0
         self.total_tokens_used: int = 0
+        self.prompt_tokens: int = 0
+        self.completion_tokens: int = 0
 
     def chat(
         self,
         messages: List[Dict[str, str]] = None,
-        context_texts: List[str] = None,
+        context_texts: List[Union[str, Tuple[str, float]]] = None,
         dry_run: bool = False,
     ) -> Union[str, Generator[str, None, None]]:
 
-        reduced_messages = self._reduce_messages(messages, context_texts)
+        reduced_messages, _ = self._reduce_messages(messages, context_texts)
+        self.prompt_tokens, self.completion_tokens = self.total_tokens_used, 0
 
-        self.logger.info(self.get_num_tokens(str(reduced_messages)))
+        self.logger.info(self.total_tokens_used)
         # self.logger.debug(log_to_json(reduced_messages))
 
         try:
@@ -71,7 +80,7 @@ Instructions:
 
                     return mock_generator()
             else:
-                client = Groq()
+                client = self.client_pool.get(os.getenv("GROQ_API_KEY"))
                 stream_response = client.chat.completions.create(
                     messages=reduced_messages,
                     model=self.model,
@@ -83,8 +92,9 @@ Instructions:
                 )
 
                 if not self.stream:
-                    self.total_tokens_used += self.get_num_tokens(
-                        stream_response.choices[0].message.content
+                    self._record_usage(
+                        getattr(stream_response, "usage", None),
+                        stream_response.choices[0].message.content,
                     )
                     return stream_response.choices[0].message.content
                 else:
@@ -98,20 +108,29 @@ Instructions:
     def _reduce_messages(
         self,
         messages: List[Dict[str, str]] = None,
-        context_texts: List[str] = None,
+        context_texts: List[Union[str, Tuple[str, float]]] = None,
         preserve_state: bool = True,
-    ):
+    ) -> Tuple[List[Message], int]:
+        messages = messages or []
+        context_texts = context_texts or []
         api_messages = self.convert_messages_for_api(messages)
+        message_tokens = self.get_message_token_counts(messages)
 
         reduced_messages, reduced_context_texts, total_tokens_used = (
             self.chat_text_processor.reduce_texts(
-                messages=(api_messages if api_messages else []),
+                messages=api_messages,
                 context_texts=context_texts,
+                message_tokens=message_tokens,
             )
         )
 
         if preserve_state:
-            self._check_token_size(api_messages, reduced_messages, total_tokens_used)
+            self._check_token_size(
+                api_messages,
+                reduced_messages,
+                total_tokens_used,
+                message_tokens[len(message_tokens) - len(reduced_messages) :],
+            )
             self.history_truncated = len(api_messages) - len(reduced_messages)
             self.context_truncated = len(context_texts) - len(reduced_context_texts)
             self.total_tokens_used = total_tokens_used
@@ -119,7 +138,19 @@ Instructions:
         if reduced_context_texts:
             reduced_messages.append(self._format_system_message(reduced_context_texts))
 
-        return reduced_messages
+        return reduced_messages, total_tokens_used
+
+    def get_message_token_counts(
+        self, messages: List[Union[HumanMessage, AIMessage, SystemMessage]]
+    ) -> List[int]:
+        return self.token_ledger.get_counts(
+            messages or [],
+            lambda new_messages: [
+                self.get_num_tokens(str(api_message))
+                for api_message in self.convert_messages_for_api(new_messages)
+            ],
+            getattr(self.chat_text_processor, "tokenizer_key", None),
+        )
 
     def get_num_tokens(self, text: Optional[str]) -> int:
         if not text:
@@ -130,8 +161,14 @@ Instructions:
             self.logger.error(f"Error encoding text in get_num_tokens: {e}")
             return 0
 
-    def get_num_tokens_left(self, messages: List[Dict[str, str]]) -> int:
-        return self.chat_text_processor.get_num_tokens_left(messages=messages)
+    def get_num_tokens_left(
+        self,
+        messages: List[Dict[str, str]],
+        message_tokens: Optional[List[int]] = None,
+    ) -> int:
+        return self.chat_text_processor.get_num_tokens_left(
+            messages=messages, message_tokens=message_tokens
+        )
 
     def history_truncated_by(self) -> int:
         return self.history_truncated
@@ -143,47 +180,50 @@ Instructions:
         return self.total_tokens_used
 
     def calculate_total_tokens(
-        self, messages: List[Dict[str, str]] = None, context_texts: List[str] = None
+        self,
+        messages: List[Dict[str, str]] = None,
+        context_texts: List[Union[str, Tuple[str, float]]] = None,
     ) -> int:
-        other_messages, most_recent_ai_message_content = (
-            self._separate_most_recent_ai_message(messages)
+        other_messages, most_recent_ai_message = self._separate_most_recent_ai_message(
+            messages
         )
-        reduced_other_messages = str(
-            self._reduce_messages(
-                messages=other_messages,
-                context_texts=context_texts,
-                preserve_state=False,
-            )
-        )
-        total_string = f"{reduced_other_messages}{most_recent_ai_message_content}"
-        total_tokens = self.get_num_tokens(
-            reduced_other_messages + most_recent_ai_message_content
+        _, total_tokens = self._reduce_messages(
+            messages=other_messages,
+            context_texts=context_texts,
+            preserve_state=False,
         )
+        if most_recent_ai_message is not None:
+            total_tokens += self.get_message_token_counts([most_recent_ai_message])[0]
 
-        self.logger.info(f"{total_string} : {total_tokens}")
+        self.logger.info(f"Total calculated tokens: {total_tokens}")
         return total_tokens
 
     def _separate_most_recent_ai_message(
         self, messages: List[Union[HumanMessage, AIMessage, SystemMessage]]
-    ) -> Tuple[List[Union[HumanMessage, AIMessage, SystemMessage]], str]:
+    ) -> Tuple[
+        List[Union[HumanMessage, AIMessage, SystemMessage]], Optional[AIMessage]
+    ]:
         if not messages:
-            return [], ""
+            return [], None
         messages_clone = messages[:]
-        most_recent_ai_message_content = ""
         for i in reversed(range(len(messages_clone))):
-            message = messages_clone[i]
-            if isinstance(message, AIMessage):
-                most_recent_ai_message_content = message.content
-                messages_clone.pop(i)
-                break
-        return messages_clone, most_recent_ai_message_content
+            if isinstance(messages_clone[i], AIMessage):
+                return messages_clone, messages_clone.pop(i)
+        return messages_clone, None
 
     def _check_token_size(
-        self, messages, reduced_messages, num_tokens_reduced_messages
+        self,
+        messages,
+        reduced_messages,
+        num_tokens_reduced_messages,
+        reduced_message_tokens=None,
     ):
         if (
             len(reduced_messages) == 0
-            or self.get_num_tokens_left(messages=reduced_messages) <= 0
+            or self.get_num_tokens_left(
+                messages=reduced_messages, message_tokens=reduced_message_tokens
+            )
+            <= 0
         ):
             tokens = (
                 num_tokens_reduced_messages
@@ -196,12 +236,38 @@ Instructions:
             raise ValueError(error_message)
 
     def _generate_response(self, stream_response) -> Generator[str, None, None]:
+        response_parts, usage = [], None
         for chunk in stream_response:
-            if chunk.choices[0].delta.content is not None:
-                self.total_tokens_used += self.get_num_tokens(
-                    chunk.choices[0].delta.content
-                )
+            usage = self._chunk_usage(chunk) or usage
+            if chunk.choices and chunk.choices[0].delta.content is not None:
+                response_parts.append(chunk.choices[0].delta.content)
                 yield chunk.choices[0].delta.content
+        self._record_usage(usage, "".join(response_parts))
+
+    @staticmethod
+    def _chunk_usage(chunk):
+        return getattr(chunk, "usage", None) or getattr(
+            getattr(chunk, "x_groq", None), "usage", None
+        )
+
+    def _record_usage(self, usage, response_text: Optional[str]) -> None:
+        """
+        Uses the provider's usage statistics when it reports them; otherwise the
+        completion is tokenized once and the prompt keeps its local estimate.
+        """
+        if usage is not None:
+            self.prompt_tokens = usage.prompt_tokens
+            self.completion_tokens = usage.completion_tokens
+        else:
+            self.completion_tokens = self.get_num_tokens(response_text)
+        self.total_tokens_used = self.prompt_tokens + self.completion_tokens
+
+    def get_token_usage(self) -> Dict[str, int]:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens_used,
+        }
 
     def get_params(self) -> Dict:
         return {
@@ -0,0 +1,77 @@
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from logging import Logger as StandardLogger
+
+if TYPE_CHECKING:
+    from groq import Groq
+
+
+class GroqClientPool:
+    """
+    Process-wide Groq clients, one per API key and base URL, shared by all
+    sessions. Each client keeps its HTTP connections alive between chat turns,
+    so only the first turn pays for the TCP and TLS handshake.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = 60.0,
+        connect_timeout: float = 5.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        max_retries: int = 2,
+        logger: Optional[StandardLogger] = None,
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.max_retries = max_retries
+        self.logger = logger
+        self._clients: Dict[Tuple[Optional[str], Optional[str]], "Groq"] = {}
+        self._lock = threading.Lock()
+
+    def get(self, api_key: Optional[str] = None) -> "Groq":
+        key = (api_key, self.base_url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._create_client(api_key)
+                self._clients[key] = client
+            return client
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+    def _create_client(self, api_key: Optional[str]) -> "Groq":
+        import httpx
+        from groq import Groq
+
+        if self.logger:
+            self.logger.info(
+                f"Creating Groq client for {self.base_url or 'the default endpoint'}."
+            )
+        timeout = httpx.Timeout(self.timeout, connect=self.connect_timeout)
+        return Groq(
+            api_key=api_key,
+            base_url=self.base_url,
+            timeout=timeout,
+            max_retries=self.max_retries,
+            http_client=httpx.Client(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                follow_redirects=True,
+            ),
+        )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 
 
 class ChatTextProcessor(ABC):
@@ -15,11 +15,14 @@ class ChatTextProcessor(ABC):
     def reduce_texts(
         self,
         messages: List[Dict[str, str]],
-        context_texts: List[str],
+        context_texts: List[Union[str, Tuple[str, float]]],
         response_buffer: int,
+        message_tokens: Optional[List[int]] = None,
     ) -> Tuple[List[Dict[str, str]], List[str], int]:
         """
         Reduce texts and messages to fit within a specified context window, considering a response buffer.
+        Context texts may be (text, relevance score) pairs, which lets implementations pack them by relevance.
+        Known per-message token counts can be passed as message_tokens to skip tokenizing the messages.
         Returns the reduced messages, reduced context texts, and the total number of tokens for these reduced texts.
         """
 
@@ -33,7 +36,11 @@ class ChatTextProcessor(ABC):
         """
 
     @abstractmethod
-    def get_num_tokens_left(self, messages: List[Dict[str, str]]) -> int:
+    def get_num_tokens_left(
+        self,
+        messages: List[Dict[str, str]],
+        message_tokens: Optional[List[int]] = None,
+    ) -> int:
         """
         Calculate remaining tokens in the context window.
         """
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 import json
-from typing import Any, Dict, List, Generator, Union
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from typing import TYPE_CHECKING, Any, Dict, List, Generator, Union
+
+if TYPE_CHECKING:
+    from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 
 class Chatter(ABC):
@@ -13,7 +15,7 @@ class Chatter(ABC):
     @abstractmethod
     def chat(
         self,
-        messages: List[Union[HumanMessage, AIMessage, SystemMessage]] = None,
+        messages: "List[Union[HumanMessage, AIMessage, SystemMessage]]" = None,
         context_texts: List[str] = None,
         dry_run: bool = False,
     ) -> Union[str, Generator[str, None, None]]:
@@ -53,6 +55,18 @@ class Chatter(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_message_token_counts(
+        self, messages: "List[Union[HumanMessage, AIMessage, SystemMessage]]"
+    ) -> List[int]:
+        """
+        Abstract method to get the token count of each message, tokenizing only messages not counted before.
+
+        :param messages: A list of messages including human, AI, and system messages.
+        :return: The number of tokens of each message, in the same order.
+        """
+        pass
+
     @abstractmethod
     def get_num_tokens_left(self, text: str) -> int:
         """
@@ -90,6 +104,15 @@ class Chatter(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_token_usage(self) -> Dict[str, int]:
+        """
+        Abstract method to get the prompt, completion and total token counts of the last chat turn.
+
+        :return: A dictionary with prompt_tokens, completion_tokens and total_tokens.
+        """
+        pass
+
     @abstractmethod
     def calculate_total_tokens(
         self, messages: List[Dict[str, str]] = None, context_texts: List[str] = None
@@ -103,7 +126,7 @@ class Chatter(ABC):
 
     @abstractmethod
     def convert_messages_for_api(
-        self, messages: List[Union[HumanMessage, AIMessage, SystemMessage]]
+        self, messages: "List[Union[HumanMessage, AIMessage, SystemMessage]]"
     ) -> List[Any]:
         """
         Abstract method to convert messages into a format suitable for the underlying chat API.
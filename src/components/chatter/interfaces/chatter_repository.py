@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from components.database.models import ModelCache, ModelSource
 
 
@@ -18,6 +18,19 @@ class ChatterRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def replace_model_caches(
+        self, source: ModelSource, models: Dict[str, dict]
+    ) -> None:
+        """
+        Upserts all given models of a source in one statement and deletes the cached
+        models of that source that are no longer listed, in a single transaction.
+
+        :param source: The source of the models.
+        :param models: A mapping of model_id to the attributes to store in the cache.
+        """
+        pass
+
     @abstractmethod
     def read_model_cache(
         self, source: ModelSource, model_id: str
@@ -59,3 +72,11 @@ class ChatterRepository(ABC):
         :return: A list of ModelCache instances from the specified source.
         """
         pass
+
+    @abstractmethod
+    def remove_session(self) -> None:
+        """
+        Releases the database session bound to the calling thread. Threads started
+        outside a page run must call this when they are done.
+        """
+        pass
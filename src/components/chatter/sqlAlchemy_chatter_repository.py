@@ -1,5 +1,7 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm.exc import NoResultFound
-from typing import List, Optional
+from typing import Dict, List, Optional
 from logging import Logger as StandardLogger
 from components.chatter.interfaces.chatter_repository import ChatterRepository
 from components.database.interfaces.connector import Connector
@@ -14,6 +16,7 @@ class SqlalchemyChatterRepository(ChatterRepository):
         connector: Connector,
         logger: StandardLogger = None,
     ):
+        self.connector = connector
         self.session = connector.get_session()
         self.logger = logger
 
@@ -48,6 +51,45 @@ class SqlalchemyChatterRepository(ChatterRepository):
             )
             raise
 
+    def replace_model_caches(
+        self, source: ModelSource, models: Dict[str, dict]
+    ) -> None:
+        try:
+            if models:
+                statement = mysql_insert(ModelCache).values(
+                    [
+                        {
+                            "source": source,
+                            "model_id": model_id,
+                            "attributes": attributes,
+                        }
+                        for model_id, attributes in models.items()
+                    ]
+                )
+                statement = statement.on_duplicate_key_update(
+                    attributes=statement.inserted.attributes,
+                    updated_at=func.now(),
+                )
+                self.session.execute(statement)
+            deleted = (
+                self.session.query(ModelCache)
+                .filter(
+                    ModelCache.source == source,
+                    ModelCache.model_id.notin_(list(models)),
+                )
+                .delete(synchronize_session=False)
+            )
+            self.session.commit()
+            self.logger.info(
+                f"Refreshed cache for {len(models)} {source.value} models, removed {deleted}."
+            )
+        except Exception as e:
+            self.session.rollback()
+            self.logger.error(
+                f"Failed to refresh cache for {source.value} models. Error: {e}"
+            )
+            raise
+
     def read_model_cache(
         self, source: ModelSource, model_id: str
     ) -> Optional[ModelCache]:
@@ -98,3 +140,6 @@ class SqlalchemyChatterRepository(ChatterRepository):
                 f"Failed to list model caches for source {source.value}. Error: {e}"
             )
             raise
+
+    def remove_session(self) -> None:
+        self.connector.remove_session()
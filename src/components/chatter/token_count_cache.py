@@ -0,0 +1,57 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Tuple
+
+
+class TokenCountCache:
+    """
+    Process-wide LRU cache of token counts keyed by tokenizer and a digest of
+    the text, so chat histories and context chunks are tokenized only once.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._counts: "OrderedDict[Tuple[Hashable, bytes], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(
+        self,
+        tokenizer_key: Hashable,
+        texts: List[str],
+        count: Callable[[List[str]], List[int]],
+    ) -> List[int]:
+        """
+        Token counts of `texts`; uncached texts are counted with a single call
+        to `count`, which receives each distinct text once.
+        """
+        keys = [(tokenizer_key, self._digest(text)) for text in texts]
+        counts = {}
+        with self._lock:
+            for key in keys:
+                if key in self._counts:
+                    self._counts.move_to_end(key)
+                    counts[key] = self._counts[key]
+                    self.hits += 1
+
+        uncached = {key: text for key, text in zip(keys, texts) if key not in counts}
+        if uncached:
+            fresh_counts = dict(zip(uncached, count(list(uncached.values()))))
+            counts.update(fresh_counts)
+            with self._lock:
+                self.misses += len(fresh_counts)
+                self._counts.update(fresh_counts)
+                while len(self._counts) > self.max_entries:
+                    self._counts.popitem(last=False)
+
+        return [counts[key] for key in keys]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
@@ -0,0 +1,42 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class TokenLedger:
+    """
+    Running per-message token counts for one conversation. Messages are tracked
+    by identity, so each message is tokenized once, when it is first seen, and
+    totals over the history are plain integer sums. Counts belong to the
+    tokenizer that produced them; switching tokenizers starts the ledger over.
+    """
+
+    def __init__(self):
+        self._entries: Dict[int, Tuple[Any, int]] = {}
+        self._tokenizer_key: Optional[Hashable] = None
+
+    def get_counts(
+        self,
+        messages: List[Any],
+        count: Callable[[List[Any]], List[int]],
+        tokenizer_key: Optional[Hashable] = None,
+    ) -> List[int]:
+        """
+        Token counts of `messages`; messages not yet in the ledger are counted
+        with a single call to `count`.
+        """
+        if tokenizer_key != self._tokenizer_key:
+            self._entries.clear()
+            self._tokenizer_key = tokenizer_key
+        new_messages = [
+            message for message in messages if self._lookup(message) is None
+        ]
+        if new_messages:
+            for message, tokens in zip(new_messages, count(new_messages)):
+                self._entries[id(message)] = (message, tokens)
+        return [self._lookup(message) for message in messages]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _lookup(self, message: Any):
+        entry = self._entries.get(id(message))
+        return entry[1] if entry is not None and entry[0] is message else None
@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional
+
+from logging import Logger as StandardLogger
+
+if TYPE_CHECKING:
+    from transformers import PreTrainedTokenizerBase
+
+
+class TokenizerCache:
+    """
+    Process-wide LRU registry of Hugging Face tokenizers keyed by model
+    identifier, shared by all sessions. Tokenizers are read from the local
+    model cache first and only downloaded when they are not there yet.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        token: Optional[str] = None,
+        max_size: int = 4,
+        logger: Optional[StandardLogger] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.token = token
+        self.max_size = max_size
+        self.logger = logger
+        self._tokenizers: "OrderedDict[str, PreTrainedTokenizerBase]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._identifier_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, identifier: str) -> "PreTrainedTokenizerBase":
+        tokenizer = self._get(identifier)
+        if tokenizer is not None:
+            return tokenizer
+
+        with self._identifier_lock(identifier):
+            tokenizer = self._get(identifier)
+            if tokenizer is None:
+                try:
+                    tokenizer = self._load(identifier)
+                    self._put(identifier, tokenizer)
+                finally:
+                    with self._lock:
+                        self._identifier_locks.pop(identifier, None)
+            return tokenizer
+
+    def preload(self, identifier: str) -> Optional[threading.Thread]:
+        if not identifier or self._get(identifier) is not None:
+            return None
+        thread = threading.Thread(
+            target=self._preload,
+            args=(identifier,),
+            name=f"tokenizer-preload-{identifier}",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def __contains__(self, identifier: str) -> bool:
+        with self._lock:
+            return identifier in self._tokenizers
+
+    def _preload(self, identifier: str) -> None:
+        try:
+            self.get(identifier)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Failed to preload tokenizer {identifier}: {e}")
+
+    def _load(self, identifier: str) -> "PreTrainedTokenizerBase":
+        from transformers import AutoTokenizer
+
+        try:
+            return AutoTokenizer.from_pretrained(
+                pretrained_model_name_or_path=identifier,
+                cache_dir=self.cache_dir,
+                local_files_only=True,
+            )
+        except OSError:
+            self._log_info(f"Downloading tokenizer {identifier}.")
+            return AutoTokenizer.from_pretrained(
+                pretrained_model_name_or_path=identifier,
+                cache_dir=self.cache_dir,
+                token=self.token,
+            )
+
+    def _get(self, identifier: str) -> Optional["PreTrainedTokenizerBase"]:
+        with self._lock:
+            tokenizer = self._tokenizers.get(identifier)
+            if tokenizer is not None:
+                self._tokenizers.move_to_end(identifier)
+            return tokenizer
+
+    def _put(self, identifier: str, tokenizer: "PreTrainedTokenizerBase") -> None:
+        with self._lock:
+            self._tokenizers[identifier] = tokenizer
+            while len(self._tokenizers) > self.max_size:
+                evicted, _ = self._tokenizers.popitem(last=False)
+                self._log_info(f"Evicted tokenizer {evicted}.")
+
+    def _identifier_lock(self, identifier: str) -> threading.Lock:
+        with self._lock:
+            return self._identifier_locks.setdefault(identifier, threading.Lock())
+
+    def _log_info(self, message: str) -> None:
+        if self.logger:
+            self.logger.info(f"Tokenizer cache: {message}")
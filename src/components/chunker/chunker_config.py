@@ -1,15 +1,10 @@
-from typing import Dict, Any, Tuple, Union
+from typing import Dict, Any, Optional, Tuple, Type, Union
 from components.chunker.interfaces.chunker import Chunker
 from utils.env_utils import getenv
-
-from .semantic_chunker import SemanticChunker
-from .fixed_length_overlap_chunker import FixedLengthOverLapChunker
-from .fixed_length_chunker import FixedLengthChunker
-from .recursive_split_chunker import RecursiveSplitChunker
+from utils.import_utils import import_class
 
 
 from typing import List, Dict, Any
-from .interfaces.chunker import Chunker
 
 
 class ChunkerConfig:
@@ -17,11 +12,11 @@ class ChunkerConfig:
     MAX_CHUNK_SIZE: int = 100000
     MIN_OVERLAP_SIZE: int = 0
 
-    chunker_classes: Dict[str, Chunker] = {
-        "Fixed-Length": FixedLengthChunker,
-        "Fixed-Length Overlap": FixedLengthOverLapChunker,
-        "Recursive Split": RecursiveSplitChunker,
-        "Semantic": SemanticChunker,
+    chunker_classes: Dict[str, str] = {
+        "Fixed-Length": "components.chunker.fixed_length_chunker:FixedLengthChunker",
+        "Fixed-Length Overlap": "components.chunker.fixed_length_overlap_chunker:FixedLengthOverLapChunker",
+        "Recursive Split": "components.chunker.recursive_split_chunker:RecursiveSplitChunker",
+        "Semantic": "components.chunker.semantic_chunker:SemanticChunker",
     }
 
     base_field_definitions = {
@@ -50,16 +45,19 @@ class ChunkerConfig:
     }
 
     @classmethod
-    def _get_fields(cls, chunker_class):
+    def get_chunker_class(cls, method: str) -> Optional[Type[Chunker]]:
+        path = cls.chunker_classes.get(method)
+        return import_class(path) if path else None
+
+    @classmethod
+    def _get_fields(cls, method):
         chunker_fields = {
-            FixedLengthChunker: {
-                "chunk_size": cls.base_field_definitions["chunk_size"]
-            },
-            FixedLengthOverLapChunker: {
+            "Fixed-Length": {"chunk_size": cls.base_field_definitions["chunk_size"]},
+            "Fixed-Length Overlap": {
                 "chunk_size": cls.base_field_definitions["chunk_size"],
                 "overlap_size": cls.base_field_definitions["overlap_size"],
             },
-            RecursiveSplitChunker: {
+            "Recursive Split": {
                 "chunk_size": cls.base_field_definitions["chunk_size"],
                 "overlap_size": {
                     **cls.base_field_definitions["overlap_size"],
@@ -67,20 +65,18 @@ class ChunkerConfig:
                 },
                 "separators": cls.base_field_definitions["separators"],
             },
-            SemanticChunker: {
+            "Semantic": {
                 "model": cls.base_field_definitions["model"],
                 "max_chunk_size": cls.base_field_definitions["max_chunk_size"],
             },
         }
 
-        return chunker_fields.get(chunker_class, {})
+        return chunker_fields.get(method, {})
 
     @classmethod
-    def _validations(
-        cls, chunker_class
-    ) -> List[Dict[str, Union[Tuple[str, str, int], str]]]:
+    def _validations(cls, method) -> List[Dict[str, Union[Tuple[str, str, int], str]]]:
         validations = []
-        fields = cls._get_fields(chunker_class)
+        fields = cls._get_fields(method)
         if "chunk_size" in fields:
             validations.extend(
                 [
@@ -123,7 +119,7 @@ class ChunkerConfig:
         return validations
 
     @classmethod
-    def _constants(cls, chunker_class) -> Dict[str, int]:
+    def _constants(cls, method) -> Dict[str, int]:
         return {
             attr: getattr(cls, attr)
             for attr in dir(cls)
@@ -136,10 +132,10 @@ class ChunkerConfig:
     def chunker_options(self) -> Dict[str, Dict[str, Any]]:
         return {
             name: {
-                "class": cls,
-                "fields": self._get_fields(cls),
-                "validations": self._validations(cls),
-                "constants": self._constants(cls),
+                "class_path": path,
+                "fields": self._get_fields(name),
+                "validations": self._validations(name),
+                "constants": self._constants(name),
             }
-            for name, cls in self.chunker_classes.items()
+            for name, path in self.chunker_classes.items()
         }
@@ -5,7 +5,7 @@ from .interfaces.chunker_factory import ChunkerFactory
 
 class ConfigBasedChunkerFactory(ChunkerFactory):
     def create_chunker(self, method: str, **kwargs) -> Chunker:
-        chunker_class = ChunkerConfig.chunker_classes.get(method)
+        chunker_class = ChunkerConfig.get_chunker_class(method)
         if not chunker_class:
             raise ValueError(f"Chunker method '{method}' is not supported.")
         return chunker_class(**kwargs)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 from components.database.models import (
     Chunk,
     ChunkProcess,
@@ -17,7 +17,7 @@ class ChunkerRepository(ABC):
 
     @abstractmethod
     def save_chunks(
-        self, chunk_process_id: int, chunks: List[Tuple[int, bytes]]
+        self, chunk_process_id: int, chunks: Iterable[Tuple[int, str]]
     ) -> None:
         pass
 
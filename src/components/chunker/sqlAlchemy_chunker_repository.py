@@ -1,9 +1,12 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
 
 from components.database.models import ChunkProcess, Chunk, Domain, ExtractedText
 from .interfaces.chunker_repository import ChunkerRepository
 from components.reader.interfaces.text_compressor import TextCompressor
 from components.database.interfaces.connector import Connector
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from logging import Logger as StandardLogger
 from sqlalchemy.orm.exc import NoResultFound
@@ -16,12 +19,16 @@ class SqlAlchemyChunkerRepository(ChunkerRepository):
         connector: Connector = None,
         compressor: TextCompressor = None,
         logger: StandardLogger = None,
+        batch_size: int = 1000,
+        max_workers: int = None,
     ):
         self.config = config
 
         self.session = connector.get_session()
         self.compressor = compressor
         self.logger = logger
+        self.batch_size = batch_size
+        self.max_workers = max_workers
 
     def create_chunk_process(self, extracted_text_id, method, parameters):
         try:
@@ -38,21 +45,39 @@ class SqlAlchemyChunkerRepository(ChunkerRepository):
             self.logger.error(f"Failed to create chunk process: {e}")
             raise
 
-    def save_chunks(self, chunk_process_id, chunks):
+    def save_chunks(
+        self, chunk_process_id: int, chunks: Iterable[Tuple[int, str]]
+    ) -> None:
         try:
-            for index, chunk_data in chunks:
-                chunk = Chunk(
-                    chunk_process_id=chunk_process_id,
-                    index=index,
-                    chunk=self.compressor.compress(chunk_data),
-                )
-                self.session.add(chunk)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for batch in self._batched(chunks, self.batch_size):
+                    indexes, texts = zip(*batch)
+                    compressed_chunks = executor.map(self.compressor.compress, texts)
+                    self.session.execute(
+                        insert(Chunk.__table__),
+                        [
+                            {
+                                "chunk_process_id": chunk_process_id,
+                                "index": index,
+                                "chunk": compressed_chunk,
+                            }
+                            for index, compressed_chunk in zip(
+                                indexes, compressed_chunks
+                            )
+                        ],
+                    )
             self.session.commit()
         except SQLAlchemyError as e:
             self.session.rollback()
             self.logger.error(f"Failed to save chunks: {e}")
             raise
 
+    @staticmethod
+    def _batched(iterable: Iterable, size: int) -> Iterator[List]:
+        iterator = iter(iterable)
+        while batch := list(islice(iterator, size)):
+            yield batch
+
     def list_chunk_processes_by_text(self, extracted_text_id):
         try:
             return (
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Dict
 from pymysql.connections import Connection
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 
@@ -11,4 +13,24 @@ class Connector(ABC):
 
     @abstractmethod
     def get_session(self) -> Session:
+        """
+        A session bound to the current scope (request or thread). Repositories
+        may keep the returned object; it always resolves to the current scope's
+        session.
+        """
+        pass
+
+    @abstractmethod
+    def remove_session(self) -> None:
+        """Close the current scope's session and discard its identity map."""
+        pass
+
+    @abstractmethod
+    def get_engine(self) -> Engine:
+        """The process-wide engine; its connection pool is shared by all sessions."""
+        pass
+
+    @abstractmethod
+    def get_pool_metrics(self) -> Dict[str, float]:
+        """Connection pool usage: size, checked-out and overflow connections, wait times."""
         pass
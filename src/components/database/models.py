@@ -1,5 +1,6 @@
 from sqlalchemy import (
     Column,
+    Computed,
     DateTime,
     Integer,
     String,
@@ -18,6 +19,23 @@ import re
 Base = declarative_base()
 
 
+def _json_string(path: str) -> Computed:
+    return Computed(
+        f"CASE WHEN JSON_TYPE(JSON_EXTRACT(parameters, '{path}')) = 'STRING' "
+        f"THEN JSON_UNQUOTE(JSON_EXTRACT(parameters, '{path}')) END",
+        persisted=True,
+    )
+
+
+def _json_integer(path: str) -> Computed:
+    return Computed(
+        f"CASE WHEN JSON_TYPE(JSON_EXTRACT(parameters, '{path}')) "
+        f"IN ('INTEGER', 'UNSIGNED INTEGER') "
+        f"THEN CAST(JSON_EXTRACT(parameters, '{path}') AS UNSIGNED) END",
+        persisted=True,
+    )
+
+
 class Validatable:
     MAX_NAME_LENGTH = 255
     NAME_PATTERN = r"^[a-zA-Z0-9 `~!@#$%^&*()\-_+=\[\]{\}|\\:;\"'<>,\.\?/]+$"
@@ -65,8 +83,14 @@ class ChunkProcess(Base):
     )
     parameters = Column(MutableDict.as_mutable(JSON))
     method = Column(String(50), nullable=False)
+    model = Column(String(255), _json_string("$.model"))
+    name = Column(String(255), _json_string("$.name"))
     extracted_text = relationship("ExtractedText", backref="chunk_processes")
     embedding_processes = relationship("EmbeddingProcess", backref="chunk_process")
+    __table_args__ = (
+        Index("ix_chunk_processes_model", "model"),
+        Index("ix_chunk_processes_name", "name"),
+    )
 
 
 class Chunk(Base):
@@ -92,6 +116,15 @@ class EmbeddingProcess(Base, Validatable):
     )
     method = Column(String(255), nullable=False)
     parameters = Column(MutableDict.as_mutable(JSON), nullable=False)
+    model = Column(String(255), _json_string("$.model"))
+    embedding_dimensions = Column(Integer, _json_integer("$.embedding_dimensions"))
+    name = Column(String(255), _json_string("$.name"))
+    __table_args__ = (
+        Index(
+            "ix_embedding_processes_model_dimensions", "model", "embedding_dimensions"
+        ),
+        Index("ix_embedding_processes_name", "name"),
+    )
 
 
 class Embedding(Base):
@@ -105,10 +138,32 @@ class Embedding(Base):
         ForeignKey("embedding_processes.id", ondelete="CASCADE"),
         nullable=False,
     )
+    domain_id = Column(
+        Integer,
+        ForeignKey("domains.id", ondelete="CASCADE", name="fk_embeddings_domain_id"),
+        nullable=False,
+    )
+    extracted_text_id = Column(
+        Integer,
+        ForeignKey(
+            "extracted_texts.id",
+            ondelete="CASCADE",
+            name="fk_embeddings_extracted_text_id",
+        ),
+        nullable=False,
+    )
+    embedder_model = Column(String(255))
     embedding = deferred(Column(LONGBLOB, nullable=False))
     __table_args__ = (
         Index("ix_embeddings_chunk_id", "chunk_id"),
         Index("ix_embeddings_embedding_process_id", "embedding_process_id"),
+        Index(
+            "ix_embeddings_domain_model_text_process",
+            "domain_id",
+            "embedder_model",
+            "extracted_text_id",
+            "embedding_process_id",
+        ),
         UniqueConstraint(
             "chunk_id", "embedding_process_id", name="uix_chunk_id_embedding_process_id"
         ),
@@ -1,16 +1,35 @@
 import os
+import threading
+from typing import Callable, Dict, Hashable, Optional
 from dotenv import load_dotenv
 import pymysql
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import scoped_session, sessionmaker
 from .interfaces.connector import Connector
+from .timed_queue_pool import TimedQueuePool
 from components.logger.native_logger import NativeLogger
 from config import Config
 
 
 class MySQLConnector(Connector):
-    def __init__(self):
-        load_dotenv(Config().project_root / ".env")
+    """
+    MySQL connector. All instances share one engine, and therefore one
+    connection pool, per database URI for the lifetime of the process.
+
+    Sessions are scoped: `get_session` returns a proxy that resolves to one
+    session per scope (by default the current thread; see `scopefunc`), and
+    `remove_session` closes the current scope's session, releasing its
+    connection and identity map.
+    """
+
+    _engines: Dict[str, Engine] = {}
+    _scoped_sessions: Dict[str, scoped_session] = {}
+    _engines_lock = threading.Lock()
+
+    def __init__(self, scopefunc: Optional[Callable[[], Hashable]] = None):
+        config = Config()
+        load_dotenv(config.project_root / ".env")
         self._db_host = (
             os.getenv("DB_HOST_DOCKER")
             if os.getenv("RUNNING_IN_DOCKER", "false") == "true"
@@ -20,9 +39,9 @@ class MySQLConnector(Connector):
         self._db_password = os.getenv("DB_PASSWORD")
         self._db_name = os.getenv("DB_DATABASE")
         self._db_port = os.getenv("DB_PORT", "3306")
+        self._pool_options = config.db_pool_options
+        self._scopefunc = scopefunc
         self.logger = NativeLogger.get_logger()
-        self._engine = None
-        self._session_factory = None
 
     def get_connection(self):
         try:
@@ -38,12 +57,45 @@ class MySQLConnector(Connector):
             self.logger.critical(f"Failed to connect to MySQL database: {e}")
             raise
 
-    def get_session(self):
-        if not self._engine:
-            self._engine = create_engine(self._database_uri())
-        if not self._session_factory:
-            self._session_factory = sessionmaker(bind=self._engine)
-        return self._session_factory()
+    def get_engine(self) -> Engine:
+        database_uri = self._database_uri()
+        with self._engines_lock:
+            if database_uri not in self._engines:
+                self._engines[database_uri] = create_engine(
+                    database_uri, poolclass=TimedQueuePool, **self._pool_options
+                )
+            return self._engines[database_uri]
+
+    def get_session(self) -> scoped_session:
+        engine = self.get_engine()
+        database_uri = self._database_uri()
+        with self._engines_lock:
+            if database_uri not in self._scoped_sessions:
+                self._scoped_sessions[database_uri] = scoped_session(
+                    sessionmaker(bind=engine, expire_on_commit=False),
+                    scopefunc=self._scopefunc,
+                )
+            return self._scoped_sessions[database_uri]
+
+    def remove_session(self) -> None:
+        with self._engines_lock:
+            sessions = self._scoped_sessions.get(self._database_uri())
+        if sessions is not None:
+            sessions.remove()
+
+    def get_pool_metrics(self) -> Dict[str, float]:
+        pool = self.get_engine().pool
+        if isinstance(pool, TimedQueuePool):
+            return pool.metrics()
+        return {}
+
+    @classmethod
+    def dispose_engines(cls) -> None:
+        with cls._engines_lock:
+            for engine in cls._engines.values():
+                engine.dispose()
+            cls._engines.clear()
+            cls._scoped_sessions.clear()
 
     def _database_uri(self):
         return f"mysql+pymysql://{self._db_user}:{self._db_password}@{self._db_host}:{self._db_port}/{self._db_name}"
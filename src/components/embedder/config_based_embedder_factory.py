@@ -10,7 +10,7 @@ class ConfigBasedEmbedderFactory(EmbedderFactory):
         self.model_cache_dir = model_cache_dir
 
     def create_embedder(self, method: str, **kwargs) -> Embedder:
-        embedder_class = EmbedderConfig.embedder_classes.get(method)
+        embedder_class = EmbedderConfig.get_embedder_class(method)
         if not embedder_class:
             raise ValueError(f"Embedder method '{method}' is not supported.")
         return embedder_class(
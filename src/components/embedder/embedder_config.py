@@ -1,13 +1,15 @@
-from typing import Any, Dict
-from components.embedder.sentence_transformer_embedder import (
-    SentenceTransformerEmbedder,
-)
+from typing import Any, Dict, Optional, Type
+from components.embedder.interfaces.embedder import Embedder
 from utils.env_utils import getenv
+from utils.import_utils import import_class
 
 
 class EmbedderConfig:
+    MIN_BATCH_SIZE: int = 1
+    MAX_BATCH_SIZE: int = 1024
+    CALIBRATION_SAMPLE_SIZE: int = 1024
     embedder_classes = {
-        "SentenceTransformerEmbedder": SentenceTransformerEmbedder,
+        "SentenceTransformerEmbedder": "components.embedder.sentence_transformer_embedder:SentenceTransformerEmbedder",
     }
 
     base_field_definitions = {
@@ -20,23 +22,56 @@ class EmbedderConfig:
                 "all-MiniLM-L6-v2,stsb-xlm-r-multilingual",
             ),
         },
+        "batch_size": {
+            "label": "Batch Size",
+            "type": "number",
+            "default": int(getenv("EMBEDDING_BATCH_SIZE_DEFAULT", "64")),
+        },
+        "storage_dtype": {
+            "label": "Storage Type",
+            "type": "select",
+            "default": getenv("EMBEDDING_STORAGE_DTYPE_DEFAULT", "float32"),
+            "options": ["float32", "float16", "int8"],
+        },
     }
 
     @classmethod
-    def _get_fields(cls, embedder_class):
+    def get_embedder_class(cls, method: str) -> Optional[Type[Embedder]]:
+        path = cls.embedder_classes.get(method)
+        return import_class(path) if path else None
+
+    @classmethod
+    def _get_fields(cls, method):
         embedder_fields = {
-            SentenceTransformerEmbedder: {
+            "SentenceTransformerEmbedder": {
                 "model": cls.base_field_definitions["model"],
+                "batch_size": cls.base_field_definitions["batch_size"],
+                "storage_dtype": cls.base_field_definitions["storage_dtype"],
             },
         }
-        return embedder_fields.get(embedder_class, {})
+        return embedder_fields.get(method, {})
 
     @classmethod
-    def _validations(cls, embedder_class):
-        return []
+    def _validations(cls, method):
+        validations = []
+        fields = cls._get_fields(method)
+        if "batch_size" in fields:
+            validations.extend(
+                [
+                    {
+                        "rule": ("batch_size", "ge", cls.MIN_BATCH_SIZE),
+                        "message": f"Batch size must be at least {cls.MIN_BATCH_SIZE}.",
+                    },
+                    {
+                        "rule": ("batch_size", "le", cls.MAX_BATCH_SIZE),
+                        "message": f"Batch size must not exceed {cls.MAX_BATCH_SIZE}.",
+                    },
+                ]
+            )
+        return validations
 
     @classmethod
-    def _constants(cls, embedder_class):
+    def _constants(cls, method):
         return {
             attr: getattr(cls, attr)
             for attr in dir(cls)
@@ -49,10 +84,10 @@ class EmbedderConfig:
     def embedder_options(self) -> Dict[str, Dict[str, Any]]:
         return {
             name: {
-                "class": cls,
-                "fields": self._get_fields(cls),
-                "validations": self._validations(cls),
-                "constants": self._constants(cls),
+                "class_path": path,
+                "fields": self._get_fields(name),
+                "validations": self._validations(name),
+                "constants": self._constants(name),
             }
-            for name, cls in self.embedder_classes.items()
+            for name, path in self.embedder_classes.items()
         }
@@ -0,0 +1,81 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class EmbeddingQuantizer:
+    """
+    Converts float32 embeddings to their storage dtype and back.
+
+    int8 storage uses per-dimension scale/offset fitted on a calibration sample;
+    these are kept on the embedding process parameters under "quantization".
+    """
+
+    STORAGE_DTYPES = {
+        "float32": np.float32,
+        "float16": np.float16,
+        "int8": np.int8,
+    }
+
+    def __init__(
+        self,
+        storage_dtype: str = "float32",
+        scale: Optional[List[float]] = None,
+        offset: Optional[List[float]] = None,
+    ):
+        if storage_dtype not in self.STORAGE_DTYPES:
+            raise ValueError(f"Storage dtype '{storage_dtype}' is not supported.")
+        self.storage_dtype = storage_dtype
+        self.scale = None if scale is None else np.asarray(scale, dtype=np.float32)
+        self.offset = None if offset is None else np.asarray(offset, dtype=np.float32)
+
+    @classmethod
+    def from_parameters(cls, parameters: Dict) -> "EmbeddingQuantizer":
+        quantization = parameters.get("quantization") or {}
+        return cls(
+            storage_dtype=parameters.get("storage_dtype") or "float32",
+            scale=quantization.get("scale"),
+            offset=quantization.get("offset"),
+        )
+
+    @property
+    def is_scaled(self) -> bool:
+        return self.storage_dtype == "int8"
+
+    @property
+    def is_fitted(self) -> bool:
+        return not self.is_scaled or self.scale is not None
+
+    def fit(self, embeddings: np.ndarray) -> None:
+        if not self.is_scaled:
+            return
+        minimum = embeddings.min(axis=0)
+        span = embeddings.max(axis=0) - minimum
+        self.scale = np.where(span > 0, span / 255.0, 1.0).astype(np.float32)
+        self.offset = (minimum + 128.0 * self.scale).astype(np.float32)
+
+    def quantize(self, embeddings: np.ndarray) -> np.ndarray:
+        if not self.is_scaled:
+            return embeddings.astype(self.STORAGE_DTYPES[self.storage_dtype])
+        if not self.is_fitted:
+            raise RuntimeError("int8 storage requires calibration before quantizing.")
+        quantized = np.rint((embeddings - self.offset) / self.scale)
+        return np.clip(quantized, -128, 127).astype(np.int8)
+
+    def dequantize(self, matrix: np.ndarray) -> np.ndarray:
+        matrix = matrix.astype(np.float32, copy=False)
+        if not self.is_scaled:
+            return matrix
+        if not self.is_fitted:
+            raise RuntimeError("int8 embeddings found without quantization parameters.")
+        return matrix * self.scale + self.offset
+
+    def get_params(self) -> Dict:
+        if not self.is_scaled or not self.is_fitted:
+            return {}
+        return {
+            "quantization": {
+                "scale": self.scale.tolist(),
+                "offset": self.offset.tolist(),
+            }
+        }
@@ -0,0 +1,85 @@
+import struct
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+class EmbeddingSerializer:
+    """
+    Versioned binary format for embedding vectors.
+
+    Layout: a 12-byte little-endian header (magic, format version, dtype code,
+    reserved, dimension) followed by the raw little-endian vector values.
+    Quantized values are returned as stored; see EmbeddingQuantizer.
+    """
+
+    MAGIC = b"DCEV"
+    VERSION = 1
+    HEADER = struct.Struct("<4sBBHI")
+    FLOAT32 = 1
+    FLOAT16 = 2
+    INT8 = 3
+    DTYPES = {
+        FLOAT32: np.dtype("<f4"),
+        FLOAT16: np.dtype("<f2"),
+        INT8: np.dtype("i1"),
+    }
+
+    @classmethod
+    def serialize(cls, embedding: np.ndarray) -> bytes:
+        embedding = np.asarray(embedding)
+        dtype_code = next(
+            (
+                code
+                for code, dtype in cls.DTYPES.items()
+                if dtype.kind == embedding.dtype.kind
+                and dtype.itemsize == embedding.dtype.itemsize
+            ),
+            cls.FLOAT32,
+        )
+        vector = np.ascontiguousarray(embedding, dtype=cls.DTYPES[dtype_code])
+        if vector.ndim != 1:
+            raise ValueError(f"Expected a 1-D embedding, got shape {vector.shape}.")
+        header = cls.HEADER.pack(cls.MAGIC, cls.VERSION, dtype_code, 0, vector.size)
+        return header + vector.tobytes()
+
+    @classmethod
+    def read_header(cls, data: bytes) -> Tuple[np.dtype, int]:
+        if len(data) < cls.HEADER.size:
+            raise ValueError("Embedding data is too short to contain a header.")
+        magic, version, dtype_code, _, dimension = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError("Embedding data is not in a supported format.")
+        if version != cls.VERSION:
+            raise ValueError(f"Unsupported embedding format version {version}.")
+        dtype = cls.DTYPES.get(dtype_code)
+        if dtype is None:
+            raise ValueError(f"Unsupported embedding dtype code {dtype_code}.")
+        if len(data) != cls.HEADER.size + dimension * dtype.itemsize:
+            raise ValueError("Embedding data length does not match its header.")
+        return dtype, dimension
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> np.ndarray:
+        dtype, dimension = cls.read_header(data)
+        return np.frombuffer(
+            data, dtype=dtype, count=dimension, offset=cls.HEADER.size
+        ).astype(np.float32)
+
+    @classmethod
+    def deserialize_many(cls, blobs: Sequence[bytes]) -> np.ndarray:
+        if not blobs:
+            return np.empty((0, 0), dtype=np.float32)
+
+        _, dimension = cls.read_header(blobs[0])
+        matrix = np.empty((len(blobs), dimension), dtype=np.float32)
+        for row, data in enumerate(blobs):
+            dtype, row_dimension = cls.read_header(data)
+            if row_dimension != dimension:
+                raise ValueError(
+                    f"Inconsistent embedding dimensions: {row_dimension} vs {dimension}."
+                )
+            matrix[row] = np.frombuffer(
+                data, dtype=dtype, count=dimension, offset=cls.HEADER.size
+            )
+        return matrix
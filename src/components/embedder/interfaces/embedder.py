@@ -7,16 +7,14 @@ import numpy as np
 class Embedder(ABC):
 
     @abstractmethod
-    def embed_chunks(
-        self, chunks: List[Tuple[int, str]]
-    ) -> List[Tuple[int, List[float]]]:
+    def embed_chunks(self, chunks: List[Tuple[int, str]]) -> List[Tuple[int, bytes]]:
         """Generate embeddings for a list of chunk texts, each identified by its ID.
 
         Args:
             chunks (List[Tuple[int, str]]): A list of tuples, where each tuple contains a chunk's  ID and its text.
 
         Returns:
-            List[Tuple[int, List[float]]]: A list of tuples, where each tuple contains a chunk's ID and its embedding as a list of floats.
+            List[Tuple[int, bytes]]: A list of tuples, where each tuple contains a chunk's ID and its embedding serialized with EmbeddingSerializer.
         """
         pass
 
@@ -29,6 +27,22 @@ class Embedder(ABC):
         """
         pass
 
+    def calibrate(self, texts: List[str]) -> None:
+        """
+        Fit the storage quantization on a sample of chunk texts before embedding.
+        Embedders that store unscaled values can ignore this.
+
+        :param texts: A representative sample of the texts that will be embedded.
+        """
+        pass
+
+    def get_storage_params(self) -> Dict:
+        """
+        Parameters needed to decode stored embeddings, kept on the embedding process.
+        Embedders that store L2-normalized vectors report "normalized": True.
+        """
+        return {}
+
     def get_configuration(self) -> Dict:
         return {"method": self.__class__.__name__, "params": self.get_params()}
 
@@ -7,7 +7,7 @@ from components.database.models import (
     EmbeddingProcess,
     ExtractedText,
 )
-from typing import List
+from typing import List, Tuple
 
 
 class EmbedderRepository(ABC):
@@ -38,6 +38,11 @@ class EmbedderRepository(ABC):
         self, embedding_process_id: int, chunk_id: int, embedding: bytes
     ) -> None: ...
 
+    @abstractmethod
+    def save_embeddings(
+        self, embedding_process_id: int, embeddings: List[Tuple[int, bytes]]
+    ) -> None: ...
+
     @abstractmethod
     def list_embedding_processes_by_chunk_process_id(
         self,
@@ -1,9 +1,10 @@
 import os
-import pickle
 from typing import Dict, List, Tuple
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from logging import Logger as StandardLogger
+from .embedding_quantizer import EmbeddingQuantizer
+from .embedding_serializer import EmbeddingSerializer
 from .interfaces.embedder import Embedder
 
 
@@ -11,10 +12,14 @@ class SentenceTransformerEmbedder(Embedder):
     def __init__(
         self,
         model: str = "all-mpnet-base-v2",
+        batch_size: int = 64,
+        storage_dtype: str = "float32",
         logger: StandardLogger = None,
         model_cache_dir: str = "./data/models",
     ):
         self.model_name = model
+        self.batch_size = batch_size
+        self.quantizer = EmbeddingQuantizer(storage_dtype)
         self.logger = logger
         self.model = self.initialize_model(model, model_cache_dir)
         self.embedding_dimension = self.model.get_sentence_embedding_dimension()
@@ -43,13 +48,33 @@ class SentenceTransformerEmbedder(Embedder):
 
     def embed_chunks(self, chunks: List[Tuple[int, str]]) -> List[Tuple[int, bytes]]:
         chunk_ids, texts = zip(*chunks)
-        embeddings = self.model.encode(texts, convert_to_tensor=True)
-        embeddings_np = embeddings.cpu().numpy().astype(np.float32)
-        serialized_embeddings = [pickle.dumps(embedding) for embedding in embeddings_np]
+        embeddings_np = self._encode(texts)
+        serialized_embeddings = [
+            EmbeddingSerializer.serialize(embedding)
+            for embedding in self.quantizer.quantize(embeddings_np)
+        ]
         return list(zip(chunk_ids, serialized_embeddings))
 
+    def calibrate(self, texts: List[str]) -> None:
+        if texts and self.quantizer.is_scaled:
+            self.quantizer.fit(self._encode(texts))
+
+    def get_storage_params(self) -> Dict:
+        return {**self.quantizer.get_params(), "normalized": True}
+
+    def _encode(self, texts) -> np.ndarray:
+        embeddings = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_tensor=True,
+            normalize_embeddings=True,
+        )
+        return embeddings.cpu().numpy().astype(np.float32)
+
     def embed_text(self, text: str) -> np.ndarray:
-        embeddings = self.model.encode([text], convert_to_tensor=True)
+        embeddings = self.model.encode(
+            [text], convert_to_tensor=True, normalize_embeddings=True
+        )
         embeddings_np = embeddings.cpu().numpy().astype(np.float32)
         return embeddings_np[0]
 
@@ -57,4 +82,5 @@ class SentenceTransformerEmbedder(Embedder):
         return {
             "model": self.model_name,
             "embedding_dimension": self.embedding_dimension,
+            "storage_dtype": self.quantizer.storage_dtype,
         }
@@ -1,6 +1,8 @@
-from typing import List
+from typing import List, Tuple
 from sqlalchemy import exists
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import undefer
 from sqlalchemy.orm.exc import NoResultFound
 
 from components.database.interfaces.connector import Connector
@@ -59,7 +61,9 @@ class SqlAlchemyEmbedderRepository(EmbedderRepository):
         try:
             chunks = (
                 self.session.query(Chunk)
+                .options(undefer(Chunk.chunk))
                 .filter(Chunk.chunk_process_id == chunk_process_id)
+                .order_by(Chunk.index)
                 .all()
             )
             return chunks
@@ -106,6 +110,7 @@ class SqlAlchemyEmbedderRepository(EmbedderRepository):
                     embedding_process_id=embedding_process_id,
                     chunk_id=chunk_id,
                     embedding=embedding,
+                    **self._embedding_metadata(embedding_process_id),
                 )
                 self.session.add(new_embedding)
 
@@ -117,6 +122,56 @@ class SqlAlchemyEmbedderRepository(EmbedderRepository):
             )
             raise
 
+    def save_embeddings(
+        self, embedding_process_id: int, embeddings: List[Tuple[int, bytes]]
+    ) -> None:
+        if not embeddings:
+            return
+        try:
+            metadata = self._embedding_metadata(embedding_process_id)
+            statement = mysql_insert(Embedding.__table__).values(
+                [
+                    {
+                        "embedding_process_id": embedding_process_id,
+                        "chunk_id": chunk_id,
+                        "embedding": embedding,
+                        **metadata,
+                    }
+                    for chunk_id, embedding in embeddings
+                ]
+            )
+            statement = statement.on_duplicate_key_update(
+                embedding=statement.inserted.embedding
+            )
+            self.session.execute(statement)
+            self.session.commit()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            self.logger.error(
+                f"Failed to save {len(embeddings)} embeddings in embedding process ID {embedding_process_id}: {e}"
+            )
+            raise
+
+    def _embedding_metadata(self, embedding_process_id: int) -> dict:
+        """
+        Domain, text and embedder model of an embedding process, stored on each
+        of its embeddings so retrieval can select candidates without joins.
+        """
+        embedder_model, extracted_text_id, domain_id = (
+            self.session.query(
+                EmbeddingProcess.model, ExtractedText.id, ExtractedText.domain_id
+            )
+            .join(ChunkProcess, ChunkProcess.id == EmbeddingProcess.chunk_process_id)
+            .join(ExtractedText, ExtractedText.id == ChunkProcess.extracted_text_id)
+            .filter(EmbeddingProcess.id == embedding_process_id)
+            .one()
+        )
+        return {
+            "domain_id": domain_id,
+            "extracted_text_id": extracted_text_id,
+            "embedder_model": embedder_model,
+        }
+
     def list_embedding_processes_by_chunk_process_id(
         self, chunk_process_id: int
     ) -> List[EmbeddingProcess]:
@@ -0,0 +1,55 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List
+
+
+class ChunkTextCache:
+    """
+    Process-wide LRU cache of decompressed chunk texts keyed by chunk id, so
+    repeated questions on a domain neither re-read nor re-inflate the same
+    chunk blobs.
+
+    Chunk ids are AUTO_INCREMENT and never reused, and texts are only looked
+    up for chunks a live query returned, so entries of deleted chunks are
+    never served; deleting chunks clears them only to free the memory.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._texts: "OrderedDict[int, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(
+        self, chunk_ids: List[int], load: Callable[[List[int]], Dict[int, str]]
+    ) -> Dict[int, str]:
+        """
+        Texts of `chunk_ids`; uncached chunks are loaded with a single call to
+        `load`, which receives each missing chunk id once.
+        """
+        texts = {}
+        with self._lock:
+            for chunk_id in dict.fromkeys(chunk_ids):
+                if chunk_id in self._texts:
+                    self._texts.move_to_end(chunk_id)
+                    texts[chunk_id] = self._texts[chunk_id]
+                    self.hits += 1
+
+        missing = [
+            chunk_id for chunk_id in dict.fromkeys(chunk_ids) if chunk_id not in texts
+        ]
+        if missing:
+            loaded = load(missing)
+            texts.update(loaded)
+            with self._lock:
+                self.misses += len(missing)
+                self._texts.update(loaded)
+                while len(self._texts) > self.max_entries:
+                    self._texts.popitem(last=False)
+
+        return texts
+
+    def clear(self) -> None:
+        with self._lock:
+            self._texts.clear()
@@ -1,6 +1,8 @@
 from components.database.interfaces.connector import Connector
+from .faiss_index_store import FAISSIndexStore
 from .interfaces.retriever import Retriever
 from .interfaces.retriever_factory import RetrieverFactory
+from .retriever_cache import RetrieverCache
 from .retriever_config import RetrieverConfig
 from logging import Logger as StandardLogger
 
@@ -10,12 +12,27 @@ class ConfigBasedRetrieverFactory(RetrieverFactory):
         self,
         connector: Connector = None,
         logger: StandardLogger = None,
+        cache: RetrieverCache = None,
+        index_store: FAISSIndexStore = None,
     ):
         self.session = connector.get_session()
         self.logger = logger
+        self.cache = cache
+        self.index_store = index_store
 
     def create_retriever(self, method: str, **kwargs) -> Retriever:
-        retriever_class = RetrieverConfig.retriever_classes.get(method)
+        retriever_class = RetrieverConfig.get_retriever_class(method)
         if not retriever_class:
             raise ValueError(f"Retriever method '{method}' is not supported.")
-        return retriever_class(session=self.session, logger=self.logger, **kwargs)
+        return retriever_class(
+            session=self.session,
+            logger=self.logger,
+            cache=self.cache,
+            **kwargs,
+            **self._get_additional_params(method),
+        )
+
+    def _get_additional_params(self, method: str) -> dict:
+        if method == "FAISS" and self.index_store:
+            return {"index_store": self.index_store}
+        return {}
@@ -0,0 +1,88 @@
+from typing import Dict, List, Optional, Tuple
+
+
+class ContextAssembler:
+    """
+    Turns retrieved chunks into context passages: chunks of the same chunk
+    process with consecutive indexes are merged into one passage, and the text
+    that overlapping chunkers repeat at the start of the next chunk is dropped.
+    """
+
+    MIN_OVERLAP_CHARS = 8
+
+    def __init__(self, separator: str = " "):
+        self.separator = separator
+
+    def assemble(
+        self, chunks: List[Tuple[int, int, str, Optional[float]]]
+    ) -> List[Tuple[str, float]]:
+        """
+        :param chunks: (chunk_process_id, index, text, score) per retrieved chunk;
+            the score may be None for chunks that were not hits themselves.
+        :return: (passage, score) pairs, best scoring first, where a passage
+            scores as its best chunk.
+        """
+        by_process: Dict[int, Dict[int, Tuple[str, Optional[float]]]] = {}
+        for chunk_process_id, index, text, score in chunks:
+            indexed = by_process.setdefault(chunk_process_id, {})
+            if index in indexed:
+                score = self._max_score(indexed[index][1], score)
+            indexed[index] = (text, score)
+
+        passages = []
+        for indexed in by_process.values():
+            passage, passage_score, previous_index = None, None, None
+            for index in sorted(indexed):
+                text, score = indexed[index]
+                if passage is not None and index == previous_index + 1:
+                    passage = self.merge(passage, text)
+                    passage_score = self._max_score(passage_score, score)
+                else:
+                    if passage is not None:
+                        passages.append((passage, passage_score))
+                    passage, passage_score = text, score
+                previous_index = index
+            if passage is not None:
+                passages.append((passage, passage_score))
+
+        passages.sort(
+            key=lambda passage: float("-inf") if passage[1] is None else passage[1],
+            reverse=True,
+        )
+        return [
+            (passage, 0.0 if score is None else score) for passage, score in passages
+        ]
+
+    def merge(self, previous: str, following: str) -> str:
+        overlap = self.overlap_length(previous, following)
+        if overlap >= min(self.MIN_OVERLAP_CHARS, len(following)) and overlap > 0:
+            return previous + following[overlap:]
+        return previous + self.separator + following
+
+    @staticmethod
+    def overlap_length(previous: str, following: str) -> int:
+        """
+        Length of the longest suffix of `previous` that is also a prefix of
+        `following`, found with the KMP prefix function in linear time.
+        """
+        size = min(len(previous), len(following))
+        if size == 0:
+            return 0
+        text = following[:size] + "\0" + previous[-size:]
+        prefix = [0] * len(text)
+        for i in range(1, len(text)):
+            length = prefix[i - 1]
+            while length and text[i] != text[length]:
+                length = prefix[length - 1]
+            if text[i] == text[length]:
+                length += 1
+            prefix[i] = length
+        return prefix[-1]
+
+    @staticmethod
+    def _max_score(first: Optional[float], second: Optional[float]):
+        if first is None:
+            return second
+        if second is None:
+            return first
+        return max(first, second)
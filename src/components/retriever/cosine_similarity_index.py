@@ -0,0 +1,74 @@
+from typing import Tuple
+
+import numpy as np
+
+from .embedding_matrix import normalize_rows
+
+
+class CosineSimilarityIndex:
+    """
+    Exact cosine search over an in-memory matrix, using NumPy only.
+
+    The rows are expected to be L2-normalized already (see
+    `load_process_embeddings(normalize=True)`). They are kept as a contiguous
+    float32 matrix, or as float16 for processes stored in a compressed dtype,
+    which halves the memory they take. float16 rows are widened to float32
+    block by block while searching, so a search never holds a full float32
+    copy.
+    """
+
+    SEARCH_BLOCK_ROWS: int = 8192
+
+    def __init__(
+        self,
+        embedding_ids: np.ndarray,
+        embeddings_matrix: np.ndarray,
+        dtype: np.dtype = np.float32,
+    ):
+        self.embedding_ids = np.ascontiguousarray(embedding_ids, dtype=np.int64)
+        self.matrix = np.ascontiguousarray(embeddings_matrix, dtype=dtype)
+
+    @property
+    def dimension(self) -> int:
+        return self.matrix.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return self.embedding_ids.nbytes + self.matrix.nbytes
+
+    def search(
+        self, query_vectors: np.ndarray, top_n: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top `top_n` embeddings for each row of `query_vectors`.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Embedding ids and cosine similarities,
+            both of shape (number of queries, k), best match first.
+        """
+        queries = normalize_rows(np.atleast_2d(query_vectors).astype(np.float32))
+        similarities = self._similarities(queries)
+        k = min(top_n, similarities.shape[1])
+        if k == 0:
+            empty = np.empty((len(queries), 0))
+            return empty.astype(np.int64), empty.astype(np.float32)
+
+        top_indices = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        top_similarities = np.take_along_axis(similarities, top_indices, axis=1)
+        order = np.argsort(-top_similarities, axis=1)
+        top_indices = np.take_along_axis(top_indices, order, axis=1)
+        return (
+            self.embedding_ids[top_indices],
+            np.take_along_axis(top_similarities, order, axis=1),
+        )
+
+    def _similarities(self, queries: np.ndarray) -> np.ndarray:
+        if self.matrix.dtype == np.float32:
+            return queries @ self.matrix.T
+        similarities = np.empty((len(queries), len(self.matrix)), dtype=np.float32)
+        for start in range(0, len(self.matrix), self.SEARCH_BLOCK_ROWS):
+            block = self.matrix[start : start + self.SEARCH_BLOCK_ROWS]
+            similarities[:, start : start + len(block)] = (
+                queries @ block.astype(np.float32).T
+            )
+        return similarities
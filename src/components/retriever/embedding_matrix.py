@@ -0,0 +1,115 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from components.database.models import Embedding, EmbeddingProcess
+from components.embedder.embedding_quantizer import EmbeddingQuantizer
+from components.embedder.embedding_serializer import EmbeddingSerializer
+
+
+def list_embedding_processes(
+    session: Session,
+    domain_id: int,
+    text_ids: Optional[List[int]] = None,
+    embedder_method: Optional[str] = None,
+    embedder_model: Optional[str] = None,
+) -> List[Tuple[int, int, int]]:
+    """
+    Embedding processes matching the filters, each with its embedding count and
+    highest embedding id; the latter two fingerprint the process's embeddings.
+
+    Domain, text and embedder model are denormalized onto `embeddings`, so
+    this is a range scan on ix_embeddings_domain_model_text_process.
+    """
+    query = session.query(
+        Embedding.embedding_process_id, func.count(Embedding.id), func.max(Embedding.id)
+    ).filter(Embedding.domain_id == domain_id)
+    if text_ids is not None:
+        query = query.filter(Embedding.extracted_text_id.in_(text_ids))
+    if embedder_model is not None:
+        query = query.filter(Embedding.embedder_model == embedder_model)
+    if embedder_method is not None:
+        query = query.join(
+            EmbeddingProcess, EmbeddingProcess.id == Embedding.embedding_process_id
+        ).filter(EmbeddingProcess.method == embedder_method)
+    return [tuple(row) for row in query.group_by(Embedding.embedding_process_id).all()]
+
+
+def get_storage_dtypes(
+    session: Session, embedding_process_ids: List[int]
+) -> Dict[int, str]:
+    """
+    Storage dtype of each embedding process; processes stored before storage
+    dtypes existed are float32.
+    """
+    if not embedding_process_ids:
+        return {}
+    rows = (
+        session.query(EmbeddingProcess.id, EmbeddingProcess.parameters)
+        .filter(EmbeddingProcess.id.in_(embedding_process_ids))
+        .all()
+    )
+    return {
+        embedding_process_id: (parameters or {}).get("storage_dtype") or "float32"
+        for embedding_process_id, parameters in rows
+    }
+
+
+def load_process_embeddings(
+    session: Session, embedding_process_id: int, normalize: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    embeddings = (
+        session.query(Embedding.id, Embedding.embedding_process_id, Embedding.embedding)
+        .filter(Embedding.embedding_process_id == embedding_process_id)
+        .order_by(Embedding.id)
+        .all()
+    )
+    embedding_ids = np.fromiter(
+        (embedding.id for embedding in embeddings),
+        dtype=np.int64,
+        count=len(embeddings),
+    )
+    return embedding_ids, load_embedding_matrix(session, embeddings, normalize)
+
+
+def load_embedding_matrix(
+    session: Session, embeddings: List[Embedding], normalize: bool = False
+) -> np.ndarray:
+    """
+    Float32 matrix of the given embeddings, dequantized per embedding process.
+    With `normalize`, rows are L2-normalized unless their process already
+    stored them normalized.
+    """
+    matrix = EmbeddingSerializer.deserialize_many(
+        [embedding.embedding for embedding in embeddings]
+    )
+    if not embeddings:
+        return matrix
+
+    process_ids = np.fromiter(
+        (embedding.embedding_process_id for embedding in embeddings),
+        dtype=np.int64,
+        count=len(embeddings),
+    )
+    embedding_processes = (
+        session.query(EmbeddingProcess)
+        .filter(EmbeddingProcess.id.in_(np.unique(process_ids).tolist()))
+        .all()
+    )
+    for embedding_process in embedding_processes:
+        quantizer = EmbeddingQuantizer.from_parameters(embedding_process.parameters)
+        stored_normalized = embedding_process.parameters.get("normalized", False)
+        if quantizer.is_scaled or (normalize and not stored_normalized):
+            rows = process_ids == embedding_process.id
+            if quantizer.is_scaled:
+                matrix[rows] = quantizer.dequantize(matrix[rows])
+            if normalize:
+                matrix[rows] = normalize_rows(matrix[rows])
+    return matrix
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+from logging import Logger as StandardLogger
+
+if TYPE_CHECKING:
+    import faiss
+
+
+class FAISSIndexStore:
+    """
+    On-disk FAISS indexes, one per embedding process.
+
+    The file name carries the index variant (its FAISS factory description)
+    and a fingerprint of the process's embeddings (row count and highest
+    embedding id), so an index is rebuilt as soon as embeddings are added to or
+    removed from its process, while other variants of the same process are kept.
+    """
+
+    def __init__(self, index_dir: str, logger: Optional[StandardLogger] = None):
+        self.index_dir = Path(index_dir)
+        self.logger = logger
+
+    def load_or_build(
+        self,
+        embedding_process_id: int,
+        fingerprint: Tuple[int, int],
+        build: Callable[[], "faiss.Index"],
+        variant: str = "Flat",
+    ) -> "faiss.Index":
+        path = self._index_path(embedding_process_id, fingerprint, variant)
+        if path.exists():
+            try:
+                return self._read_index(path)
+            except RuntimeError as e:
+                self._log_warning(f"Rebuilding unreadable FAISS index {path}: {e}")
+
+        index = build()
+        self._remove(
+            f"embedding_process_{embedding_process_id}_{self._variant_name(variant)}_*.index"
+        )
+        self._write_index(index, path)
+        return index
+
+    def invalidate(self, embedding_process_id: int) -> None:
+        self._remove(f"embedding_process_{embedding_process_id}_*.index")
+
+    def _remove(self, pattern: str) -> None:
+        for path in self.index_dir.glob(pattern):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _index_path(
+        self, embedding_process_id: int, fingerprint: Tuple[int, int], variant: str
+    ) -> Path:
+        count, max_embedding_id = fingerprint
+        return (
+            self.index_dir
+            / f"embedding_process_{embedding_process_id}_{self._variant_name(variant)}_{count}_{max_embedding_id}.index"
+        )
+
+    @staticmethod
+    def _variant_name(variant: str) -> str:
+        return variant.replace(",", "-").replace("_", "-")
+
+    def _read_index(self, path: Path) -> "faiss.Index":
+        import faiss
+
+        try:
+            return faiss.read_index(
+                str(path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+        except RuntimeError:
+            return faiss.read_index(str(path))
+
+    def _write_index(self, index: "faiss.Index", path: Path) -> None:
+        import faiss
+
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+            faiss.write_index(index, str(temporary_path))
+            os.replace(temporary_path, path)
+        except (OSError, RuntimeError) as e:
+            self._log_warning(f"Failed to persist FAISS index {path}: {e}")
+
+    def _log_warning(self, message: str) -> None:
+        if self.logger:
+            self.logger.warning(message)
@@ -1,39 +1,63 @@
 import faiss
 import numpy as np
-from typing import List, Tuple, Dict
-from sqlalchemy import func
+from typing import List, Optional, Tuple, Dict
 from sqlalchemy.orm import Session
-from components.database.models import (
-    Chunk,
-    ChunkProcess,
-    Embedding,
-    EmbeddingProcess,
-    ExtractedText,
+from config import Config
+from .embedding_matrix import (
+    get_storage_dtypes,
+    list_embedding_processes,
+    load_process_embeddings,
+    normalize_rows,
 )
+from .faiss_index_store import FAISSIndexStore
 from .interfaces.retriever import Retriever
-import pickle
+from .retriever_cache import RetrieverCache
 from logging import Logger as StandardLogger
 
 
 class FAISSRetriever(Retriever):
+    MIN_ANN_VECTORS: int = 10000
+    MIN_TRAINING_POINTS_PER_CENTROID: int = 39
+    SCALAR_QUANTIZERS: Dict[str, str] = {"float16": "SQfp16", "int8": "SQ8"}
+
     def __init__(
         self,
         session: Session,
         logger: StandardLogger = None,
+        cache: RetrieverCache = None,
         domain_id: int = None,
         text_ids: List[int] = None,
         embedder_config: Dict = None,
         top_n: int = 5,
         embedding_dim: int = 768,
         lambda_param: float = 0.01,
+        metric: str = "cosine",
+        index_type: str = "flat",
+        nlist: int = 1024,
+        nprobe: int = 16,
+        pq_m: int = 32,
+        hnsw_m: int = 32,
+        ef_search: int = 64,
+        index_store: FAISSIndexStore = None,
     ) -> None:
         self.session = session
         self.logger = logger
+        self.cache = cache
         self.domain_id = domain_id
         self.text_ids = text_ids
         self.top_n = top_n
         self.embedding_dim = embedding_dim
         self.lambda_param = lambda_param
+        self.metric = metric
+        self.index_type = index_type
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.pq_m = pq_m
+        self.hnsw_m = hnsw_m
+        self.ef_search = ef_search
+        self.index_store = index_store or FAISSIndexStore(
+            Config().faiss_index_dir, logger
+        )
 
         if embedder_config:
             self.embedder_method = embedder_config.get("method")
@@ -42,65 +66,174 @@ class FAISSRetriever(Retriever):
             self.embedder_method = None
             self.embedder_model = None
 
-        self.index = faiss.IndexFlatL2(self.embedding_dim)
-
     def retrieve(
         self,
         query_vector: List[float],
     ) -> List[Tuple[int, float]]:
-        embeddings = self._fetch_embeddings()
-        if not embeddings:
+        embedding_processes = list_embedding_processes(
+            self.session,
+            self.domain_id,
+            self.text_ids,
+            self.embedder_method,
+            self.embedder_model,
+        )
+        if not embedding_processes:
             return []
 
-        if self.index.ntotal == 0:
-            embeddings_matrix = self._deserialize_embeddings(embeddings)
+        query_vector_array = normalize_rows(
+            np.asarray(query_vector, dtype=np.float32).reshape(1, -1)
+        )
+        storage_dtypes = get_storage_dtypes(
+            self.session, [process[0] for process in embedding_processes]
+        )
+        candidates = []
+        for embedding_process_id, count, max_embedding_id in embedding_processes:
+            index = self._load_index(
+                embedding_process_id,
+                (count, max_embedding_id),
+                self._index_description(
+                    count, storage_dtypes.get(embedding_process_id, "float32")
+                ),
+            )
 
             assert (
-                embeddings_matrix.shape[1] == self.embedding_dim
-            ), f"The dimension of the fetched embeddings ({embeddings_matrix.shape[1]}) does not match the FAISS index dimension ({self.embedding_dim})."
+                index.d == self.embedding_dim
+            ), f"The dimension of the fetched embeddings ({index.d}) does not match the FAISS index dimension ({self.embedding_dim})."
 
-            self.index.add(embeddings_matrix)
-
-        query_vector_array = np.array(query_vector).reshape(1, -1)
-        distances, indices = self.index.search(
-            query_vector_array, min(self.top_n, len(embeddings))
-        )
-
-        similarity_scores = np.exp(-self.lambda_param * distances[0])
+            distances, ids = index.search(
+                query_vector_array,
+                min(self.top_n, index.ntotal),
+                params=self._search_params(index),
+            )
+            candidates.extend(
+                (embedding_id, distance)
+                for embedding_id, distance in zip(ids[0], distances[0])
+                if embedding_id >= 0
+            )
 
+        candidates.sort(key=lambda candidate: candidate[1], reverse=self.is_cosine)
         return [
-            (embeddings[idx].id, similarity_scores[i])
-            for i, idx in enumerate(indices[0])
+            (int(embedding_id), self._score(distance))
+            for embedding_id, distance in candidates[: self.top_n]
         ]
 
+    @property
+    def is_cosine(self) -> bool:
+        return self.metric == "cosine"
+
     def get_params(self) -> Dict:
-        return {
+        params = {
             "top_n": self.top_n,
             "embedding_dim": self.embedding_dim,
-            "lambda_param": self.lambda_param,
+            "metric": self.metric,
+            "index_type": self.index_type,
         }
+        if not self.is_cosine:
+            params["lambda_param"] = self.lambda_param
+        if self.index_type in ("ivf_flat", "ivf_pq"):
+            params.update({"nlist": self.nlist, "nprobe": self.nprobe})
+        if self.index_type == "ivf_pq":
+            params["pq_m"] = self.pq_m
+        if self.index_type == "hnsw":
+            params.update({"hnsw_m": self.hnsw_m, "ef_search": self.ef_search})
+        return params
 
-    def _fetch_embeddings(self) -> List[Embedding]:
-        query = (
-            self.session.query(Embedding)
-            .join(Chunk)
-            .join(ChunkProcess)
-            .join(
-                EmbeddingProcess, EmbeddingProcess.id == Embedding.embedding_process_id
+    def _index_description(self, count: int, storage_dtype: str = "float32") -> str:
+        """
+        FAISS factory description of the index to use for an embedding process
+        with `count` vectors. Domains too small to benefit from, or to train, an
+        approximate index are searched exactly. Processes stored as float16 or
+        int8 keep their vectors scalar quantized to the same precision in the
+        index, instead of widening them to float32 in memory.
+        """
+        quantizer = self.SCALAR_QUANTIZERS.get(storage_dtype)
+        if self.index_type == "flat" or count < self.MIN_ANN_VECTORS:
+            return quantizer or "Flat"
+        if self.index_type == "hnsw":
+            if quantizer:
+                return f"HNSW{self.hnsw_m}_{quantizer}"
+            return f"HNSW{self.hnsw_m}"
+
+        nlist = max(1, min(self.nlist, count // self.MIN_TRAINING_POINTS_PER_CENTROID))
+        if self.index_type == "ivf_flat":
+            return f"IVF{nlist},{quantizer or 'Flat'}"
+        if self.index_type == "ivf_pq":
+            if self.embedding_dim % self.pq_m == 0:
+                return f"IVF{nlist},PQ{self.pq_m}"
+            if self.logger:
+                self.logger.warning(
+                    f"PQ code size {self.pq_m} does not divide embedding dimension {self.embedding_dim}; using IVF-Flat."
+                )
+            return f"IVF{nlist},{quantizer or 'Flat'}"
+        raise ValueError(f"FAISS index type '{self.index_type}' is not supported.")
+
+    def _score(self, distance: float) -> float:
+        if self.is_cosine:
+            return float(distance)
+        return float(np.exp(-self.lambda_param * distance))
+
+    def _search_params(self, index: faiss.Index) -> Optional[faiss.SearchParameters]:
+        sub_index = faiss.downcast_index(index.index)
+        if isinstance(sub_index, faiss.IndexIVF):
+            return faiss.SearchParametersIVF(nprobe=min(self.nprobe, sub_index.nlist))
+        if isinstance(sub_index, faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(efSearch=self.ef_search)
+        return None
+
+    def _load_index(
+        self, embedding_process_id: int, fingerprint: Tuple[int, int], description: str
+    ) -> faiss.Index:
+        variant = f"{description},IP" if self.is_cosine else f"{description},L2n"
+
+        def load():
+            return self.index_store.load_or_build(
+                embedding_process_id,
+                fingerprint,
+                lambda: self._build_index(embedding_process_id, description),
+                variant,
             )
-            .join(ExtractedText)
-            .filter(ExtractedText.domain_id == self.domain_id)
+
+        if self.cache is None:
+            return load()
+        return self.cache.get_or_load(
+            ("faiss", embedding_process_id, variant, fingerprint),
+            load,
+            self._index_nbytes,
         )
-        if self.text_ids is not None:
-            query = query.filter(ExtractedText.id.in_(self.text_ids))
-        if self.embedder_method is not None:
-            query = query.filter(EmbeddingProcess.method == self.embedder_method)
-        if self.embedder_model is not None:
-            query = query.filter(
-                func.JSON_EXTRACT(EmbeddingProcess.parameters, "$.model")
-                == self.embedder_model
-            )
-        return query.all()
 
-    def _deserialize_embeddings(self, embeddings: List[Embedding]) -> np.ndarray:
-        return np.array([pickle.loads(embedding.embedding) for embedding in embeddings])
+    def _build_index(self, embedding_process_id: int, description: str) -> faiss.Index:
+        # Queries are unit length for both metrics, so the rows are too; L2
+        # distances between unit vectors rank like cosine similarities.
+        embedding_ids, embeddings_matrix = load_process_embeddings(
+            self.session, embedding_process_id, normalize=True
+        )
+        index = faiss.index_factory(
+            embeddings_matrix.shape[1],
+            f"IDMap,{description}",
+            faiss.METRIC_INNER_PRODUCT if self.is_cosine else faiss.METRIC_L2,
+        )
+        if not index.is_trained:
+            if self.logger:
+                self.logger.info(
+                    f"Training FAISS index {description} on {len(embeddings_matrix)} vectors of embedding process {embedding_process_id}."
+                )
+            index.train(embeddings_matrix)
+        index.add_with_ids(embeddings_matrix, embedding_ids)
+        return index
+
+    @staticmethod
+    def _index_nbytes(index: faiss.Index) -> int:
+        sub_index = faiss.downcast_index(index.index)
+        if isinstance(sub_index, faiss.IndexIVF):
+            return (
+                index.ntotal * (sub_index.code_size + 16)
+                + sub_index.nlist * index.d * 4
+            )
+        if isinstance(sub_index, faiss.IndexHNSW):
+            storage = faiss.downcast_index(sub_index.storage)
+            return index.ntotal * (
+                getattr(storage, "code_size", index.d * 4)
+                + sub_index.hnsw.nb_neighbors(0) * 4
+                + 8
+            )
+        return index.ntotal * (getattr(sub_index, "code_size", index.d * 4) + 8)
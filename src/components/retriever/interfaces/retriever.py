@@ -21,6 +21,15 @@ class Retriever(ABC):
         """
         pass
 
+    def retrieve_batch(
+        self, query_vectors: List[List[float]]
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Retrieve the top relevant embeddings for each of several query vectors.
+        Retrievers that can score queries together override this.
+        """
+        return [self.retrieve(query_vector) for query_vector in query_vectors]
+
     def get_configuration(self) -> Dict:
         return {"method": self.__class__.__name__, "params": self.get_params()}
 
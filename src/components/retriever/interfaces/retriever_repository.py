@@ -1,10 +1,9 @@
 from abc import ABC, abstractmethod
 from components.database.models import (
-    Chunk,
     Domain,
     ExtractedText,
 )
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 class RetrieverRepository(ABC):
@@ -12,17 +11,17 @@ class RetrieverRepository(ABC):
     @abstractmethod
     def list_domains_with_embeddings(self) -> List[Domain]: ...
 
-    @abstractmethod
-    def get_chunk_by_embedding_id_with_text(
-        self, id: int
-    ) -> Tuple[Chunk, ExtractedText]: ...
-
     @abstractmethod
     def list_texts_by_domain_and_embedder(
         self, domain_name: str, embedder: str
     ) -> List[ExtractedText]: ...
 
     @abstractmethod
-    def get_chunks_by_embedding_ids_with_texts(
-        self, ids: List[int]
-    ) -> List[Tuple[Chunk, ExtractedText]]: ...
+    def hydrate_hits(
+        self, hits: List[Tuple[int, float]]
+    ) -> List[Tuple[int, float, int, int, str, str, str]]: ...
+
+    @abstractmethod
+    def get_chunk_windows_by_embedding_ids(
+        self, ids: List[int], neighbors: int = 0
+    ) -> List[Tuple[Optional[int], int, int, str]]: ...
@@ -0,0 +1,95 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from logging import Logger as StandardLogger
+
+
+class RetrieverCache:
+    """
+    Process-wide LRU cache for loaded embedding matrices and FAISS indexes,
+    bounded by a memory budget in bytes and shared by all sessions.
+    """
+
+    def __init__(self, max_bytes: int, logger: Optional[StandardLogger] = None):
+        self.max_bytes = max_bytes
+        self.logger = logger
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        size_of: Callable[[Any], int],
+    ) -> Any:
+        value = self._get(key)
+        if value is not None:
+            return value
+
+        with self._key_lock(key):
+            value = self._get(key, count_miss=True)
+            if value is not None:
+                return value
+            try:
+                value = load()
+                self._put(key, value, size_of(value))
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+            return value
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def _get(self, key: Hashable, count_miss: bool = False) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if count_miss:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _put(self, key: Hashable, value: Any, size: int) -> None:
+        with self._lock:
+            if size > self.max_bytes:
+                self._log_info(
+                    f"Not caching {key}: {size} bytes exceeds the budget of {self.max_bytes} bytes."
+                )
+                return
+            self._entries[key] = (value, size)
+            self._current_bytes += size
+            while self._current_bytes > self.max_bytes:
+                evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+                self.evictions += 1
+                self._log_info(f"Evicted {evicted_key} ({evicted_size} bytes).")
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _log_info(self, message: str) -> None:
+        if self.logger:
+            self.logger.info(f"Retriever cache: {message}")
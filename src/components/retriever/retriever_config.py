@@ -1,9 +1,7 @@
-from components.retriever.simple_nearest_neighbor_retriever import (
-    SimpleNearestNeighborRetriever,
-)
-from components.retriever.faiss_retriever import FAISSRetriever
-from typing import Any, Dict
+from components.retriever.interfaces.retriever import Retriever
+from typing import Any, Dict, Optional, Type
 from utils.env_utils import getenv
+from utils.import_utils import import_class
 
 
 class RetrieverConfig:
@@ -11,9 +9,16 @@ class RetrieverConfig:
     MAX_TOP_N_SIZE: int = 100
     MIN_LAMBDA_PARAM: float = 0.001
     MAX_LAMBDA_PARAM: float = 1.0
+    MIN_NLIST: int = 1
+    MAX_NLIST: int = 65536
+    MIN_NPROBE: int = 1
+    MIN_HNSW_M: int = 4
+    MAX_HNSW_M: int = 128
+    MIN_EF_SEARCH: int = 1
+    MAX_EF_SEARCH: int = 4096
     retriever_classes = {
-        "simple_nearest_neighbor": SimpleNearestNeighborRetriever,
-        "FAISS": FAISSRetriever,
+        "simple_nearest_neighbor": "components.retriever.simple_nearest_neighbor_retriever:SimpleNearestNeighborRetriever",
+        "FAISS": "components.retriever.faiss_retriever:FAISSRetriever",
     }
 
     base_field_definitions = {
@@ -33,26 +38,73 @@ class RetrieverConfig:
             "default": 768,
             "options": [384, 768],
         },
+        "metric": {
+            "label": "Similarity Metric",
+            "type": "select",
+            "default": getenv("RETRIEVER_FAISS_METRIC_DEFAULT", "cosine"),
+            "options": ["cosine", "l2"],
+        },
         "lambda_param": {
-            "label": "Lambda Parameter",
+            "label": "Lambda Parameter (L2 only)",
             "type": "number",
             "default": 0.5,
             "options": [],
         },
+        "index_type": {
+            "label": "Index Type",
+            "type": "select",
+            "default": getenv("RETRIEVER_FAISS_INDEX_TYPE_DEFAULT", "flat"),
+            "options": ["flat", "ivf_flat", "ivf_pq", "hnsw"],
+        },
+        "nlist": {
+            "label": "IVF Clusters (nlist)",
+            "type": "number",
+            "default": 1024,
+            "options": [],
+        },
+        "nprobe": {
+            "label": "IVF Clusters Searched (nprobe)",
+            "type": "number",
+            "default": 16,
+            "options": [],
+        },
+        "pq_m": {
+            "label": "PQ Code Size (bytes per vector)",
+            "type": "select",
+            "default": 32,
+            "options": [8, 16, 32, 48, 64, 96],
+        },
+        "hnsw_m": {
+            "label": "HNSW Neighbors per Node (M)",
+            "type": "number",
+            "default": 32,
+            "options": [],
+        },
+        "ef_search": {
+            "label": "HNSW Search Depth (efSearch)",
+            "type": "number",
+            "default": 64,
+            "options": [],
+        },
     }
 
     @classmethod
-    def _get_fields(cls, retriever_class):
+    def get_retriever_class(cls, method: str) -> Optional[Type[Retriever]]:
+        path = cls.retriever_classes.get(method)
+        return import_class(path) if path else None
+
+    @classmethod
+    def _get_fields(cls, method):
         retriever_fields = {
-            SimpleNearestNeighborRetriever: cls.base_field_definitions,
-            FAISSRetriever: cls.faiss_field_definitions,
+            "simple_nearest_neighbor": cls.base_field_definitions,
+            "FAISS": cls.faiss_field_definitions,
         }
-        return retriever_fields.get(retriever_class, {})
+        return retriever_fields.get(method, {})
 
     @classmethod
-    def _validations(cls, retriever_class):
+    def _validations(cls, method):
         validations = []
-        fields = cls._get_fields(retriever_class)
+        fields = cls._get_fields(method)
         if "top_n" in fields:
             validations.extend(
                 [
@@ -79,10 +131,62 @@ class RetrieverConfig:
                     },
                 ]
             )
+        if "nlist" in fields:
+            validations.extend(
+                [
+                    {
+                        "rule": ("nlist", "ge", cls.MIN_NLIST),
+                        "message": f"IVF Clusters must be at least {cls.MIN_NLIST}.",
+                    },
+                    {
+                        "rule": ("nlist", "le", cls.MAX_NLIST),
+                        "message": f"IVF Clusters must not exceed {cls.MAX_NLIST}.",
+                    },
+                ]
+            )
+        if "nprobe" in fields:
+            validations.extend(
+                [
+                    {
+                        "rule": ("nprobe", "ge", cls.MIN_NPROBE),
+                        "message": f"IVF Clusters Searched must be at least {cls.MIN_NPROBE}.",
+                    },
+                    {
+                        "rule": ("nprobe", "le", "nlist"),
+                        "message": "IVF Clusters Searched must not exceed IVF Clusters.",
+                    },
+                ]
+            )
+        if "hnsw_m" in fields:
+            validations.extend(
+                [
+                    {
+                        "rule": ("hnsw_m", "ge", cls.MIN_HNSW_M),
+                        "message": f"HNSW Neighbors per Node must be at least {cls.MIN_HNSW_M}.",
+                    },
+                    {
+                        "rule": ("hnsw_m", "le", cls.MAX_HNSW_M),
+                        "message": f"HNSW Neighbors per Node must not exceed {cls.MAX_HNSW_M}.",
+                    },
+                ]
+            )
+        if "ef_search" in fields:
+            validations.extend(
+                [
+                    {
+                        "rule": ("ef_search", "ge", cls.MIN_EF_SEARCH),
+                        "message": f"HNSW Search Depth must be at least {cls.MIN_EF_SEARCH}.",
+                    },
+                    {
+                        "rule": ("ef_search", "le", cls.MAX_EF_SEARCH),
+                        "message": f"HNSW Search Depth must not exceed {cls.MAX_EF_SEARCH}.",
+                    },
+                ]
+            )
         return validations
 
     @classmethod
-    def _constants(cls, retriever_class):
+    def _constants(cls, method):
         return {
             attr: getattr(cls, attr)
             for attr in dir(cls)
@@ -95,10 +199,10 @@ class RetrieverConfig:
     def retriever_options(self) -> Dict[str, Dict[str, Any]]:
         return {
             name: {
-                "class": cls,
-                "fields": self._get_fields(cls),
-                "validations": self._validations(cls),
-                "constants": self._constants(cls),
+                "class_path": path,
+                "fields": self._get_fields(name),
+                "validations": self._validations(name),
+                "constants": self._constants(name),
             }
-            for name, cls in self.retriever_classes.items()
+            for name, path in self.retriever_classes.items()
         }
@@ -1,18 +1,14 @@
 from typing import Dict, List, Tuple
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from sqlalchemy import func
 from sqlalchemy.orm import Session
-from components.database.models import (
-    Chunk,
-    ChunkProcess,
-    Embedding,
-    EmbeddingProcess,
-    ExtractedText,
+from .cosine_similarity_index import CosineSimilarityIndex
+from .embedding_matrix import (
+    get_storage_dtypes,
+    list_embedding_processes,
+    load_process_embeddings,
 )
-from components.embedder.interfaces.embedder import Embedder
 from .interfaces.retriever import Retriever
-import pickle
+from .retriever_cache import RetrieverCache
 from logging import Logger as StandardLogger
 
 
@@ -21,6 +17,7 @@ class SimpleNearestNeighborRetriever(Retriever):
         self,
         session: Session,
         logger: StandardLogger = None,
+        cache: RetrieverCache = None,
         domain_id: int = None,
         text_ids: List[int] = None,
         embedder_config: Dict = None,
@@ -28,6 +25,7 @@ class SimpleNearestNeighborRetriever(Retriever):
     ) -> None:
         self.session = session
         self.logger = logger
+        self.cache = cache
         self.domain_id = domain_id
         self.text_ids = text_ids
         self.top_n = top_n
@@ -43,57 +41,78 @@ class SimpleNearestNeighborRetriever(Retriever):
         self,
         query_vector: List[float],
     ) -> List[Tuple[int, float]]:
-        embeddings = self._fetch_embeddings()
-        if not embeddings:
+        return self.retrieve_batch([query_vector])[0]
+
+    def retrieve_batch(
+        self,
+        query_vectors: List[List[float]],
+    ) -> List[List[Tuple[int, float]]]:
+        if len(query_vectors) == 0:
             return []
+        query_vectors_array = np.asarray(query_vectors, dtype=np.float32)
+        if query_vectors_array.ndim == 1:
+            query_vectors_array = query_vectors_array.reshape(1, -1)
 
-        embeddings_matrix = self._deserialize_embeddings(embeddings)
-        if embeddings_matrix.shape[1] != len(query_vector):
-            error_msg = f"Incompatible dimension for query vector and embeddings matrix: {len(query_vector)} vs {embeddings_matrix.shape[1]}"
-            if self.logger:
-                self.logger.error(error_msg)
-            raise RuntimeError(error_msg)
+        embedding_processes = list_embedding_processes(
+            self.session,
+            self.domain_id,
+            self.text_ids,
+            self.embedder_method,
+            self.embedder_model,
+        )
+        if not embedding_processes:
+            return [[] for _ in range(len(query_vectors_array))]
 
-        query_vector_array = np.array(query_vector).reshape(1, -1)
-        similarities = self._compute_similarities(query_vector_array, embeddings_matrix)
+        embedding_ids, similarities = [], []
+        for embedding_process_id, count, max_embedding_id in embedding_processes:
+            index = self._load_index(embedding_process_id, (count, max_embedding_id))
+            if index.dimension != query_vectors_array.shape[1]:
+                error_msg = f"Incompatible dimension for query vector and embeddings matrix: {query_vectors_array.shape[1]} vs {index.dimension}"
+                if self.logger:
+                    self.logger.error(error_msg)
+                raise RuntimeError(error_msg)
+            ids, scores = index.search(query_vectors_array, self.top_n)
+            embedding_ids.append(ids)
+            similarities.append(scores)
 
-        return self._get_top_similar_embeddings(embeddings, similarities)
+        return self._get_top_similar_embeddings(
+            np.concatenate(embedding_ids, axis=1), np.concatenate(similarities, axis=1)
+        )
 
     def get_params(self) -> Dict:
         return {"top_n": self.top_n}
 
-    def _fetch_embeddings(self) -> List[Embedding]:
-        query = (
-            self.session.query(Embedding)
-            .join(Chunk)
-            .join(ChunkProcess)
-            .join(
-                EmbeddingProcess, EmbeddingProcess.id == Embedding.embedding_process_id
+    def _load_index(
+        self, embedding_process_id: int, fingerprint: Tuple[int, int]
+    ) -> CosineSimilarityIndex:
+        def load():
+            storage_dtype = get_storage_dtypes(
+                self.session, [embedding_process_id]
+            ).get(embedding_process_id, "float32")
+            return CosineSimilarityIndex(
+                *load_process_embeddings(
+                    self.session, embedding_process_id, normalize=True
+                ),
+                dtype=np.float32 if storage_dtype == "float32" else np.float16,
             )
-            .join(ExtractedText)
-            .filter(ExtractedText.domain_id == self.domain_id)
-        )
-        if self.text_ids is not None:
-            query = query.filter(ExtractedText.id.in_(self.text_ids))
-        if self.embedder_method is not None:
-            query = query.filter(EmbeddingProcess.method == self.embedder_method)
-        if self.embedder_model is not None:
-            query = query.filter(
-                func.JSON_EXTRACT(EmbeddingProcess.parameters, "$.model")
-                == self.embedder_model
-            )
-        return query.all()
-
-    def _deserialize_embeddings(self, embeddings: List[Embedding]) -> np.ndarray:
-        return np.array([pickle.loads(embedding.embedding) for embedding in embeddings])
 
-    def _compute_similarities(
-        self, query_vector: np.ndarray, embeddings_matrix: np.ndarray
-    ) -> np.ndarray:
-        return cosine_similarity(query_vector, embeddings_matrix).flatten()
+        if self.cache is None:
+            return load()
+        return self.cache.get_or_load(
+            ("embeddings", embedding_process_id, fingerprint),
+            load,
+            lambda index: index.nbytes,
+        )
 
     def _get_top_similar_embeddings(
-        self, embeddings: List[Embedding], similarities: np.ndarray
-    ) -> List[Tuple[int, float]]:
-        top_indices = np.argsort(similarities)[-self.top_n :][::-1]
-        return [(embeddings[i].id, similarities[i]) for i in top_indices]
+        self, embedding_ids: np.ndarray, similarities: np.ndarray
+    ) -> List[List[Tuple[int, float]]]:
+        k = min(self.top_n, similarities.shape[1])
+        top_indices = np.argsort(-similarities, axis=1, kind="stable")[:, :k]
+        return [
+            [
+                (int(embedding_ids[row, i]), float(similarities[row, i]))
+                for i in top_indices[row]
+            ]
+            for row in range(len(similarities))
+        ]
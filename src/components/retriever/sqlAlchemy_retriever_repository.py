@@ -1,10 +1,12 @@
-from typing import List, Tuple
-from sqlalchemy import func
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import and_, exists
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm.exc import NoResultFound
 
 from components.database.interfaces.connector import Connector
 from components.reader.interfaces.text_compressor import TextCompressor
+from .chunk_text_cache import ChunkTextCache
 from .interfaces.retriever_repository import RetrieverRepository
 from components.database.models import (
     Chunk,
@@ -23,20 +25,18 @@ class SqlAlchemyRetrieverRepository(RetrieverRepository):
         connector: Connector = None,
         compressor: TextCompressor = None,
         logger: StandardLogger = None,
+        chunk_text_cache: ChunkTextCache = None,
     ):
         self.session = connector.get_session()
         self.compressor = compressor
+        self.chunk_text_cache = chunk_text_cache or ChunkTextCache()
         self.logger = logger
 
     def list_domains_with_embeddings(self) -> List[Domain]:
         try:
             return (
                 self.session.query(Domain)
-                .join(ExtractedText, Domain.id == ExtractedText.domain_id)
-                .join(ChunkProcess, ExtractedText.id == ChunkProcess.extracted_text_id)
-                .join(Chunk, ChunkProcess.id == Chunk.chunk_process_id)
-                .join(Embedding, Chunk.id == Embedding.chunk_id)
-                .distinct()
+                .filter(exists().where(Embedding.domain_id == Domain.id))
                 .all()
             )
         except SQLAlchemyError as e:
@@ -44,25 +44,6 @@ class SqlAlchemyRetrieverRepository(RetrieverRepository):
                 self.logger.error(f"SQLAlchemy error occurred: {e}")
             raise
 
-    def get_chunk_by_embedding_id_with_text(
-        self, id: int
-    ) -> Tuple[Chunk, ExtractedText]:
-        try:
-            chunk_with_text = (
-                self.session.query(Chunk, ExtractedText)
-                .join(ChunkProcess, Chunk.chunk_process_id == ChunkProcess.id)
-                .join(ExtractedText, ChunkProcess.extracted_text_id == ExtractedText.id)
-                .join(Embedding, Embedding.chunk_id == Chunk.id)
-                .filter(Embedding.id == id)
-                .one()
-            )
-            return chunk_with_text
-        except SQLAlchemyError as e:
-            self.logger.error(
-                f"Failed to retrieve chunk and filename for embedding ID {id}: {e}"
-            )
-            raise
-
     def list_texts_by_domain_and_embedder(self, domain_name: str, embedder_model: str):
         try:
             texts = (
@@ -71,10 +52,7 @@ class SqlAlchemyRetrieverRepository(RetrieverRepository):
                 .join(ChunkProcess.embedding_processes)
                 .join(Domain)
                 .filter(Domain.name == domain_name)
-                .filter(
-                    func.JSON_EXTRACT(EmbeddingProcess.parameters, "$.model")
-                    == embedder_model
-                )
+                .filter(EmbeddingProcess.model == embedder_model)
                 .order_by(ExtractedText.name)
                 .all()
             )
@@ -88,21 +66,118 @@ class SqlAlchemyRetrieverRepository(RetrieverRepository):
             )
             raise
 
-    def get_chunks_by_embedding_ids_with_texts(
-        self, ids: List[int]
-    ) -> List[Tuple[Chunk, ExtractedText]]:
+    def hydrate_hits(
+        self, hits: List[Tuple[int, float]]
+    ) -> List[Tuple[int, float, int, int, str, str, str]]:
+        """
+        Retrieval hits as (embedding_id, score, chunk_id, index, text,
+        text_name, text_type), in the order of `hits`. Only the columns needed
+        are selected, and chunk blobs are read and decompressed only for chunks
+        that are not in the chunk text cache.
+        """
+        if not hits:
+            return []
+        try:
+            rows = (
+                self.session.query(
+                    Embedding.id,
+                    Chunk.id,
+                    Chunk.index,
+                    ExtractedText.name,
+                    ExtractedText.type,
+                )
+                .join(Chunk, Embedding.chunk_id == Chunk.id)
+                .join(ExtractedText, Embedding.extracted_text_id == ExtractedText.id)
+                .filter(Embedding.id.in_([embedding_id for embedding_id, _ in hits]))
+                .all()
+            )
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to hydrate hits for embedding IDs: {e}")
+            raise
+
+        rows_by_embedding_id = {row[0]: row for row in rows}
+        texts = self._get_chunk_texts([row[1] for row in rows])
+        hydrated = []
+        for embedding_id, score in hits:
+            row = rows_by_embedding_id.get(embedding_id)
+            if row is None or row[1] not in texts:
+                continue
+            _, chunk_id, index, text_name, text_type = row
+            hydrated.append(
+                (
+                    embedding_id,
+                    score,
+                    chunk_id,
+                    index,
+                    texts[chunk_id],
+                    text_name,
+                    text_type,
+                )
+            )
+        return hydrated
+
+    def get_chunk_windows_by_embedding_ids(
+        self, ids: List[int], neighbors: int = 0
+    ) -> List[Tuple[Optional[int], int, int, str]]:
+        """
+        Hit chunks plus up to `neighbors` chunks on either side within the same
+        chunk process, in one query. Rows are (embedding_id, chunk_process_id,
+        index, text), with embedding_id None for chunks that are only neighbors.
+        """
         try:
-            chunks_with_texts = (
-                self.session.query(Chunk, ExtractedText)
-                .join(ChunkProcess, Chunk.chunk_process_id == ChunkProcess.id)
-                .join(ExtractedText, ChunkProcess.extracted_text_id == ExtractedText.id)
-                .join(Embedding, Embedding.chunk_id == Chunk.id)
+            hit = aliased(Chunk)
+            rows = (
+                self.session.query(
+                    Embedding.id,
+                    hit.id,
+                    Chunk.id,
+                    Chunk.chunk_process_id,
+                    Chunk.index,
+                )
+                .join(hit, Embedding.chunk_id == hit.id)
+                .join(
+                    Chunk,
+                    and_(
+                        Chunk.chunk_process_id == hit.chunk_process_id,
+                        Chunk.index.between(
+                            hit.index - neighbors, hit.index + neighbors
+                        ),
+                    ),
+                )
                 .filter(Embedding.id.in_(ids))
                 .all()
             )
-            return chunks_with_texts
         except SQLAlchemyError as e:
             self.logger.error(
-                f"Failed to retrieve chunks and filenames for embedding IDs: {e}"
+                f"Failed to retrieve chunk windows for embedding IDs: {e}"
             )
             raise
+
+        texts = self._get_chunk_texts([row[2] for row in rows])
+        windows = {}
+        for embedding_id, hit_id, chunk_id, chunk_process_id, index in rows:
+            if chunk_id not in texts:
+                continue
+            hit_embedding_id = embedding_id if chunk_id == hit_id else None
+            windows[(hit_embedding_id, chunk_id)] = (
+                hit_embedding_id,
+                chunk_process_id,
+                index,
+                texts[chunk_id],
+            )
+        return list(windows.values())
+
+    def _get_chunk_texts(self, chunk_ids: List[int]) -> Dict[int, str]:
+        return self.chunk_text_cache.get_many(chunk_ids, self._load_chunk_texts)
+
+    def _load_chunk_texts(self, chunk_ids: List[int]) -> Dict[int, str]:
+        try:
+            blobs = (
+                self.session.query(Chunk.id, Chunk.chunk)
+                .filter(Chunk.id.in_(chunk_ids))
+                .all()
+            )
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to load chunk texts: {e}")
+            raise
+        return {chunk_id: self.compressor.decompress(blob) for chunk_id, blob in blobs}
@@ -24,6 +24,22 @@ class Config:
         data_dir = os.getenv("DATA_DIR", "data")
         return self.project_root / data_dir
 
+    @property
+    def faiss_index_dir(self):
+        return self.data_dir / "faiss"
+
+    @property
+    def retriever_cache_max_bytes(self):
+        return int(getenv("RETRIEVER_CACHE_MAX_MB", "1024")) * 1024 * 1024
+
+    @property
+    def retriever_context_neighbors(self):
+        return int(getenv("RETRIEVER_CONTEXT_NEIGHBORS_DEFAULT", "0"))
+
+    @property
+    def retriever_chunk_cache_size(self):
+        return int(getenv("RETRIEVER_CHUNK_CACHE_SIZE", "2048"))
+
     @property
     def logo_small_path(self):
         return str(self.project_root / "src/img/logo_small_v2.1.png")
@@ -32,6 +48,45 @@ class Config:
     def model_cache_dir(self):
         return str(getenv("MODEL_CACHE_DIR", self.project_root / "data/models"))
 
+    @property
+    def tokenizer_cache_size(self):
+        return int(getenv("TOKENIZER_CACHE_SIZE", "4"))
+
+    @property
+    def token_count_cache_size(self):
+        return int(getenv("TOKEN_COUNT_CACHE_SIZE", "10000"))
+
+    @property
+    def chat_context_packing(self):
+        return getenv("CHATTER_CONTEXT_PACKING", "relevance_per_token")
+
+    @property
+    def chat_context_truncation(self):
+        return getenv("CHATTER_CONTEXT_TRUNCATION", "true").lower() == "true"
+
+    @property
+    def groq_client_options(self):
+        return {
+            "base_url": getenv("GROQ_BASE_URL") or None,
+            "timeout": float(getenv("GROQ_TIMEOUT", "60")),
+            "connect_timeout": float(getenv("GROQ_CONNECT_TIMEOUT", "5")),
+            "max_connections": int(getenv("GROQ_MAX_CONNECTIONS", "20")),
+            "max_keepalive_connections": int(
+                getenv("GROQ_MAX_KEEPALIVE_CONNECTIONS", "10")
+            ),
+            "keepalive_expiry": float(getenv("GROQ_KEEPALIVE_EXPIRY", "60")),
+        }
+
+    @property
+    def db_pool_options(self):
+        return {
+            "pool_size": int(getenv("DB_POOL_SIZE", "10")),
+            "max_overflow": int(getenv("DB_POOL_MAX_OVERFLOW", "20")),
+            "pool_timeout": int(getenv("DB_POOL_TIMEOUT", "30")),
+            "pool_recycle": int(getenv("DB_POOL_RECYCLE", "3600")),
+            "pool_pre_ping": getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        }
+
     @property
     def latest_migration_version(self):
-        return "cdf9b87e5fb0"
+        return "9a1d4e6b2c57"
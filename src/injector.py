@@ -1,13 +1,16 @@
-from components.chatter.chatter_config import ChatterConfig
-from components.chatter.config_based_chatter_factory import ConfigBasedChatterFactory
 from components.chatter.interfaces.chatter_factory import ChatterFactory
 from components.chatter.interfaces.chatter_repository import ChatterRepository
+from components.chatter.groq_client_pool import GroqClientPool
 from components.chatter.sqlAlchemy_chatter_repository import SqlalchemyChatterRepository
+from components.chatter.token_count_cache import TokenCountCache
+from components.chatter.tokenizer_cache import TokenizerCache
 from components.chunker.chunker_config import ChunkerConfig
 from components.chunker.config_based_chunker_factory import ConfigBasedChunkerFactory
 from components.chunker.interfaces.chunker_factory import ChunkerFactory
 from components.chunker.interfaces.chunker_repository import ChunkerRepository
 from components.chunker.sqlAlchemy_chunker_repository import SqlAlchemyChunkerRepository
+from components.database.interfaces.connector import Connector
+from components.database.models import ModelSource
 from components.database.mysql_connector import MySQLConnector
 from components.embedder.config_based_embedder_factory import ConfigBasedEmbedderFactory
 from components.embedder.embedder_config import EmbedderConfig
@@ -19,21 +22,33 @@ from components.embedder.sqlAlchemy_embedder_repository import (
 from components.reader.interfaces.text_compressor import TextCompressor
 from components.reader.sqlAlchemy_reader_repository import SqlalchemyReaderRepository
 from components.reader.interfaces.reader_repository import ReaderRepository
-from components.reader.web_text_extractor import WebTextExtractor
 from components.reader.zlib_text_compressor import ZlibTextCompressor
 from components.reader.interfaces.text_extractor import TextExtractor
-from components.reader.file_text_extractor import FileTextExtractor
 from components.logger.native_logger import NativeLogger
 from components.retriever.config_based_retriever_factory import (
     ConfigBasedRetrieverFactory,
 )
+from components.retriever.chunk_text_cache import ChunkTextCache
+from components.retriever.context_assembler import ContextAssembler
+from components.retriever.faiss_index_store import FAISSIndexStore
 from components.retriever.interfaces.retriever_factory import RetrieverFactory
 from components.retriever.interfaces.retriever_repository import RetrieverRepository
+from components.retriever.retriever_cache import RetrieverCache
 from components.retriever.retriever_config import RetrieverConfig
 from components.retriever.sqlAlchemy_retriever_repository import (
     SqlAlchemyRetrieverRepository,
 )
 from config import Config
+from utils.env_utils import getenv
+import threading
+
+_singletons_lock = threading.Lock()
+_connector = None
+_retriever_cache = None
+_chunk_text_cache = None
+_tokenizer_cache = None
+_token_count_cache = None
+_groq_client_pool = None
 
 
 def get_config() -> Config:
@@ -44,23 +59,43 @@ def get_logger(name: str = "docuchat"):
     return NativeLogger.get_logger(name)
 
 
+def get_connector() -> Connector:
+    global _connector
+    if _connector is None:
+        with _singletons_lock:
+            if _connector is None:
+                _connector = MySQLConnector(scopefunc=_session_scope)
+    return _connector
+
+
+def _session_scope():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx else threading.get_ident()
+
+
 def get_compressor() -> TextCompressor:
     return ZlibTextCompressor()
 
 
 def get_reader_repository() -> ReaderRepository:
     return SqlalchemyReaderRepository(
-        connector=MySQLConnector(),
+        connector=get_connector(),
         compressor=ZlibTextCompressor(),
         logger=NativeLogger.get_logger("docuchat"),
     )
 
 
 def get_text_extractor() -> TextExtractor:
+    from components.reader.file_text_extractor import FileTextExtractor
+
     return FileTextExtractor()
 
 
 def get_web_extractor() -> TextExtractor:
+    from components.reader.web_text_extractor import WebTextExtractor
+
     return WebTextExtractor(
         logger=NativeLogger.get_logger("docuchat"),
     )
@@ -72,7 +107,7 @@ def get_chunker_config():
 
 def get_chunker_repository() -> ChunkerRepository:
     return SqlAlchemyChunkerRepository(
-        connector=MySQLConnector(),
+        connector=get_connector(),
         compressor=ZlibTextCompressor(),
         logger=NativeLogger.get_logger("docuchat"),
     )
@@ -80,7 +115,7 @@ def get_chunker_repository() -> ChunkerRepository:
 
 def get_embedder_repository() -> EmbedderRepository:
     return SqlAlchemyEmbedderRepository(
-        connector=MySQLConnector(),
+        connector=get_connector(),
         compressor=ZlibTextCompressor(),
         logger=NativeLogger.get_logger("docuchat"),
     )
@@ -101,26 +136,65 @@ def get_embedder_factory() -> EmbedderFactory:
     )
 
 
+def get_retriever_cache() -> RetrieverCache:
+    global _retriever_cache
+    if _retriever_cache is None:
+        with _singletons_lock:
+            if _retriever_cache is None:
+                _retriever_cache = RetrieverCache(
+                    max_bytes=get_config().retriever_cache_max_bytes,
+                    logger=NativeLogger.get_logger("docuchat"),
+                )
+    return _retriever_cache
+
+
 def get_retriever_factory() -> RetrieverFactory:
     return ConfigBasedRetrieverFactory(
-        connector=MySQLConnector(),
+        connector=get_connector(),
+        logger=NativeLogger.get_logger("docuchat"),
+        cache=get_retriever_cache(),
+        index_store=get_faiss_index_store(),
+    )
+
+
+def get_context_assembler() -> ContextAssembler:
+    return ContextAssembler()
+
+
+def get_faiss_index_store() -> FAISSIndexStore:
+    return FAISSIndexStore(
+        index_dir=get_config().faiss_index_dir,
         logger=NativeLogger.get_logger("docuchat"),
     )
 
 
 def get_retriever_repository() -> RetrieverRepository:
     return SqlAlchemyRetrieverRepository(
-        connector=MySQLConnector(),
+        connector=get_connector(),
         compressor=ZlibTextCompressor(),
         logger=NativeLogger.get_logger("docuchat"),
+        chunk_text_cache=get_chunk_text_cache(),
     )
 
 
+def get_chunk_text_cache() -> ChunkTextCache:
+    global _chunk_text_cache
+    if _chunk_text_cache is None:
+        with _singletons_lock:
+            if _chunk_text_cache is None:
+                _chunk_text_cache = ChunkTextCache(
+                    max_entries=get_config().retriever_chunk_cache_size
+                )
+    return _chunk_text_cache
+
+
 def get_retriever_config():
     return RetrieverConfig()
 
 
 def get_chatter_config():
+    from components.chatter.chatter_config import ChatterConfig
+
     return ChatterConfig(
         logger=NativeLogger.get_logger("docuchat"),
         model_cache_repository=get_chatter_repository(),
@@ -128,14 +202,70 @@ def get_chatter_config():
 
 
 def get_chatter_factory() -> ChatterFactory:
+    from components.chatter.config_based_chatter_factory import (
+        ConfigBasedChatterFactory,
+    )
+
     return ConfigBasedChatterFactory(
         logger=NativeLogger.get_logger("docuchat"),
         chatter_repository=get_chatter_repository(),
+        tokenizer_cache=get_tokenizer_cache(),
+        token_count_cache=get_token_count_cache(),
+        groq_client_pool=get_groq_client_pool(),
+    )
+
+
+def get_tokenizer_cache() -> TokenizerCache:
+    global _tokenizer_cache
+    if _tokenizer_cache is None:
+        with _singletons_lock:
+            if _tokenizer_cache is None:
+                _tokenizer_cache = TokenizerCache(
+                    cache_dir=get_config().model_cache_dir,
+                    token=getenv("HUGGINGFACEHUB_API_TOKEN") or None,
+                    max_size=get_config().tokenizer_cache_size,
+                    logger=NativeLogger.get_logger("docuchat"),
+                )
+    return _tokenizer_cache
+
+
+def get_token_count_cache() -> TokenCountCache:
+    global _token_count_cache
+    if _token_count_cache is None:
+        with _singletons_lock:
+            if _token_count_cache is None:
+                _token_count_cache = TokenCountCache(
+                    max_entries=get_config().token_count_cache_size
+                )
+    return _token_count_cache
+
+
+def get_groq_client_pool() -> GroqClientPool:
+    global _groq_client_pool
+    if _groq_client_pool is None:
+        with _singletons_lock:
+            if _groq_client_pool is None:
+                _groq_client_pool = GroqClientPool(
+                    **get_config().groq_client_options,
+                    logger=NativeLogger.get_logger("docuchat"),
+                )
+    return _groq_client_pool
+
+
+def preload_default_tokenizer() -> None:
+    from components.chatter.chatter_config import ChatterConfig
+
+    model_cache = get_chatter_repository().read_model_cache(
+        ModelSource.Groq, ChatterConfig.GROQ_API_MODEL_DEFAULT
     )
+    if model_cache:
+        get_tokenizer_cache().preload(
+            model_cache.attributes.get("huggingface_identifier")
+        )
 
 
 def get_chatter_repository() -> ChatterRepository:
     return SqlalchemyChatterRepository(
-        connector=MySQLConnector(),
+        connector=get_connector(),
         logger=NativeLogger.get_logger("docuchat"),
     )
@@ -4,6 +4,7 @@ from components.database.models import Domain
 from injector import get_logger, get_reader_repository
 from pages.utils.extracted_data import manage_extracted_text
 from pages.utils.utils import (
+    database_session,
     set_default_state,
     setup_page,
     extracted_text_to_label,
@@ -266,4 +267,5 @@ def move_texts_between_domains():
 
 
 if __name__ == "__main__":
-    main()
+    with database_session():
+        main()
@@ -9,6 +9,7 @@ from injector import (
 )
 from pages.utils.extracted_data import manage_extracted_text
 from pages.utils.utils import (
+    database_session,
     filename_extension_to_label,
     filename_to_label,
     get_index,
@@ -294,4 +295,5 @@ def show_summary():
 
 
 if __name__ == "__main__":
-    main()
+    with database_session():
+        main()
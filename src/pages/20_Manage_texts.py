@@ -2,6 +2,7 @@ import streamlit as st
 from components.database.models import ExtractedText
 from injector import get_config, get_logger, get_reader_repository, get_compressor
 from pages.utils.utils import (
+    database_session,
     get_index,
     select_texts,
     set_default_state,
@@ -206,4 +207,5 @@ def setup_session_state():
 
 
 if __name__ == "__main__":
-    main()
+    with database_session():
+        main()
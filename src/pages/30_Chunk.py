@@ -6,6 +6,7 @@ from components.reader.interfaces.reader_repository import ReaderRepository
 from components.reader.interfaces.text_compressor import TextCompressor
 from logging import Logger
 from injector import (
+    get_chunk_text_cache,
     get_chunker_config,
     get_chunker_factory,
     get_chunker_repository,
@@ -16,6 +17,7 @@ from injector import (
 )
 from pages.utils.streamlit_form import StreamlitForm
 from pages.utils.utils import (
+    database_session,
     generate_default_name,
     get_index,
     init_form_values,
@@ -149,8 +151,7 @@ def process_text_to_chunks(selected_text, method, values):
             text_content = compressor.decompress(selected_text.text)
             chunks = chunker_instance.chunk(text_content)
 
-            chunk_data_for_db = [(index, chunk) for index, chunk in enumerate(chunks)]
-            chunker_repository.save_chunks(chunk_process_id, chunk_data_for_db)
+            chunker_repository.save_chunks(chunk_process_id, enumerate(chunks))
             st.rerun()
     except Exception as e:
         st.error(f"Failed to create chunk process or save chunks: {e}")
@@ -230,6 +231,7 @@ def delete_process(session):
     try:
         chunker_repository.delete_chunks_by_process(session.id)
         chunker_repository.delete_chunk_process(session.id)
+        get_chunk_text_cache().clear()
         st.rerun()
     except Exception as e:
         st.error(f"Failed to create chunk process or save chunks: {e}")
@@ -314,4 +316,5 @@ def chunks_page_nav(session, page_number, total_pages, position):
 
 
 if __name__ == "__main__":
-    main()
+    with database_session():
+        main()
@@ -3,17 +3,20 @@ from components.embedder.interfaces.embedder import Embedder
 from components.embedder.interfaces.embedder_factory import EmbedderFactory
 from components.embedder.interfaces.embedder_repository import EmbedderRepository
 from components.reader.interfaces.text_compressor import TextCompressor
+from components.retriever.faiss_index_store import FAISSIndexStore
 from logging import Logger
 from injector import (
     get_config,
     get_embedder_config,
     get_embedder_factory,
     get_embedder_repository,
+    get_faiss_index_store,
     get_logger,
     get_compressor,
 )
 from pages.utils.streamlit_form import StreamlitForm
 from pages.utils.utils import (
+    database_session,
     generate_default_name,
     get_index,
     init_form_values,
@@ -30,6 +33,7 @@ logger: Logger = get_logger()
 compressor: TextCompressor = get_compressor()
 embedder_repository: EmbedderRepository = get_embedder_repository()
 embedder_factory: EmbedderFactory = get_embedder_factory()
+faiss_index_store: FAISSIndexStore = get_faiss_index_store()
 
 
 def main():
@@ -190,28 +194,41 @@ def select_method(method_options):
 def process_chunks_to_embed(selected_chunk_process_id, method, values):
 
     embedder = embedder_factory.create_embedder(method, **values)
+    chunks = embedder_repository.get_chunks_by_process_id(selected_chunk_process_id)
+    if embedder.get_params().get("storage_dtype") == "int8":
+        embedder.calibrate(
+            [compressor.decompress(chunk.chunk) for chunk in calibration_sample(chunks)]
+        )
+
     values["name"] = generate_default_name()
     values["embedding_dimensions"] = embedder.get_params().get(
         "embedding_dimension", None
     )
+    values.update(embedder.get_storage_params())
     embedding_process_id = embedder_repository.create_embedding_process(
         chunk_process_id=selected_chunk_process_id,
         method=method,
         parameters=values,
     )
 
-    chunks = embedder_repository.get_chunks_by_process_id(selected_chunk_process_id)
     progress_bar = st.progress(0)
     total_chunks = len(chunks)
 
+    batch_size = int(
+        values.get(
+            "batch_size",
+            embedder_config.base_field_definitions["batch_size"]["default"],
+        )
+    )
+
     try:
-        for i, chunk in enumerate(chunks):
-            text = compressor.decompress(chunk.chunk)
-            embedding = embedder.embed_chunks([(chunk.id, text)])[0][1]
-            embedder_repository.save_embedding(
-                embedding_process_id, chunk.id, embedding
+        for start in range(0, total_chunks, batch_size):
+            batch = chunks[start : start + batch_size]
+            embeddings = embedder.embed_chunks(
+                [(chunk.id, compressor.decompress(chunk.chunk)) for chunk in batch]
             )
-            update_progress_bar(progress_bar, i + 1, total_chunks)
+            embedder_repository.save_embeddings(embedding_process_id, embeddings)
+            update_progress_bar(progress_bar, start + len(batch), total_chunks)
 
     except Exception as e:
         handle_embedding_error(e, selected_chunk_process_id, embedding_process_id)
@@ -220,6 +237,12 @@ def process_chunks_to_embed(selected_chunk_process_id, method, values):
         progress_bar.empty()
 
 
+def calibration_sample(chunks):
+    sample_size = embedder_config.CALIBRATION_SAMPLE_SIZE
+    step = max(1, len(chunks) // sample_size)
+    return chunks[::step][:sample_size]
+
+
 def update_progress_bar(progress_bar, current_chunk, total_chunks):
     progress_percentage = int((current_chunk / total_chunks) * 100)
     progress_bar.progress(progress_percentage)
@@ -230,6 +253,7 @@ def handle_embedding_error(exception, chunk_process_id, embedding_process_id):
         f"Error embedding chunks for chunk process ID {chunk_process_id}: {exception}"
     )
     embedder_repository.delete_embedding_process(embedding_process_id)
+    faiss_index_store.invalidate(embedding_process_id)
 
 
 def manage_embedding_processes(selected_text_id):
@@ -316,6 +340,7 @@ def rename_embedding_session(session):
 def delete_embedding_process(session):
     try:
         embedder_repository.delete_embedding_process(session.id)
+        faiss_index_store.invalidate(session.id)
         st.rerun()
     except Exception as e:
         st.error(f"Failed to delete embedding process ID {session.id}: {e}")
@@ -335,4 +360,5 @@ def setup_session_state():
 
 
 if __name__ == "__main__":
-    main()
+    with database_session():
+        main()
@@ -1,4 +1,3 @@
-import pickle
 import streamlit as st
 from components.database.models import Domain
 from components.embedder.interfaces.embedder import Embedder
@@ -6,7 +5,6 @@ from components.embedder.interfaces.embedder_factory import EmbedderFactory
 from components.embedder.interfaces.embedder_repository import EmbedderRepository
 from components.retriever.interfaces.retriever import Retriever
 from components.retriever.interfaces.retriever_factory import RetrieverFactory
-from components.reader.interfaces.text_compressor import TextCompressor
 from logging import Logger
 from components.retriever.interfaces.retriever_repository import RetrieverRepository
 from injector import (
@@ -15,14 +13,12 @@ from injector import (
     get_embedder_factory,
     get_embedder_repository,
     get_logger,
-    get_compressor,
     get_retriever_config,
     get_retriever_factory,
     get_retriever_repository,
 )
 from pages.utils.embedder_retriever import (
     cleanup_texts_to_use,
-    convert_query_to_vector,
     count_selected_texts,
     create_retriever,
     display_embedder,
@@ -32,10 +28,12 @@ from pages.utils.embedder_retriever import (
     setup_texts_to_use,
 )
 from pages.utils.utils import (
+    database_session,
     extracted_text_to_label,
     setup_session_state_vars,
     select_domain_instance,
     setup_page,
+    text_to_label,
 )
 
 config = get_config()
@@ -46,7 +44,6 @@ retriever_repository: RetrieverRepository = get_retriever_repository()
 retriever_config = get_retriever_config()
 embedder_config = get_embedder_config()
 embedder_factory: EmbedderFactory = get_embedder_factory()
-compressor: TextCompressor = get_compressor()
 
 
 def main():
@@ -176,9 +173,7 @@ def query(embedder: Embedder, retriever: Retriever):
 def _run_query(query_text: str, embedder: Embedder, retriever: Retriever) -> None:
     if query_text:
         kwargs = {
-            "query_vector": pickle.loads(
-                convert_query_to_vector(query_text, embedder)[0][1]
-            ),
+            "query_vector": embedder.embed_text(query_text),
         }
         try:
             display_embeddings(retriever.retrieve(**kwargs))
@@ -190,31 +185,24 @@ def _run_query(query_text: str, embedder: Embedder, retriever: Retriever) -> Non
 
 def display_embeddings(embeddings: list):
     if embeddings:
-        for embedding_id, score in embeddings:
+        hydrated = retriever_repository.hydrate_hits(embeddings)
+        for embedding_id, score, chunk_id, index, text_content, name, type in hydrated:
             with st.container(border=True):
-                chunk_with_filename = (
-                    retriever_repository.get_chunk_by_embedding_id_with_text(
-                        embedding_id
-                    )
+                chunk_size = len(text_content)
+                st.write(f"Score: {score:.4f}, {text_to_label(name, type)}")
+                st.text_area(
+                    label=f"Chunk: {index + 1} (Size: {chunk_size} characters)",
+                    value=text_content,
+                    key=f"chunk_{chunk_id}_{index}",
+                    height=200,
+                    disabled=True,
+                )
+        found = {embedding_id for embedding_id, *_ in hydrated}
+        for embedding_id, score in embeddings:
+            if embedding_id not in found:
+                st.write(
+                    f"Embedding ID: {embedding_id}, Score: {score}, but chunk not found."
                 )
-                if chunk_with_filename:
-                    chunk, text_file_name = chunk_with_filename
-                    text_content = compressor.decompress(chunk.chunk)
-                    chunk_size = len(text_content)
-                    st.write(
-                        f"Score: {score:.4f}, {extracted_text_to_label(text_file_name)}"
-                    )
-                    st.text_area(
-                        label=f"Chunk: {chunk.index + 1} (Size: {chunk_size} characters)",
-                        value=text_content,
-                        key=f"chunk_{chunk.id}_{chunk.index}",
-                        height=200,
-                        disabled=True,
-                    )
-                else:
-                    st.write(
-                        f"Embedding ID: {embedding_id}, Score: {score}, but chunk not found."
-                    )
     else:
         st.info("No relevant embeddings found for your query.")
 
@@ -232,4 +220,5 @@ def setup_session_state():
 
 
 if __name__ == "__main__":
-    main()
+    with database_session():
+        main()
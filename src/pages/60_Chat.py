@@ -1,28 +1,26 @@
-import pickle
 from typing import Any, List, Tuple
 import streamlit as st
-from langchain_core.messages import AIMessage, HumanMessage
 from components.chatter.chatter_config import ModelOptionsFetchError
 from components.chatter.interfaces.chatter import Chatter
 from components.chatter.interfaces.chatter_factory import ChatterFactory
+from components.chatter.token_ledger import TokenLedger
 from components.database.models import Domain
 from components.embedder.interfaces.embedder import Embedder
 from components.embedder.interfaces.embedder_factory import EmbedderFactory
 from components.embedder.interfaces.embedder_repository import EmbedderRepository
 from components.retriever.interfaces.retriever import Retriever
 from components.retriever.interfaces.retriever_factory import RetrieverFactory
-from components.reader.interfaces.text_compressor import TextCompressor
 from logging import Logger
 from components.retriever.interfaces.retriever_repository import RetrieverRepository
 from injector import (
     get_chatter_config,
     get_chatter_factory,
     get_config,
+    get_context_assembler,
     get_embedder_config,
     get_embedder_factory,
     get_embedder_repository,
     get_logger,
-    get_compressor,
     get_retriever_config,
     get_retriever_factory,
     get_retriever_repository,
@@ -40,6 +38,7 @@ from pages.utils.embedder_retriever import (
 )
 from pages.utils.streamlit_form import StreamlitForm
 from pages.utils.utils import (
+    database_session,
     extracted_text_to_label,
     get_index,
     save_form_values_to_context,
@@ -57,7 +56,7 @@ retriever_repository: RetrieverRepository = get_retriever_repository()
 retriever_config = get_retriever_config()
 embedder_config = get_embedder_config()
 embedder_factory: EmbedderFactory = get_embedder_factory()
-compressor: TextCompressor = get_compressor()
+context_assembler = get_context_assembler()
 chatter_config = get_chatter_config()
 chatter_factory: ChatterFactory = get_chatter_factory()
 
@@ -283,6 +282,7 @@ def create_chatter_instance(
 ) -> Chatter:
     kwargs = {
         **st.session_state["context_chatter_values"],
+        "token_ledger": st.session_state["chat_token_ledger"],
     }
     try:
         return chatter_factory.create_chatter(
@@ -323,20 +323,7 @@ def chat(
     context_texts = []
     if user_query:
         if st.session_state.get("use_domain_context", False):
-            domain_context_embeddings = retriever.retrieve(
-                query_vector=embedder.embed_text(user_query)
-            )
-            embedding_ids = [
-                embedding_id for embedding_id, _ in domain_context_embeddings
-            ]
-            chunks_with_filenames = (
-                retriever_repository.get_chunks_by_embedding_ids_with_texts(
-                    embedding_ids
-                )
-            )
-            context_texts = [
-                compressor.decompress(chunk.chunk) for chunk, _ in chunks_with_filenames
-            ]
+            context_texts = retrieve_context_texts(embedder, retriever, user_query)
         with current_chat_placeholder.container(border=True):
             ai_placeholder_container = st.empty()
             with ai_placeholder_container:
@@ -345,6 +332,8 @@ def chat(
             with st.chat_message("User"):
                 st.write(user_query)
 
+        from langchain_core.messages import HumanMessage
+
         st.session_state["chat_history"].append(HumanMessage(content=user_query))
         try:
             if stream:
@@ -368,9 +357,29 @@ def chat(
     display_total_tokens_used(chatter, context_texts)
 
 
+def retrieve_context_texts(
+    embedder: Embedder, retriever: Retriever, user_query: str
+) -> List[Tuple[str, float]]:
+    domain_context_embeddings = retriever.retrieve(
+        query_vector=embedder.embed_text(user_query)
+    )
+    scores = dict(domain_context_embeddings)
+    if not scores:
+        return []
+    chunk_windows = retriever_repository.get_chunk_windows_by_embedding_ids(
+        list(scores), neighbors=st.session_state["context_neighbor_chunks"]
+    )
+    return context_assembler.assemble(
+        [
+            (chunk_process_id, index, text, scores.get(embedding_id))
+            for embedding_id, chunk_process_id, index, text in chunk_windows
+        ]
+    )
+
+
 def chat_with_streaming_on(
     chatter: Chatter,
-    context_texts: List[str] = None,
+    context_texts: List[Tuple[str, float]] = None,
     ai_placeholder=None,
 ):
     original_generator = chatter.chat(
@@ -390,12 +399,14 @@ def generator_wrapper(chat_stream_generator):
         streamed_responses += response_part
         yield response_part
 
+    from langchain_core.messages import AIMessage
+
     st.session_state["chat_history"].append(AIMessage(content=streamed_responses))
 
 
 def chat_with_streaming_off(
     chatter: Chatter,
-    context_texts: List[str] = None,
+    context_texts: List[Tuple[str, float]] = None,
     ai_placeholder=None,
 ):
     response = chatter.chat(
@@ -403,6 +414,8 @@ def chat_with_streaming_off(
     )
     with ai_placeholder:
         st.write(response)
+    from langchain_core.messages import AIMessage
+
     st.session_state["chat_history"].append(AIMessage(content=response))
 
 
@@ -410,10 +423,10 @@ def display_messages():
     current_chat_placeholder = st.empty()
     with st.container(border=True):
         for message in reversed(st.session_state["chat_history"]):
-            if isinstance(message, HumanMessage):
+            if message.type == "human":
                 with st.chat_message("User"):
                     st.write(message.content)
-            elif isinstance(message, AIMessage):
+            elif message.type == "ai":
                 with st.chat_message("AI"):
                     st.write(message.content)
     return current_chat_placeholder
@@ -438,6 +451,7 @@ def manage_history(chatter: Chatter):
         if st.session_state.get("use_history") and st.session_state["chat_history"]:
             if st.button("Clear history"):
                 st.session_state["chat_history"] = []
+                st.session_state["chat_token_ledger"].clear()
                 st.rerun()
 
 
@@ -457,15 +471,14 @@ def display_history_info(chatter: Chatter):
                 f" ({truncation_count} truncated)" if truncation_count > 0 else ""
             )
             context_window = chatter.get_params().get("context_window", 0)
+            message_tokens = chatter.get_message_token_counts(
+                st.session_state.get("chat_history", [])
+            )
             tokens_left = chatter.get_num_tokens_left(
-                chatter.convert_messages_for_api(
-                    st.session_state.get("chat_history", [])
-                )
+                history, message_tokens=message_tokens
             )
             # logger.info(st.session_state.get("chat_history"))
-            st.write(
-                f"Tokens used: {chatter.get_num_tokens(str(chatter.convert_messages_for_api(st.session_state.get('chat_history', []))))}"
-            )
+            st.write(f"Tokens used: {sum(message_tokens)}")
             st.info(messages_info)
             if isinstance(tokens_left, int) and context_window > 0:
                 percentage_left = (tokens_left / context_window) * 100
@@ -488,9 +501,9 @@ def log_last_two_messages():
 
     readable_messages = []
     for message in last_two_messages:
-        if isinstance(message, HumanMessage):
+        if message.type == "human":
             prefix = "User: "
-        elif isinstance(message, AIMessage):
+        elif message.type == "ai":
             prefix = "AI: "
         else:
             prefix = "Unknown: "
@@ -506,7 +519,7 @@ def log_last_two_messages():
 
 def manage_domain_context(
     chatter: Chatter,
-    context_texts: List[str] = None,
+    context_texts: List[Tuple[str, float]] = None,
 ):
     with st.sidebar.container(border=True):
         display_domain_context(chatter=chatter, context_texts=context_texts)
@@ -518,11 +531,22 @@ def manage_domain_context(
             ),
             value=st.session_state["context_use_domain_context"],
         )
+        st.number_input(
+            "Neighbor chunks",
+            min_value=0,
+            max_value=10,
+            key="neighbor_chunks",
+            help="Chunks to add before and after each retrieved chunk.",
+            on_change=lambda: st.session_state.update(
+                context_neighbor_chunks=st.session_state["neighbor_chunks"]
+            ),
+            value=st.session_state["context_neighbor_chunks"],
+        )
 
 
 def display_domain_context(
     chatter: Chatter,
-    context_texts: List[str] = None,
+    context_texts: List[Tuple[str, float]] = None,
 ):
     try:
         num_context_texts = len(context_texts)
@@ -539,14 +563,20 @@ def display_domain_context(
         st.error(f"An error occurred: {e}")
 
 
-def display_total_tokens_used(chatter: Chatter, context_texts: List[str] = None):
+def display_total_tokens_used(
+    chatter: Chatter, context_texts: List[Tuple[str, float]] = None
+):
     try:
         total_tokens = chatter.get_total_tokens_used()
         calc_total_tokens = chatter.calculate_total_tokens(
             messages=st.session_state.get("chat_history"), context_texts=context_texts
         )
         if total_tokens > 0:
+            token_usage = chatter.get_token_usage()
             st.sidebar.write(f"Total tokens used in the last operation: {total_tokens}")
+            st.sidebar.write(
+                f"Prompt tokens: {token_usage['prompt_tokens']}, completion tokens: {token_usage['completion_tokens']}"
+            )
             st.sidebar.write(f"Total calculated tokens: {calc_total_tokens}")
     except Exception as e:
         st.sidebar.error(f"An error occurred while fetching total tokens used: {e}")
@@ -563,11 +593,14 @@ def setup_session_state():
             ("texts_to_use", {}),
             ("context_use_history", True),
             ("chat_history", []),
+            ("chat_token_ledger", TokenLedger()),
             ("use_domain_context", True),
             ("context_use_domain_context", True),
+            ("context_neighbor_chunks", config.retriever_context_neighbors),
         ]
     )
 
 
 if __name__ == "__main__":
-    main()
+    with database_session():
+        main()
@@ -16,6 +16,7 @@ from injector import (
     get_embedder_repository,
     get_logger,
     get_compressor,
+    get_retriever_cache,
     get_retriever_config,
     get_retriever_factory,
     get_retriever_repository,
@@ -36,6 +37,7 @@ retriever_config = get_retriever_config()
 embedder_config = get_embedder_config()
 embedder_factory: EmbedderFactory = get_embedder_factory()
 compressor: TextCompressor = get_compressor()
+retriever_cache = get_retriever_cache()
 
 
 def setup_texts_to_use(selected_domain, extracted_texts):
@@ -240,12 +242,14 @@ def display_retriever(retriever, expanded: bool = True):
         for key, value in params.items():
             markdown_table += f"{key} | {value}\n"
         st.markdown(markdown_table, unsafe_allow_html=True)
-        st.write("")
+        cache_stats = retriever_cache.stats()
+        st.caption(
+            f"Cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+            f"{cache_stats['evictions']} evictions, "
+            f"{cache_stats['bytes'] / 1024 / 1024:.1f} of "
+            f"{cache_stats['max_bytes'] / 1024 / 1024:.0f} MB"
+        )
 
     if st.button("🔄 Change retriever"):
         st.session_state["change_retriever"] = True
         st.rerun()
-
-
-def convert_query_to_vector(query: str, embedder: Embedder) -> list:
-    return embedder.embed_chunks([(0, query)])
@@ -1,11 +1,12 @@
 import os
+from contextlib import contextmanager
 import streamlit as st
 from PIL import Image
 from datetime import datetime
 from datetime import datetime
 from typing import Dict, List, Tuple, Union, Any
 from components.database.models import Domain, ExtractedText
-from injector import get_config, get_logger
+from injector import get_config, get_connector, get_logger
 from operator import lt, le, gt, ge, eq, ne
 
 config = get_config()
@@ -22,6 +23,18 @@ def setup_page(page_title="Docuchat"):
     )
 
 
+@contextmanager
+def database_session():
+    """
+    Scope database work to one run of a page: the session used by all
+    repositories is closed when the run ends, including on st.rerun/st.stop.
+    """
+    try:
+        yield
+    finally:
+        get_connector().remove_session()
+
+
 def show_messages():
     message, message_type = st.session_state["message"]
     if message:
@@ -109,7 +122,11 @@ def join_filename(base_name: str, extension: str) -> str:
 
 
 def extracted_text_to_label(extracted_text: ExtractedText):
-    return f"{extracted_text.name} ({extracted_text.type.lstrip('.')})"
+    return text_to_label(extracted_text.name, extracted_text.type)
+
+
+def text_to_label(name: str, type: str) -> str:
+    return f"{name} ({type.lstrip('.')})"
 
 
 def filename_to_label(filename: str) -> str:
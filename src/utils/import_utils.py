@@ -0,0 +1,9 @@
+from functools import lru_cache
+from importlib import import_module
+
+
+@lru_cache(maxsize=None)
+def import_class(path: str):
+    """Import a class given as "package.module:ClassName", once, on first use."""
+    module_name, _, class_name = path.partition(":")
+    return getattr(import_module(module_name), class_name)
@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from test_all_pages import find_streamlit_pages
+
+PAGE_IMPORT_BUDGET_SECONDS = 1.0
+HEAVY_MODULES = (
+    "faiss",
+    "groq",
+    "langchain",
+    "openai",
+    "sentence_transformers",
+    "sklearn",
+    "spacy",
+    "torch",
+    "transformers",
+)
+
+# Loads a page without running main(); streamlit itself is imported first so
+# only the page's own imports and module-level setup count against the budget.
+MEASURE_PAGE_IMPORT = """
+import json, runpy, sys, time
+import streamlit
+start = time.perf_counter()
+runpy.run_path(sys.argv[1], run_name="page_import")
+print(json.dumps({"seconds": time.perf_counter() - start, "modules": list(sys.modules)}))
+"""
+
+
+def measure_page_import(page_path):
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_PAGE_IMPORT, page_path],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(["src", *sys.path])},
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "page_path", ["src/Main.py", *find_streamlit_pages("src/pages")]
+)
+def test_page_import_time(page_path):
+    measurement = measure_page_import(page_path)
+
+    heavy_modules = [
+        module
+        for module in measurement["modules"]
+        if module.split(".")[0].startswith(HEAVY_MODULES)
+    ]
+    assert not heavy_modules, f"{page_path} imports {sorted(set(heavy_modules))}"
+    assert measurement["seconds"] < PAGE_IMPORT_BUDGET_SECONDS
@@ -0,0 +1,137 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytz
+from sqlalchemy.dialects import mysql
+
+from components.chatter.chatter_config import ChatterConfig
+from components.chatter.sqlAlchemy_chatter_repository import (
+    SqlalchemyChatterRepository,
+)
+from components.database.models import ModelSource
+
+
+def cached_model(model_id, age=timedelta(0)):
+    model = MagicMock()
+    model.model_id = model_id
+    model.updated_at = datetime.now(pytz.utc) - age
+    return model
+
+
+class TestChatterConfig(unittest.TestCase):
+    def setUp(self):
+        ChatterConfig._refresh_threads.clear()
+        ChatterConfig._refresh_attempts.clear()
+        self.repository = MagicMock()
+        self.logger = MagicMock()
+        env = patch(
+            "components.chatter.chatter_config.getenv",
+            side_effect=lambda key, default=None: (
+                "key" if key.endswith("_API_KEY") else default
+            ),
+        )
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self):
+        for thread in list(ChatterConfig._refresh_threads.values()):
+            thread.join(timeout=5)
+
+    @patch("requests.get")
+    def test_fresh_cache_is_used_without_refresh(self, mock_get):
+        self.repository.list_model_caches_by_source.return_value = [
+            cached_model("llama3-8b-8192")
+        ]
+
+        config = ChatterConfig(self.repository, self.logger)
+
+        self.assertEqual(config.groq_model_options, ["llama3-8b-8192"])
+        mock_get.assert_not_called()
+
+    @patch("requests.get")
+    def test_stale_cache_returns_immediately_and_refreshes_in_background(
+        self, mock_get
+    ):
+        self.repository.list_model_caches_by_source.return_value = [
+            cached_model("old-model", age=timedelta(days=2))
+        ]
+        released = threading.Event()
+        mock_get.side_effect = lambda *args, **kwargs: released.wait(5) and MagicMock(
+            json=MagicMock(return_value={"data": [{"id": "new-model"}]})
+        )
+
+        config = ChatterConfig(self.repository, self.logger)
+
+        self.assertEqual(config.groq_model_options, ["old-model"])
+        self.repository.replace_model_caches.assert_not_called()
+        released.set()
+        for thread in list(ChatterConfig._refresh_threads.values()):
+            thread.join(timeout=5)
+        self.repository.replace_model_caches.assert_any_call(
+            ModelSource.Groq, {"new-model": {"id": "new-model"}}
+        )
+        self.assertEqual(self.repository.remove_session.call_count, 2)
+
+    @patch("requests.get")
+    def test_concurrent_refreshes_are_coalesced(self, mock_get):
+        self.repository.list_model_caches_by_source.return_value = []
+        released = threading.Event()
+        mock_get.side_effect = lambda *args, **kwargs: released.wait(5) and MagicMock(
+            json=MagicMock(return_value={"data": []})
+        )
+
+        ChatterConfig(self.repository, self.logger)
+        ChatterConfig(self.repository, self.logger)
+        released.set()
+        for thread in list(ChatterConfig._refresh_threads.values()):
+            thread.join(timeout=5)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.get")
+    def test_failed_refresh_is_not_retried_immediately(self, mock_get):
+        self.repository.list_model_caches_by_source.return_value = []
+        mock_get.side_effect = ValueError("bad response")
+
+        ChatterConfig(self.repository, self.logger)
+        for thread in list(ChatterConfig._refresh_threads.values()):
+            thread.join(timeout=5)
+        ChatterConfig(self.repository, self.logger)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.repository.replace_model_caches.assert_not_called()
+
+
+class TestSqlalchemyChatterRepository(unittest.TestCase):
+    def setUp(self):
+        self.connector = MagicMock()
+        self.session = self.connector.get_session.return_value
+        self.repository = SqlalchemyChatterRepository(self.connector, MagicMock())
+
+    def test_replace_model_caches_single_upsert_and_commit(self):
+        self.repository.replace_model_caches(
+            ModelSource.Groq, {"a": {"id": "a"}, "b": {"id": "b"}}
+        )
+
+        self.session.execute.assert_called_once()
+        self.session.commit.assert_called_once()
+        statement = self.session.execute.call_args[0][0]
+        sql = str(statement.compile(dialect=mysql.dialect()))
+        self.assertIn("ON DUPLICATE KEY UPDATE", sql)
+        self.assertEqual(sql.count("(%s, %s, %s)"), 2)
+
+    def test_replace_model_caches_rolls_back_on_error(self):
+        self.session.execute.side_effect = RuntimeError("DB error")
+        with self.assertRaises(RuntimeError):
+            self.repository.replace_model_caches(ModelSource.Groq, {"a": {}})
+        self.session.rollback.assert_called_once()
+
+    def test_remove_session_delegates_to_connector(self):
+        self.repository.remove_session()
+        self.connector.remove_session.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 from components.chatter.groq_chat_text_processor import GroqChatTextProcessor
+from components.chatter.token_count_cache import TokenCountCache
 
 
 class TestGroqChatTextProcessor(unittest.TestCase):
@@ -28,6 +29,166 @@ class TestGroqChatTextProcessor(unittest.TestCase):
         token_count = self.processor.get_num_tokens(text)
         self.assertEqual(token_count, expected_token_count)
 
+    def test_reduce_texts_batch_encodes_uncached_texts_once(self):
+        self.mock_tokenizer.side_effect = lambda texts: {
+            "input_ids": [text.split() for text in texts]
+        }
+        messages = [{"role": "user", "content": "hello there"}] * 2
+        context_texts = ["one two", "three four five"]
+
+        first = self.processor.reduce_texts(messages, context_texts, 0)
+        second = self.processor.reduce_texts(messages, context_texts, 0)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[2], 2 + 3 + 2 * len(str(messages[0]).split()))
+        self.mock_tokenizer.assert_called_once_with(
+            ["one two", "three four five", str(messages[0])]
+        )
+        self.mock_tokenizer.encode.assert_not_called()
+
+    def test_reduce_texts_drops_oldest_texts_beyond_window(self):
+        self.processor.context_window = 6
+        self.mock_tokenizer.side_effect = lambda texts: {
+            "input_ids": [text.split() for text in texts]
+        }
+
+        _, reduced_texts, total_tokens = self.processor.reduce_texts(
+            [], ["a b c", "d e", "f g h"], 0
+        )
+
+        self.assertEqual(reduced_texts, ["d e", "f g h"])
+        self.assertEqual(total_tokens, 5)
+
+    def test_token_counts_are_shared_through_the_cache(self):
+        cache = TokenCountCache(max_entries=1)
+        self.mock_tokenizer.name_or_path = "google/gemma-7b-it"
+        self.mock_tokenizer.encode.return_value = [1, 2, 3]
+        processor = GroqChatTextProcessor(
+            tokenizer=self.mock_tokenizer, token_count_cache=cache
+        )
+
+        processor.get_num_tokens("first")
+        GroqChatTextProcessor(
+            tokenizer=self.mock_tokenizer, token_count_cache=cache
+        ).get_num_tokens("first")
+        processor.get_num_tokens("second")
+        processor.get_num_tokens("first")
+
+        self.assertEqual(self.mock_tokenizer.encode.call_count, 3)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_scored_texts_are_packed_by_relevance_per_token(self):
+        self.processor.context_window = 6
+        self.processor.truncate_context = False
+        self.mock_tokenizer.side_effect = lambda texts: {
+            "input_ids": [text.split() for text in texts]
+        }
+
+        _, reduced_texts, total_tokens = self.processor.reduce_texts(
+            [], [("a b c d", 0.9), ("e f g", 0.3), ("h i", 0.8)], 0
+        )
+
+        self.assertEqual(reduced_texts, ["a b c d", "h i"])
+        self.assertEqual(total_tokens, 6)
+
+    def test_single_best_chunk_beats_many_weak_ones(self):
+        self.processor.context_window = 4
+        self.processor.truncate_context = False
+        self.mock_tokenizer.side_effect = lambda texts: {
+            "input_ids": [text.split() for text in texts]
+        }
+
+        _, reduced_texts, _ = self.processor.reduce_texts(
+            [], [("a", 0.1), ("b", 0.1), ("c d e f", 0.9)], 0
+        )
+
+        self.assertEqual(reduced_texts, ["c d e f"])
+
+    def test_mixed_sign_cosine_scores_keep_every_chunk_that_fits(self):
+        self.processor.context_window = 4096
+        self.processor.truncate_context = False
+        self.mock_tokenizer.side_effect = lambda texts: {
+            "input_ids": [text.split() for text in texts]
+        }
+        chunks = [" ".join(["w"] * 50) + f" {i}" for i in range(3)]
+
+        _, reduced_texts, _ = self.processor.reduce_texts(
+            [], list(zip(chunks, [0.30, -0.10, -0.15])), 0
+        )
+
+        self.assertEqual(reduced_texts, chunks)
+
+    def test_non_positive_scores_do_not_trigger_the_single_best_swap(self):
+        self.processor.context_window = 4
+        self.processor.truncate_context = False
+        self.mock_tokenizer.side_effect = lambda texts: {
+            "input_ids": [text.split() for text in texts]
+        }
+
+        _, reduced_texts, _ = self.processor.reduce_texts(
+            [], [("a b", 0.0), ("c d", -0.2), ("e f g", -0.1)], 0
+        )
+
+        self.assertEqual(reduced_texts, ["a b", "c d"])
+
+    def test_best_remaining_chunk_is_truncated_into_leftover_budget(self):
+        processor = GroqChatTextProcessor(
+            tokenizer=self.mock_tokenizer, context_window=40
+        )
+        words = [f"w{i}" for i in range(50)]
+        self.mock_tokenizer.side_effect = lambda texts: {
+            "input_ids": [text.split() for text in texts]
+        }
+        self.mock_tokenizer.encode.side_effect = lambda text, **kwargs: text.split()
+        self.mock_tokenizer.decode.side_effect = lambda ids, **kwargs: " ".join(ids)
+
+        _, reduced_texts, total_tokens = processor.reduce_texts(
+            [], [(" ".join(words), 0.9), ("x y", 0.2)], 0
+        )
+
+        self.assertEqual(reduced_texts, [" ".join(words[:38]), "x y"])
+        self.assertEqual(total_tokens, 40)
+
+    def test_recency_packing_keeps_the_best_first_passages(self):
+        processor = GroqChatTextProcessor(
+            tokenizer=self.mock_tokenizer,
+            context_window=5,
+            context_packing="recency",
+            truncate_context=False,
+        )
+        self.mock_tokenizer.side_effect = lambda texts: {
+            "input_ids": [text.split() for text in texts]
+        }
+
+        _, reduced_texts, _ = processor.reduce_texts(
+            [], [("a b c", 0.9), ("d e", 0.5), ("f g h", 0.2)], 0
+        )
+
+        self.assertEqual(reduced_texts, ["a b c", "d e"])
+
+    def test_truncation_is_reused_across_reductions_in_a_turn(self):
+        processor = GroqChatTextProcessor(
+            tokenizer=self.mock_tokenizer, context_window=40
+        )
+        words = " ".join(f"w{i}" for i in range(50))
+        self.mock_tokenizer.side_effect = lambda texts: {
+            "input_ids": [text.split() for text in texts]
+        }
+        self.mock_tokenizer.encode.side_effect = lambda text, **kwargs: text.split()
+        self.mock_tokenizer.decode.side_effect = lambda ids, **kwargs: " ".join(ids)
+
+        first = processor.reduce_texts([], [(words, 0.9)], 0)
+        second = processor.reduce_texts([], [(words, 0.9)], 0)
+
+        self.assertEqual(first, second)
+        self.mock_tokenizer.decode.assert_called_once()
+
+    def test_unknown_packing_strategy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            GroqChatTextProcessor(
+                tokenizer=self.mock_tokenizer, context_packing="random"
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,158 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from components.chatter.groq_chat_text_processor import GroqChatTextProcessor
+from components.chatter.groq_chatter import GroqChatter
+from components.chatter.token_ledger import TokenLedger
+
+
+class TestGroqChatter(unittest.TestCase):
+    def setUp(self):
+        self.tokenizer = MagicMock()
+        self.tokenizer.name_or_path = None
+        self.tokenizer.encode.side_effect = lambda text: text.split()
+        self.token_ledger = TokenLedger()
+        self.client_pool = MagicMock()
+        self.chatter = GroqChatter(
+            logger=MagicMock(),
+            chat_text_processor=GroqChatTextProcessor(
+                tokenizer=self.tokenizer, context_window=4096
+            ),
+            token_ledger=self.token_ledger,
+            client_pool=self.client_pool,
+        )
+
+    def test_appending_a_message_only_tokenizes_that_message(self):
+        history = [HumanMessage(content="hello"), AIMessage(content="hi there")]
+        self.chatter.chat(messages=history, dry_run=True)
+        self.tokenizer.encode.reset_mock()
+
+        history.append(HumanMessage(content="how are you"))
+        self.chatter.chat(messages=history, dry_run=True)
+
+        self.tokenizer.encode.assert_called_once_with(
+            str({"role": "user", "content": "how are you"})
+        )
+
+    def test_ledger_counts_match_reduced_total(self):
+        history = [HumanMessage(content="hello"), AIMessage(content="hi there")]
+
+        self.chatter.chat(messages=history, dry_run=True)
+
+        self.assertEqual(
+            self.chatter.get_total_tokens_used(),
+            sum(self.chatter.get_message_token_counts(history)),
+        )
+
+    def test_tokens_left_uses_ledger_counts(self):
+        history = [HumanMessage(content="hello"), AIMessage(content="hi there")]
+        message_tokens = self.chatter.get_message_token_counts(history)
+        self.tokenizer.encode.reset_mock()
+
+        tokens_left = self.chatter.get_num_tokens_left(
+            self.chatter.convert_messages_for_api(history),
+            message_tokens=message_tokens,
+        )
+
+        self.assertEqual(tokens_left, 4096 - sum(message_tokens))
+        self.tokenizer.encode.assert_not_called()
+
+    def test_calculate_total_tokens_adds_latest_ai_message(self):
+        history = [HumanMessage(content="hello"), AIMessage(content="hi there")]
+
+        total_tokens = self.chatter.calculate_total_tokens(messages=history)
+
+        self.assertEqual(
+            total_tokens, sum(self.chatter.get_message_token_counts(history))
+        )
+
+    def test_stream_uses_provider_usage_without_tokenizing_deltas(self):
+        self.client_pool.get.return_value.chat.completions.create.return_value = iter(
+            [
+                self._chunk("Hello"),
+                self._chunk(" world"),
+                self._chunk(
+                    None,
+                    x_groq=SimpleNamespace(
+                        usage=SimpleNamespace(prompt_tokens=42, completion_tokens=2)
+                    ),
+                ),
+            ]
+        )
+        history = [HumanMessage(content="hello")]
+        self.chatter.get_message_token_counts(history)
+        self.tokenizer.encode.reset_mock()
+
+        response = "".join(self.chatter.chat(messages=history))
+
+        self.assertEqual(response, "Hello world")
+        self.tokenizer.encode.assert_not_called()
+        self.assertEqual(
+            self.chatter.get_token_usage(),
+            {"prompt_tokens": 42, "completion_tokens": 2, "total_tokens": 44},
+        )
+
+    def test_stream_without_usage_counts_assembled_response_once(self):
+        self.client_pool.get.return_value.chat.completions.create.return_value = iter(
+            [self._chunk("one two"), self._chunk(" three")]
+        )
+        history = [HumanMessage(content="hello")]
+        self.chatter.get_message_token_counts(history)
+        self.tokenizer.encode.reset_mock()
+
+        "".join(self.chatter.chat(messages=history))
+
+        self.tokenizer.encode.assert_called_once_with("one two three")
+        usage = self.chatter.get_token_usage()
+        self.assertEqual(usage["completion_tokens"], 3)
+        self.assertEqual(usage["total_tokens"], usage["prompt_tokens"] + 3)
+
+    @staticmethod
+    def _chunk(content, x_groq=None):
+        return SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=content))],
+            usage=None,
+            x_groq=x_groq,
+        )
+
+
+class TestTokenLedger(unittest.TestCase):
+    def test_messages_are_counted_once_by_identity(self):
+        ledger = TokenLedger()
+        first, second = HumanMessage(content="a"), HumanMessage(content="a")
+        count = MagicMock(side_effect=lambda messages: [1] * len(messages))
+
+        self.assertEqual(ledger.get_counts([first], count), [1])
+        self.assertEqual(ledger.get_counts([first, second], count), [1, 1])
+
+        self.assertEqual(count.call_count, 2)
+        self.assertEqual(count.call_args[0][0], [second])
+
+    def test_switching_tokenizer_recounts_messages(self):
+        ledger = TokenLedger()
+        message = HumanMessage(content="a b")
+        ledger.get_counts([message], MagicMock(return_value=[2]), "tokenizer-a")
+
+        counts = ledger.get_counts(
+            [message], MagicMock(return_value=[3]), "tokenizer-b"
+        )
+
+        self.assertEqual(counts, [3])
+
+    def test_clear_forgets_counts(self):
+        ledger = TokenLedger()
+        message = HumanMessage(content="a")
+        count = MagicMock(return_value=[1])
+        ledger.get_counts([message], count)
+
+        ledger.clear()
+        ledger.get_counts([message], count)
+
+        self.assertEqual(count.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from components.chatter.groq_client_pool import GroqClientPool
+
+
+class StubChatCompletionsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_POST(self):
+        self.connections.add(self.client_address)
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps(
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "stub",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "pong"},
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 1,
+                    "completion_tokens": 1,
+                    "total_tokens": 2,
+                },
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestGroqClientPool(unittest.TestCase):
+    def setUp(self):
+        StubChatCompletionsHandler.connections = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubChatCompletionsHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.pool = GroqClientPool(
+            base_url=f"http://127.0.0.1:{self.server.server_port}", max_retries=0
+        )
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_client_is_shared_per_api_key(self):
+        self.assertIs(self.pool.get("key-a"), self.pool.get("key-a"))
+        self.assertIsNot(self.pool.get("key-a"), self.pool.get("key-b"))
+
+    def test_chat_turns_reuse_one_keep_alive_connection(self):
+        for _ in range(3):
+            response = self.pool.get("key-a").chat.completions.create(
+                messages=[{"role": "user", "content": "ping"}], model="stub"
+            )
+            self.assertEqual(response.choices[0].message.content, "pong")
+
+        self.assertEqual(len(StubChatCompletionsHandler.connections), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from components.chatter.tokenizer_cache import TokenizerCache
+
+
+@patch("transformers.AutoTokenizer.from_pretrained")
+class TestTokenizerCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TokenizerCache(
+            cache_dir="/models", token="hf-token", max_size=2, logger=MagicMock()
+        )
+
+    def test_tokenizer_is_loaded_once_from_local_cache(self, from_pretrained):
+        first = self.cache.get("google/gemma-7b-it")
+        second = self.cache.get("google/gemma-7b-it")
+
+        self.assertIs(first, second)
+        from_pretrained.assert_called_once_with(
+            pretrained_model_name_or_path="google/gemma-7b-it",
+            cache_dir="/models",
+            local_files_only=True,
+        )
+
+    def test_missing_tokenizer_is_downloaded(self, from_pretrained):
+        tokenizer = MagicMock()
+        from_pretrained.side_effect = [OSError("not cached"), tokenizer]
+
+        self.assertIs(self.cache.get("google/gemma-7b-it"), tokenizer)
+        self.assertEqual(
+            from_pretrained.call_args,
+            call(
+                pretrained_model_name_or_path="google/gemma-7b-it",
+                cache_dir="/models",
+                token="hf-token",
+            ),
+        )
+
+    def test_failed_load_releases_its_identifier_lock(self, from_pretrained):
+        from_pretrained.side_effect = OSError("offline")
+
+        with self.assertRaises(OSError):
+            self.cache.get("unknown/model")
+
+        self.assertEqual(self.cache._identifier_locks, {})
+
+    def test_least_recently_used_tokenizer_is_evicted(self, from_pretrained):
+        self.cache.get("a")
+        self.cache.get("b")
+        self.cache.get("a")
+        self.cache.get("c")
+
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertIn("c", self.cache)
+
+    def test_preload_loads_in_background(self, from_pretrained):
+        thread = self.cache.preload("google/gemma-7b-it")
+        thread.join(timeout=5)
+
+        self.assertIn("google/gemma-7b-it", self.cache)
+        self.assertIsNone(self.cache.preload("google/gemma-7b-it"))
+
+    def test_failed_preload_is_logged(self, from_pretrained):
+        from_pretrained.side_effect = OSError("offline")
+
+        self.cache.preload("google/gemma-7b-it").join(timeout=5)
+
+        self.assertNotIn("google/gemma-7b-it", self.cache)
+        self.cache.logger.warning.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import MagicMock
+from sqlalchemy.exc import SQLAlchemyError
+from components.chunker.sqlAlchemy_chunker_repository import (
+    SqlAlchemyChunkerRepository,
+)
+from components.reader.zlib_text_compressor import ZlibTextCompressor
+from logging import Logger as StandardLogger
+
+
+class TestSqlAlchemyChunkerRepository(unittest.TestCase):
+    def setUp(self):
+        self.mock_connector = MagicMock()
+        self.mock_connector.get_session.return_value = MagicMock()
+        self.mock_logger = MagicMock(spec=StandardLogger)
+        self.compressor = ZlibTextCompressor()
+        self.chunker_repository = SqlAlchemyChunkerRepository(
+            connector=self.mock_connector,
+            compressor=self.compressor,
+            logger=self.mock_logger,
+            batch_size=2,
+        )
+
+    def test_save_chunks_streams_batches_and_commits_once(self):
+        session = self.mock_connector.get_session.return_value
+        chunks = (chunk for chunk in enumerate(["a", "b", "c", "d", "e"]))
+
+        self.chunker_repository.save_chunks(3, chunks)
+
+        self.assertEqual(session.execute.call_count, 3)
+        session.commit.assert_called_once()
+        rows = [
+            row for call in session.execute.call_args_list for row in call.args[1]
+        ]
+        self.assertEqual([row["index"] for row in rows], [0, 1, 2, 3, 4])
+        self.assertTrue(all(row["chunk_process_id"] == 3 for row in rows))
+        self.assertEqual(self.compressor.decompress(rows[4]["chunk"]), "e")
+
+    def test_save_chunks_empty_iterable(self):
+        session = self.mock_connector.get_session.return_value
+        self.chunker_repository.save_chunks(3, iter([]))
+        session.execute.assert_not_called()
+        session.commit.assert_called_once()
+
+    def test_save_chunks_rolls_back_on_error(self):
+        session = self.mock_connector.get_session.return_value
+        session.execute.side_effect = SQLAlchemyError("DB error")
+        with self.assertRaises(SQLAlchemyError):
+            self.chunker_repository.save_chunks(3, [(0, "a")])
+        session.rollback.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
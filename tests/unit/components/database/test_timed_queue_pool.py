@@ -0,0 +1,32 @@
+import sqlite3
+import unittest
+from components.database.timed_queue_pool import TimedQueuePool
+
+
+class TestTimedQueuePool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = TimedQueuePool(
+            lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=1
+        )
+
+    def tearDown(self):
+        self.pool.dispose()
+
+    def test_metrics_track_checkouts_and_overflow(self):
+        first = self.pool.connect()
+        second = self.pool.connect()
+
+        metrics = self.pool.metrics()
+
+        self.assertEqual(metrics["checked_out"], 2)
+        self.assertEqual(metrics["overflow"], 1)
+        self.assertEqual(metrics["checkouts"], 2)
+        self.assertGreaterEqual(metrics["max_wait_ms"], metrics["average_wait_ms"])
+        first.close()
+        second.close()
+        self.assertEqual(self.pool.metrics()["checked_out"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import numpy as np
+from components.embedder.embedding_quantizer import EmbeddingQuantizer
+from components.embedder.embedding_serializer import EmbeddingSerializer
+
+
+def top_k(matrix, queries, k):
+    normalized = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.argsort(-(queries @ normalized.T), axis=1)[:, :k]
+
+
+def recall_at_k(reference, candidate):
+    hits = sum(len(set(ref) & set(cand)) for ref, cand in zip(reference, candidate))
+    return hits / reference.size
+
+
+class TestEmbeddingQuantizer(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        centers = rng.normal(size=(20, 384))
+        self.embeddings = (
+            centers[rng.integers(0, 20, size=2000)] + rng.normal(size=(2000, 384))
+        ).astype(np.float32)
+        self.embeddings /= np.linalg.norm(self.embeddings, axis=1, keepdims=True)
+        self.queries = self.embeddings[rng.integers(0, 2000, size=50)]
+        self.queries /= np.linalg.norm(self.queries, axis=1, keepdims=True)
+
+    def _round_trip(self, quantizer):
+        blobs = [
+            EmbeddingSerializer.serialize(row)
+            for row in quantizer.quantize(self.embeddings)
+        ]
+        stored = EmbeddingQuantizer.from_parameters(
+            {"storage_dtype": quantizer.storage_dtype, **quantizer.get_params()}
+        )
+        return stored.dequantize(EmbeddingSerializer.deserialize_many(blobs))
+
+    def test_float16_recall_against_float32(self):
+        restored = self._round_trip(EmbeddingQuantizer("float16"))
+        recall = recall_at_k(
+            top_k(self.embeddings, self.queries, 10),
+            top_k(restored, self.queries, 10),
+        )
+        self.assertGreaterEqual(recall, 0.99)
+
+    def test_int8_recall_against_float32(self):
+        quantizer = EmbeddingQuantizer("int8")
+        quantizer.fit(self.embeddings[::4])
+        restored = self._round_trip(quantizer)
+
+        self.assertLess(np.abs(restored - self.embeddings).mean(), 0.005)
+        recall = recall_at_k(
+            top_k(self.embeddings, self.queries, 10),
+            top_k(restored, self.queries, 10),
+        )
+        self.assertGreaterEqual(recall, 0.9)
+
+    def test_int8_blob_is_quarter_size(self):
+        quantizer = EmbeddingQuantizer("int8")
+        quantizer.fit(self.embeddings)
+        int8_blob = EmbeddingSerializer.serialize(
+            quantizer.quantize(self.embeddings[:1])[0]
+        )
+        float32_blob = EmbeddingSerializer.serialize(self.embeddings[0])
+        header = EmbeddingSerializer.HEADER.size
+        self.assertEqual((len(float32_blob) - header) // (len(int8_blob) - header), 4)
+
+    def test_int8_requires_calibration(self):
+        with self.assertRaises(RuntimeError):
+            EmbeddingQuantizer("int8").quantize(self.embeddings)
+
+    def test_unsupported_storage_dtype(self):
+        with self.assertRaises(ValueError):
+            EmbeddingQuantizer("int4")
+
+
+if __name__ == "__main__":
+    unittest.main()
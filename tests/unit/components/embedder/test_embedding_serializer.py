@@ -0,0 +1,40 @@
+import pickle
+import unittest
+import numpy as np
+from components.embedder.embedding_serializer import EmbeddingSerializer
+
+
+class TestEmbeddingSerializer(unittest.TestCase):
+
+    def test_serialize_deserialize(self):
+        embedding = np.array([0.5, -1.25, 3.0], dtype=np.float32)
+        data = EmbeddingSerializer.serialize(embedding)
+
+        self.assertEqual(len(data), EmbeddingSerializer.HEADER.size + 3 * 4)
+        np.testing.assert_array_equal(EmbeddingSerializer.deserialize(data), embedding)
+
+    def test_deserialize_many_builds_matrix(self):
+        embeddings = np.random.rand(4, 8).astype(np.float32)
+        blobs = [EmbeddingSerializer.serialize(row) for row in embeddings]
+
+        matrix = EmbeddingSerializer.deserialize_many(blobs)
+
+        self.assertEqual(matrix.dtype, np.float32)
+        np.testing.assert_array_equal(matrix, embeddings)
+
+    def test_deserialize_many_rejects_mixed_dimensions(self):
+        blobs = [
+            EmbeddingSerializer.serialize(np.zeros(3)),
+            EmbeddingSerializer.serialize(np.zeros(4)),
+        ]
+        with self.assertRaises(ValueError):
+            EmbeddingSerializer.deserialize_many(blobs)
+
+    def test_deserialize_rejects_pickled_data(self):
+        data = pickle.dumps(np.zeros(3, dtype=np.float32))
+        with self.assertRaises(ValueError):
+            EmbeddingSerializer.deserialize(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import MagicMock
+from sqlalchemy.dialects import mysql
+from sqlalchemy.exc import SQLAlchemyError
+from components.embedder.sqlAlchemy_embedder_repository import (
+    SqlAlchemyEmbedderRepository,
+)
+from components.reader.zlib_text_compressor import ZlibTextCompressor
+from logging import Logger as StandardLogger
+
+
+class TestSqlAlchemyEmbedderRepository(unittest.TestCase):
+    def setUp(self):
+        self.mock_connector = MagicMock()
+        self.mock_connector.get_session.return_value = MagicMock()
+        self.mock_logger = MagicMock(spec=StandardLogger)
+        self.embedder_repository = SqlAlchemyEmbedderRepository(
+            connector=self.mock_connector,
+            compressor=MagicMock(spec=ZlibTextCompressor),
+            logger=self.mock_logger,
+        )
+        session = self.mock_connector.get_session.return_value
+        session.query.return_value.join.return_value.join.return_value.filter.return_value.one.return_value = (
+            "all-MiniLM-L6-v2",
+            3,
+            2,
+        )
+
+    def test_save_embeddings_single_upsert_and_commit(self):
+        session = self.mock_connector.get_session.return_value
+        self.embedder_repository.save_embeddings(7, [(1, b"a"), (2, b"b")])
+
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
+        statement = session.execute.call_args[0][0]
+        sql = str(statement.compile(dialect=mysql.dialect()))
+        self.assertIn("ON DUPLICATE KEY UPDATE", sql)
+        self.assertEqual(sql.count("(%s, %s, %s, %s, %s, %s)"), 2)
+
+    def test_save_embeddings_stores_process_metadata_on_each_row(self):
+        session = self.mock_connector.get_session.return_value
+        self.embedder_repository.save_embeddings(7, [(1, b"a")])
+
+        statement = session.execute.call_args[0][0]
+        params = statement.compile(dialect=mysql.dialect()).params
+        self.assertEqual(params["domain_id_m0"], 2)
+        self.assertEqual(params["extracted_text_id_m0"], 3)
+        self.assertEqual(params["embedder_model_m0"], "all-MiniLM-L6-v2")
+
+    def test_save_embeddings_empty_is_noop(self):
+        session = self.mock_connector.get_session.return_value
+        self.embedder_repository.save_embeddings(7, [])
+        session.execute.assert_not_called()
+        session.commit.assert_not_called()
+
+    def test_save_embeddings_rolls_back_on_error(self):
+        session = self.mock_connector.get_session.return_value
+        session.execute.side_effect = SQLAlchemyError("DB error")
+        with self.assertRaises(SQLAlchemyError):
+            self.embedder_repository.save_embeddings(7, [(1, b"a")])
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import MagicMock
+
+from components.retriever.chunk_text_cache import ChunkTextCache
+
+
+class TestChunkTextCache(unittest.TestCase):
+    def test_missing_chunks_are_loaded_once_in_one_call(self):
+        cache = ChunkTextCache()
+        load = MagicMock(side_effect=lambda ids: {i: f"text {i}" for i in ids})
+
+        cache.get_many([1, 2, 1], load)
+        texts = cache.get_many([2, 3], load)
+
+        self.assertEqual(texts, {2: "text 2", 3: "text 3"})
+        self.assertEqual([c.args[0] for c in load.call_args_list], [[1, 2], [3]])
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_least_recently_used_chunk_is_evicted(self):
+        cache = ChunkTextCache(max_entries=2)
+        load = MagicMock(side_effect=lambda ids: {i: str(i) for i in ids})
+
+        cache.get_many([1, 2], load)
+        cache.get_many([1], load)
+        cache.get_many([3], load)
+        cache.get_many([1, 2], load)
+
+        self.assertEqual(load.call_args_list[-1].args[0], [2])
+
+    def test_cleared_chunks_are_loaded_again(self):
+        cache = ChunkTextCache()
+        load = MagicMock(side_effect=lambda ids: {i: str(i) for i in ids})
+        cache.get_many([1, 2], load)
+
+        cache.clear()
+        cache.get_many([1, 2], load)
+
+        self.assertEqual(load.call_args.args[0], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
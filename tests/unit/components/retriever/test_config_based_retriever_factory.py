@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from components.retriever.config_based_retriever_factory import (
+    ConfigBasedRetrieverFactory,
+)
+
+
+class TestConfigBasedRetrieverFactory(unittest.TestCase):
+    def setUp(self):
+        self.index_store = MagicMock()
+        self.factory = ConfigBasedRetrieverFactory(
+            connector=MagicMock(), cache=MagicMock(), index_store=self.index_store
+        )
+
+    def test_faiss_retriever_uses_the_injected_index_store(self):
+        retriever_class = MagicMock()
+        with patch(
+            "components.retriever.config_based_retriever_factory.RetrieverConfig.get_retriever_class",
+            return_value=retriever_class,
+        ):
+            self.factory.create_retriever("FAISS", top_n=3)
+
+        self.assertIs(retriever_class.call_args.kwargs["index_store"], self.index_store)
+
+    def test_other_retrievers_do_not_get_an_index_store(self):
+        retriever_class = MagicMock()
+        with patch(
+            "components.retriever.config_based_retriever_factory.RetrieverConfig.get_retriever_class",
+            return_value=retriever_class,
+        ):
+            self.factory.create_retriever("simple_nearest_neighbor", top_n=3)
+
+        self.assertNotIn("index_store", retriever_class.call_args.kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
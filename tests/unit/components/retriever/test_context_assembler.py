@@ -0,0 +1,61 @@
+import unittest
+
+from components.chunker.fixed_length_overlap_chunker import FixedLengthOverLapChunker
+from components.retriever.context_assembler import ContextAssembler
+
+
+class TestContextAssembler(unittest.TestCase):
+    def setUp(self):
+        self.assembler = ContextAssembler()
+        self.text = " ".join(f"sentence number {i} of the source." for i in range(60))
+        self.chunks = FixedLengthOverLapChunker(chunk_size=200, overlap_size=50).chunk(
+            self.text
+        )
+
+    def test_adjacent_overlapping_chunks_merge_into_the_source_text(self):
+        passages = self.assembler.assemble(
+            [(1, index, chunk, 0.5) for index, chunk in enumerate(self.chunks)]
+        )
+
+        self.assertEqual(passages, [(self.text, 0.5)])
+
+    def test_non_adjacent_chunks_stay_separate_and_ordered_by_score(self):
+        passages = self.assembler.assemble(
+            [
+                (1, 0, self.chunks[0], 0.4),
+                (1, 1, self.chunks[1], 0.7),
+                (1, 5, self.chunks[5], 0.9),
+                (2, 2, "other process", 0.1),
+            ]
+        )
+
+        self.assertEqual(
+            passages,
+            [
+                (self.chunks[5], 0.9),
+                (self.text[:350], 0.7),
+                ("other process", 0.1),
+            ],
+        )
+
+    def test_chunks_without_overlap_are_joined_with_separator(self):
+        self.assertEqual(
+            self.assembler.merge("first passage.", "Second passage."),
+            "first passage. Second passage.",
+        )
+
+    def test_duplicate_hits_keep_their_best_score(self):
+        passages = self.assembler.assemble(
+            [(1, 3, self.chunks[3], 0.2), (1, 3, self.chunks[3], 0.6)]
+        )
+
+        self.assertEqual(passages, [(self.chunks[3], 0.6)])
+
+    def test_overlap_length(self):
+        self.assertEqual(ContextAssembler.overlap_length("abcdef", "defgh"), 3)
+        self.assertEqual(ContextAssembler.overlap_length("abc", "xyz"), 0)
+        self.assertEqual(ContextAssembler.overlap_length("", "xyz"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import numpy as np
+from components.retriever.cosine_similarity_index import CosineSimilarityIndex
+
+
+class TestCosineSimilarityIndex(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((500, 32), dtype=np.float32)
+        self.vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        self.embedding_ids = np.arange(100, 600, dtype=np.int64)
+        self.index = CosineSimilarityIndex(self.embedding_ids, self.vectors)
+
+    def test_search_matches_brute_force_for_a_batch_of_queries(self):
+        queries = np.stack([self.vectors[3] * 2.0, self.vectors[10] + 0.1])
+        normalized = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+        expected = normalized @ self.vectors.T
+
+        ids, scores = self.index.search(queries, 5)
+
+        self.assertEqual(ids.shape, (2, 5))
+        for row in range(2):
+            top = np.argsort(-expected[row])[:5]
+            np.testing.assert_array_equal(ids[row], self.embedding_ids[top])
+            np.testing.assert_allclose(scores[row], expected[row][top], rtol=1e-5)
+
+    def test_float16_matrix_halves_memory_and_keeps_the_ranking(self):
+        index = CosineSimilarityIndex(
+            self.embedding_ids, self.vectors, dtype=np.float16
+        )
+        index.SEARCH_BLOCK_ROWS = 64
+
+        ids, scores = index.search(self.vectors[3], 5)
+        expected_ids, expected_scores = self.index.search(self.vectors[3], 5)
+
+        self.assertEqual(index.matrix.nbytes * 2, self.index.matrix.nbytes)
+        np.testing.assert_array_equal(ids, expected_ids)
+        np.testing.assert_allclose(scores, expected_scores, atol=1e-3)
+
+    def test_top_n_larger_than_matrix_returns_all_rows(self):
+        index = CosineSimilarityIndex(self.embedding_ids[:3], self.vectors[:3])
+
+        ids, scores = index.search(self.vectors[0], 10)
+
+        self.assertEqual(ids.shape, (1, 3))
+        self.assertEqual(ids[0][0], 100)
+        self.assertAlmostEqual(float(scores[0][0]), 1.0, places=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+import faiss
+import numpy as np
+from components.retriever.faiss_index_store import FAISSIndexStore
+
+
+class TestFAISSIndexStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_store = FAISSIndexStore(self.temp_dir.name)
+        self.vectors = np.random.rand(10, 8).astype(np.float32)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _build(self):
+        index = faiss.IndexIDMap(faiss.IndexFlatL2(8))
+        index.add_with_ids(self.vectors, np.arange(100, 110, dtype=np.int64))
+        return index
+
+    def test_index_is_built_once_and_loaded_from_disk(self):
+        build = MagicMock(side_effect=self._build)
+
+        self.index_store.load_or_build(1, (10, 109), build)
+        loaded = self.index_store.load_or_build(1, (10, 109), build)
+
+        build.assert_called_once()
+        self.assertEqual(loaded.ntotal, 10)
+        _, ids = loaded.search(self.vectors[3:4], 1)
+        self.assertEqual(ids[0][0], 103)
+
+    def test_changed_fingerprint_rebuilds_and_replaces_file(self):
+        build = MagicMock(side_effect=self._build)
+
+        self.index_store.load_or_build(1, (10, 109), build)
+        self.index_store.load_or_build(1, (11, 110), build)
+
+        self.assertEqual(build.call_count, 2)
+        files = [path.name for path in self.index_store.index_dir.iterdir()]
+        self.assertEqual(files, ["embedding_process_1_Flat_11_110.index"])
+
+    def test_variants_of_a_process_are_stored_side_by_side(self):
+        build = MagicMock(side_effect=self._build)
+
+        self.index_store.load_or_build(1, (10, 109), build)
+        self.index_store.load_or_build(1, (10, 109), build, "IVF4,Flat")
+        self.index_store.load_or_build(1, (10, 109), build)
+
+        self.assertEqual(build.call_count, 2)
+        files = sorted(path.name for path in self.index_store.index_dir.iterdir())
+        self.assertEqual(
+            files,
+            [
+                "embedding_process_1_Flat_10_109.index",
+                "embedding_process_1_IVF4-Flat_10_109.index",
+            ],
+        )
+
+    def test_invalidate_removes_only_that_process(self):
+        self.index_store.load_or_build(1, (10, 109), self._build)
+        self.index_store.load_or_build(2, (10, 109), self._build)
+
+        self.index_store.invalidate(1)
+
+        files = [path.name for path in self.index_store.index_dir.iterdir()]
+        self.assertEqual(files, ["embedding_process_2_Flat_10_109.index"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+import numpy as np
+from components.retriever.faiss_index_store import FAISSIndexStore
+from components.retriever.faiss_retriever import FAISSRetriever
+
+
+class TestFAISSRetriever(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_store = FAISSIndexStore(self.temp_dir.name)
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((12000, 16), dtype=np.float32)
+        self.vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        self.embedding_ids = np.arange(1000, 13000, dtype=np.int64)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _retriever(self, **kwargs):
+        return FAISSRetriever(
+            session=MagicMock(),
+            domain_id=1,
+            embedding_dim=16,
+            top_n=3,
+            index_store=self.index_store,
+            **kwargs,
+        )
+
+    def _retrieve(self, retriever, query_vector):
+        with patch(
+            "components.retriever.faiss_retriever.list_embedding_processes",
+            return_value=[(7, len(self.vectors), int(self.embedding_ids[-1]))],
+        ), patch(
+            "components.retriever.faiss_retriever.load_process_embeddings",
+            return_value=(self.embedding_ids, self.vectors),
+        ):
+            return retriever.retrieve(query_vector)
+
+    def test_small_domains_fall_back_to_flat(self):
+        retriever = self._retriever(index_type="hnsw")
+
+        self.assertEqual(retriever._index_description(500), "Flat")
+        self.assertEqual(retriever._index_description(20000), "HNSW32")
+
+    def test_nlist_is_capped_by_available_training_points(self):
+        retriever = self._retriever(index_type="ivf_pq", nlist=4096, pq_m=8)
+
+        self.assertEqual(retriever._index_description(39000), "IVF1000,PQ8")
+
+    def test_compressed_storage_keeps_vectors_scalar_quantized(self):
+        retriever = self._retriever(index_type="ivf_flat", nlist=64)
+
+        self.assertEqual(retriever._index_description(500, "float16"), "SQfp16")
+        self.assertEqual(retriever._index_description(20000, "int8"), "IVF64,SQ8")
+        self.assertEqual(
+            self._retriever(index_type="hnsw")._index_description(20000, "int8"),
+            "HNSW32_SQ8",
+        )
+
+    def test_scalar_quantized_index_finds_the_nearest_neighbor_in_less_memory(self):
+        retriever = self._retriever()
+        with patch(
+            "components.retriever.faiss_retriever.load_process_embeddings",
+            return_value=(self.embedding_ids, self.vectors),
+        ):
+            flat = retriever._build_index(7, "Flat")
+            quantized = retriever._build_index(7, "SQfp16")
+
+        distances, ids = quantized.search(self.vectors[42:43], 1)
+
+        self.assertEqual(ids[0][0], 1042)
+        self.assertAlmostEqual(float(distances[0][0]), 1.0, places=3)
+        self.assertLess(
+            retriever._index_nbytes(quantized), retriever._index_nbytes(flat)
+        )
+
+    def test_approximate_indexes_find_the_exact_nearest_neighbor(self):
+        for kwargs in (
+            {"index_type": "ivf_flat", "nlist": 64, "nprobe": 64},
+            {"index_type": "hnsw", "hnsw_m": 16, "ef_search": 128},
+        ):
+            with self.subTest(**kwargs):
+                results = self._retrieve(self._retriever(**kwargs), self.vectors[42])
+
+                self.assertEqual(results[0][0], 1042)
+                self.assertAlmostEqual(results[0][1], 1.0, places=5)
+
+    def test_cosine_metric_returns_cosine_similarity_of_unnormalized_query(self):
+        query_vector = self.vectors[7] * 3.0 + self.vectors[8]
+        expected = self.vectors @ (query_vector / np.linalg.norm(query_vector))
+
+        results = self._retrieve(self._retriever(metric="cosine"), query_vector)
+
+        top_indices = np.argsort(expected)[::-1][:3]
+        self.assertEqual([result[0] for result in results], list(top_indices + 1000))
+        np.testing.assert_allclose(
+            [result[1] for result in results], expected[top_indices], rtol=1e-5
+        )
+
+    def test_l2_metric_maps_distances_through_lambda(self):
+        results = self._retrieve(
+            self._retriever(metric="l2", lambda_param=0.5), self.vectors[42]
+        )
+
+        self.assertEqual(results[0][0], 1042)
+        self.assertAlmostEqual(results[0][1], 1.0, places=5)
+        self.assertLess(results[1][1], results[0][1])
+
+    def test_l2_metric_normalizes_legacy_rows_like_the_query(self):
+        legacy_vectors = self.vectors * 5.0
+        retriever = self._retriever(metric="l2", lambda_param=0.5)
+
+        with patch(
+            "components.retriever.faiss_retriever.list_embedding_processes",
+            return_value=[(7, len(self.vectors), int(self.embedding_ids[-1]))],
+        ), patch(
+            "components.retriever.faiss_retriever.load_process_embeddings",
+            side_effect=lambda session, process_id, normalize: (
+                self.embedding_ids,
+                self.vectors if normalize else legacy_vectors,
+            ),
+        ):
+            results = retriever.retrieve(self.vectors[42] * 2.0)
+
+        self.assertEqual(results[0][0], 1042)
+        self.assertAlmostEqual(results[0][1], 1.0, places=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
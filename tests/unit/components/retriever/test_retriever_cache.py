@@ -0,0 +1,75 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+from components.retriever.retriever_cache import RetrieverCache
+
+
+class TestRetrieverCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = RetrieverCache(max_bytes=100)
+
+    def test_hit_and_miss_counters(self):
+        load = MagicMock(return_value="matrix")
+
+        self.cache.get_or_load("a", load, lambda value: 10)
+        value = self.cache.get_or_load("a", load, lambda value: 10)
+
+        self.assertEqual(value, "matrix")
+        load.assert_called_once()
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["bytes"], 10)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.get_or_load("a", lambda: "a", lambda value: 40)
+        self.cache.get_or_load("b", lambda: "b", lambda value: 40)
+        self.cache.get_or_load("a", lambda: "a", lambda value: 40)
+        self.cache.get_or_load("c", lambda: "c", lambda value: 40)
+
+        load_b = MagicMock(return_value="b")
+        self.cache.get_or_load("b", load_b, lambda value: 40)
+
+        load_b.assert_called_once()
+        self.assertEqual(self.cache.stats()["evictions"], 2)
+        self.assertLessEqual(self.cache.stats()["bytes"], 100)
+
+    def test_value_larger_than_budget_is_not_cached(self):
+        self.cache.get_or_load("big", lambda: "big", lambda value: 200)
+        stats = self.cache.stats()
+        self.assertEqual((stats["entries"], stats["bytes"]), (0, 0))
+
+    def test_failed_load_releases_its_key_lock(self):
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_load(
+                "a", MagicMock(side_effect=RuntimeError("boom")), lambda value: 10
+            )
+
+        self.assertEqual(self.cache._key_locks, {})
+        self.assertEqual(
+            self.cache.get_or_load("a", lambda: "a", lambda value: 10), "a"
+        )
+
+    def test_concurrent_loads_of_same_key_are_coalesced(self):
+        def slow_load():
+            time.sleep(0.05)
+            return "matrix"
+
+        load = MagicMock(side_effect=slow_load)
+        threads = [
+            threading.Thread(
+                target=self.cache.get_or_load, args=("a", load, lambda value: 10)
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        load.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+import unittest
+from components.retriever.interfaces.retriever import Retriever
+from components.retriever.retriever_config import RetrieverConfig
+
+
+class TestRetrieverConfig(unittest.TestCase):
+
+    def test_registered_retrievers_resolve_to_retriever_classes(self):
+        for method in RetrieverConfig.retriever_classes:
+            with self.subTest(method=method):
+                retriever_class = RetrieverConfig.get_retriever_class(method)
+                self.assertTrue(issubclass(retriever_class, Retriever))
+
+    def test_unknown_method_resolves_to_none(self):
+        self.assertIsNone(RetrieverConfig.get_retriever_class("unknown"))
+
+    def test_options_are_built_without_importing_implementations(self):
+        script = (
+            "import sys\n"
+            "from components.retriever.retriever_config import RetrieverConfig\n"
+            "RetrieverConfig().retriever_options\n"
+            "print(','.join(m for m in ('faiss', 'sklearn') if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from components.retriever.simple_nearest_neighbor_retriever import (
+    SimpleNearestNeighborRetriever,
+)
+
+
+class TestSimpleNearestNeighborRetriever(unittest.TestCase):
+    def test_empty_batch_returns_no_results(self):
+        retriever = SimpleNearestNeighborRetriever(session=MagicMock(), domain_id=1)
+
+        with patch(
+            "components.retriever.simple_nearest_neighbor_retriever.list_embedding_processes"
+        ) as list_embedding_processes:
+            self.assertEqual(retriever.retrieve_batch([]), [])
+
+        list_embedding_processes.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
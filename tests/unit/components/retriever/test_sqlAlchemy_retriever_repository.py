@@ -0,0 +1,103 @@
+import unittest
+from unittest.mock import MagicMock
+
+from components.retriever.chunk_text_cache import ChunkTextCache
+from components.retriever.sqlAlchemy_retriever_repository import (
+    SqlAlchemyRetrieverRepository,
+)
+
+
+class TestSqlAlchemyRetrieverRepository(unittest.TestCase):
+    def setUp(self):
+        self.connector = MagicMock()
+        self.session = self.connector.get_session.return_value
+        self.compressor = MagicMock()
+        self.compressor.decompress.side_effect = lambda blob: blob.decode()
+        self.repository = SqlAlchemyRetrieverRepository(
+            connector=self.connector,
+            compressor=self.compressor,
+            logger=MagicMock(),
+            chunk_text_cache=ChunkTextCache(),
+        )
+        query = self.session.query.return_value
+        self.hit_query = query.join.return_value.join.return_value.filter.return_value
+        self.blob_query = query.filter.return_value
+
+    def test_chunk_windows_are_fetched_in_one_query_and_decompressed_once(self):
+        query = self.session.query.return_value.join.return_value.join.return_value
+        query.filter.return_value.all.return_value = [
+            (7, 11, 10, 1, 4),
+            (7, 11, 11, 1, 5),
+            (7, 11, 12, 1, 6),
+            (8, 12, 11, 1, 5),
+            (8, 12, 12, 1, 6),
+            (8, 12, 13, 1, 7),
+        ]
+        self.blob_query.all.return_value = [
+            (10, b"before"),
+            (11, b"hit"),
+            (12, b"after"),
+            (13, b"later"),
+        ]
+
+        windows = self.repository.get_chunk_windows_by_embedding_ids(
+            [7, 8], neighbors=1
+        )
+
+        self.assertEqual(self.session.query.call_count, 2)
+        self.assertEqual(self.compressor.decompress.call_count, 4)
+        self.assertCountEqual(
+            windows,
+            [
+                (None, 1, 4, "before"),
+                (7, 1, 5, "hit"),
+                (None, 1, 6, "after"),
+                (None, 1, 5, "hit"),
+                (8, 1, 6, "after"),
+                (None, 1, 7, "later"),
+            ],
+        )
+
+    def test_hydrated_hits_keep_score_order(self):
+        self.hit_query.all.return_value = [
+            (7, 11, 0, "a", ".txt"),
+            (8, 12, 1, "b", ".pdf"),
+        ]
+        self.blob_query.all.return_value = [(11, b"first"), (12, b"second")]
+
+        hydrated = self.repository.hydrate_hits([(8, 0.9), (9, 0.8), (7, 0.5)])
+
+        self.assertEqual(
+            hydrated,
+            [
+                (8, 0.9, 12, 1, "second", "b", ".pdf"),
+                (7, 0.5, 11, 0, "first", "a", ".txt"),
+            ],
+        )
+
+    def test_chunks_deleted_between_queries_are_skipped(self):
+        self.hit_query.all.return_value = [
+            (7, 11, 0, "a", ".txt"),
+            (8, 12, 1, "b", ".pdf"),
+        ]
+        self.blob_query.all.return_value = [(11, b"first")]
+
+        hydrated = self.repository.hydrate_hits([(8, 0.9), (7, 0.5)])
+
+        self.assertEqual(hydrated, [(7, 0.5, 11, 0, "first", "a", ".txt")])
+
+    def test_repeated_hits_are_served_from_the_chunk_text_cache(self):
+        self.hit_query.all.return_value = [(7, 11, 0, "a", ".txt")]
+        self.blob_query.all.return_value = [(11, b"first")]
+
+        self.repository.hydrate_hits([(7, 0.5)])
+        hydrated = self.repository.hydrate_hits([(7, 0.6)])
+
+        self.assertEqual(hydrated, [(7, 0.6, 11, 0, "first", "a", ".txt")])
+        self.assertEqual(self.session.query.call_count, 3)
+        self.blob_query.all.assert_called_once()
+        self.compressor.decompress.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()